@@ -1,7 +1,7 @@
 # flake8: noqa
 
 from cement.core.exc import CaughtSignal, FrameworkError, InterfaceError
-from cement.core.foundation import App, TestApp
+from cement.core.foundation import App, AsyncApp, TestApp
 from cement.core.handler import Handler
 from cement.core.interface import Interface
 from cement.ext.ext_argparse import ArgparseController as Controller, expose as ex
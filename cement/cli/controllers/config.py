@@ -0,0 +1,81 @@
+"""
+Cement developer config controller.
+"""
+
+import os
+
+from cement import Controller, ex
+from cement.core.exc import FrameworkError
+from cement.ext.ext_configparser import ConfigParserConfigHandler
+from cement.ext.ext_marshal import dumps
+from cement.utils import fs
+
+
+def _get_config_handler(path):
+    # the handler to parse a source config file with, by file extension
+    ext = os.path.splitext(path)[1].lower()
+    if ext in [".yml", ".yaml"]:
+        from cement.ext.ext_yaml import YamlConfigHandler
+
+        return YamlConfigHandler
+    elif ext == ".json":
+        from cement.ext.ext_json import JsonConfigHandler
+
+        return JsonConfigHandler
+    else:
+        return ConfigParserConfigHandler
+
+
+class Config(Controller):
+    class Meta:
+        label = "config"
+        stacked_on = "base"
+        stacked_type = "nested"
+        help = "configuration file tools"
+
+    def _compile(self, path, output):
+        handler = _get_config_handler(path)()
+        handler._setup(self.app)
+        if not handler.parse_file(path):
+            raise FrameworkError("Config file '%s' does not exist" % path)
+
+        # settings of an INI default section apply to every section
+        defaults, sections = handler._get_snapshot()
+        dict_obj = {}
+        for section, values in sections.items():
+            dict_obj[section] = dict(defaults)
+            dict_obj[section].update(values)
+
+        data = dumps(dict_obj)
+        tmp_output = "%s.tmp" % output
+        with open(tmp_output, "wb") as f:
+            f.write(data)
+        os.replace(tmp_output, output)
+
+    @ex(
+        help="compile INI, Yaml or JSON config files for the marshal extension",
+        arguments=[
+            (["sources"], {"help": "config file paths", "nargs": "+"}),
+            (
+                ["-o", "--output"],
+                {
+                    "help": "compiled file path (for a single source file), "
+                    "defaults to the source file path with a .cfgb suffix",
+                    "dest": "output",
+                },
+            ),
+        ],
+    )
+    def compile(self):
+        sources = [fs.abspath(x) for x in self.app.pargs.sources]
+        if self.app.pargs.output is not None and len(sources) > 1:
+            raise FrameworkError("--output requires a single source file")
+
+        for path in sources:
+            output = self.app.pargs.output
+            if output is None:
+                output = "%s.cfgb" % os.path.splitext(path)[0]
+            output = fs.abspath(output)
+
+            self._compile(path, output)
+            print("compiled %s -> %s" % (path, output))
@@ -5,6 +5,7 @@ import sys
 
 from cement import App, CaughtSignal
 from cement.cli.controllers.base import Base
+from cement.cli.controllers.config import Config
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "contrib"))
 
@@ -22,7 +23,7 @@ class CementApp(App):
 
         extensions = ["generate", "yaml", "jinja2"]
 
-        handlers = [Base]
+        handlers = [Base, Config]
 
 
 class CementTestApp(CementApp):
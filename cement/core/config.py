@@ -5,15 +5,121 @@ Cement core config module.
 import os
 
 from abc import abstractmethod
+from contextlib import contextmanager
 
+from cement.core.exc import FrameworkError
 from cement.core.handler import Handler
 from cement.core.interface import Interface
 from cement.utils.fs import abspath
-from cement.utils.misc import minimal_logger
+from cement.utils.misc import is_true, minimal_logger
 
 LOG = minimal_logger(__name__)
 
 
+def _to_list(value):
+    # comma separated strings (i.e. from config files) are split
+    if value is None:
+        return []
+    elif isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    else:
+        return list(value)
+
+
+class ConfigProfile:
+
+    """
+    Records how the configuration was built, when profiling is enabled (see
+    ``App.Meta.config_profile``), and is available as ``app.config.profile``.
+
+    """
+
+    def __init__(self):
+        #: A list of dictionaries, one per parsed config file (in order of
+        #: precedence), with the ``path``, parse ``duration`` (seconds),
+        #: ``size`` (bytes), the ``keys`` it set or changed and which of those
+        #: ``overrides`` existing settings (as ``(section, key)`` tuples).
+        self.files = []
+
+        #: A dictionary of the environment variables that overrode a config
+        #: setting when it was read, and the ``(section, key)`` overridden.
+        self.env_overrides = {}
+
+    def add_file(self, path, duration, size, keys=None, overrides=None):
+        """
+        Record a parsed config file.
+
+        Args:
+            path (str): The file system path to the configuration file.
+            duration (float): The parse duration, in seconds.
+            size (int): The size of the file, in bytes.
+
+        Keyword Args:
+            keys (list): The ``(section, key)`` settings set or changed by
+                the file.
+            overrides (list): The ``(section, key)`` existing settings
+                changed by the file.
+
+        """
+        self.files.append(
+            dict(
+                path=path,
+                duration=duration,
+                size=size,
+                keys=keys or [],
+                overrides=overrides or [],
+            )
+        )
+
+    def add_env_override(self, env_var, section, key):
+        """
+        Record an environment variable that overrode a config setting.
+
+        Args:
+            env_var (str): The name of the environment variable.
+            section (str): The config section.
+            key (str): The config key.
+
+        """
+        self.env_overrides[env_var] = (section, key)
+
+    def report(self):
+        """
+        Return a human readable report of the profile.
+
+        Returns:
+            str: The report.
+
+        """
+        lines = ["Config Profile:", ""]
+        total = 0
+        for res in self.files:
+            total += res["duration"]
+            lines.append(
+                "  %8.2fms %10s bytes %6s keys %6s overrides  %s"
+                % (
+                    res["duration"] * 1000,
+                    res["size"],
+                    len(res["keys"]),
+                    len(res["overrides"]),
+                    res["path"],
+                )
+            )
+            for section, key in res["overrides"]:
+                lines.append("      overrides %s.%s" % (section, key))
+
+        lines.append("  %8.2fms total for %s files" % (total * 1000, len(self.files)))
+
+        if self.env_overrides:
+            lines.append("")
+            lines.append("Environment Overrides:")
+            lines.append("")
+            for env_var, (section, key) in sorted(self.env_overrides.items()):
+                lines.append("  %s overrides %s.%s" % (env_var, section, key))
+
+        return "\n".join(lines)
+
+
 class ConfigInterface(Interface):
 
     """
@@ -185,8 +291,157 @@ class ConfigHandler(ConfigInterface, Handler):
     """
     Config handler implementation.
 
+    The typed accessors (``get_int()``, ``get_float()``, ``get_bool()`` and
+    ``get_list()``) convert a setting once, and cache the result until the
+    configuration is modified.  Handlers that modify their configuration by
+    other means than ``set()``, ``merge()`` and ``_parse_file()`` must call
+    ``_clear_converted()``.
     """
 
+    class Meta:
+
+        """Handler meta-data."""
+
+        #: The maximum size (in bytes) of configuration files.  Parsing a
+        #: larger file raises ``FrameworkError``.  ``None`` is unlimited.
+        max_file_size = None
+
+    def __init__(self, *args, **kw):
+        self._converted = {}
+        super().__init__(*args, **kw)
+
+        #: The ``ConfigProfile`` when profiling is enabled, otherwise
+        #: ``None``.
+        self.profile = None
+
+    def _check_file_size(self, file_path, size=None):
+        max_file_size = self._meta.max_file_size
+        if max_file_size is None:
+            return
+
+        if size is None:
+            size = os.path.getsize(file_path)
+        if size > max_file_size:
+            raise FrameworkError(
+                "Config file '%s' is %s bytes, exceeding the maximum of %s bytes"
+                % (file_path, size, max_file_size)
+            )
+
+    @contextmanager
+    def _open_file(self, file_path):
+        """
+        Open the configuration file at ``file_path`` for reading in binary
+        mode, after checking it against ``max_file_size``.  Handlers should
+        decode directly from the file object (or its bytes) where possible,
+        rather than reading it into a string first.
+
+        Args:
+            file_path (str): The file system path to the configuration file.
+
+        Yields:
+            file: The file object.
+
+        """
+        with open(file_path, "rb") as f:
+            self._check_file_size(file_path, os.fstat(f.fileno()).st_size)
+            yield f
+
+    def _clear_converted(self):
+        self._converted.clear()
+
+    def _get_converted_key(self, section, key, convert):
+        return (section, key, convert)
+
+    def _get_converted(self, section, key, convert, type_name):
+        cache_key = self._get_converted_key(section, key, convert)
+        try:
+            return self._converted[cache_key]
+        except KeyError:
+            pass
+
+        value = self.get(section, key)
+        try:
+            converted = convert(value)
+        except (TypeError, ValueError):
+            raise FrameworkError(
+                "Config setting %s.%s is not a valid %s: %r"
+                % (section, key, type_name, value)
+            )
+
+        self._converted[cache_key] = converted
+        return converted
+
+    def get_int(self, section, key):
+        """
+        Return a configuration setting converted to an ``int``.
+
+        Args:
+            section (str): The section of the configuration to pull key value
+                from.
+            key (str): The configuration key to get the value for.
+
+        Returns:
+            int: The value of the ``key`` in ``section``.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the value is not a valid
+                ``int``.
+
+        """
+        return self._get_converted(section, key, int, "int")
+
+    def get_float(self, section, key):
+        """
+        Return a configuration setting converted to a ``float``.
+
+        Args:
+            section (str): The section of the configuration to pull key value
+                from.
+            key (str): The configuration key to get the value for.
+
+        Returns:
+            float: The value of the ``key`` in ``section``.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the value is not a valid
+                ``float``.
+
+        """
+        return self._get_converted(section, key, float, "float")
+
+    def get_bool(self, section, key):
+        """
+        Return a configuration setting converted to a ``bool`` (see
+        ``cement.utils.misc.is_true()``).
+
+        Args:
+            section (str): The section of the configuration to pull key value
+                from.
+            key (str): The configuration key to get the value for.
+
+        Returns:
+            bool: The value of the ``key`` in ``section``.
+
+        """
+        return self._get_converted(section, key, is_true, "bool")
+
+    def get_list(self, section, key):
+        """
+        Return a configuration setting converted to a ``list``.  String values
+        (i.e. from configuration files) are split on commas, and ``None`` is
+        an empty list.
+
+        Args:
+            section (str): The section of the configuration to pull key value
+                from.
+            key (str): The configuration key to get the value for.
+
+        Returns:
+            list: The value of the ``key`` in ``section``.
+
+        """
+        return list(self._get_converted(section, key, _to_list, "list"))
+
     @abstractmethod
     def _parse_file(self, file_path):
         """
@@ -203,6 +458,54 @@ class ConfigHandler(ConfigInterface, Handler):
         """
         pass  # pragma: nocover
 
+    def _decode_file(self, file_path):
+        """
+        Read and decode the configuration file at ``file_path``, without
+        modifying the config, so that files can be decoded concurrently (see
+        ``App.Meta.config_parse_workers``) and then merged in order.  Handlers
+        that do not support this (the default), or can not decode a
+        particular file this way, return ``None`` and the file is parsed with
+        ``parse_file()`` instead.
+
+        Args:
+            file_path (str): The file system path to the configuration file.
+
+        Returns:
+            dict: The decoded configuration, to be passed to ``merge()``, or
+                ``None``.
+
+        """
+        return None
+
+    def _get_snapshot(self):
+        """
+        Return a picklable snapshot of the entire configuration (as stored,
+        without environment variable overrides applied), that can later be
+        restored with ``_load_snapshot()``.  Handlers that do not support
+        snapshots (the default) return ``None``.
+
+        Returns:
+            The configuration snapshot, or ``None``.
+
+        """
+        return None
+
+    def _load_snapshot(self, snapshot):
+        """
+        Restore a configuration snapshot returned by ``_get_snapshot()``,
+        overwriting existing config settings.  Handlers that do not support
+        snapshots (the default) return ``False``, in which case the
+        application parses its config files instead.
+
+        Args:
+            snapshot: The configuration snapshot.
+
+        Returns:
+            bool: ``True`` if the snapshot was restored, ``False`` otherwise.
+
+        """
+        return False
+
     def parse_file(self, file_path):
         """
         Ensure we are using the absolute/expanded path to ``file_path``, and
@@ -224,8 +527,10 @@ class ConfigHandler(ConfigInterface, Handler):
         file_path = abspath(file_path)
 
         if os.path.exists(file_path):
-            LOG.debug("config file '%s' exists, loading settings..." % file_path)
+            LOG.debug("config file '%s' exists, loading settings...", args=(file_path,))
+            self._check_file_size(file_path)
+            self._clear_converted()
             return self._parse_file(file_path)
         else:
-            LOG.debug("config file '%s' does not exist, skipping..." % file_path)
+            LOG.debug("config file '%s' does not exist, skipping...", args=(file_path,))
             return False
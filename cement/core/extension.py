@@ -119,10 +119,10 @@ class ExtensionHandler(ExtensionInterface, Handler):
             ext_module = "cement.ext.ext_%s" % ext_module
 
         if ext_module in self._loaded_extensions:
-            LOG.debug("framework extension '%s' already loaded" % ext_module)
+            LOG.debug("framework extension '%s' already loaded", args=(ext_module,))
             return
 
-        LOG.debug("loading the '%s' framework extension" % ext_module)
+        LOG.debug("loading the '%s' framework extension", args=(ext_module,))
         try:
             if ext_module not in sys.modules:
                 __import__(ext_module, globals(), locals(), [], 0)
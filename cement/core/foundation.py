@@ -2,13 +2,18 @@
 Cement core foundation module.
 """
 
+import asyncio
+import hashlib
+import inspect
 import logging
 import os
+import pickle
 import signal
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from importlib import reload as reload_module
-from time import sleep
+from time import perf_counter, sleep, time
 
 from cement.core import (
     arg,
@@ -25,12 +30,13 @@ from cement.core import (
     plugin,
     template,
 )
-from cement.core.handler import HandlerManager
+from cement.core.handler import HandlerManager, LazyHandler, unwrap_handler
 from cement.core.hook import HookManager
 from cement.core.interface import InterfaceManager
 from cement.ext.ext_argparse import ArgparseController as Controller
 from cement.utils import fs, misc
 from cement.utils.misc import is_true, minimal_logger
+from cement.utils.version import get_version
 
 join = os.path.join
 
@@ -38,6 +44,9 @@ LOG = minimal_logger(__name__)
 
 SIGNALS = [signal.SIGTERM, signal.SIGINT, signal.SIGHUP]
 
+# the default ``out`` of ``App.render()`` (bound when the module is imported)
+_DEFAULT_OUT = sys.stdout
+
 
 def add_handler_override_options(app):
     """
@@ -53,7 +62,9 @@ def add_handler_override_options(app):
 
     for i in app._meta.handler_override_options:
         if i not in app.interface.list():
-            LOG.debug(f"interface '{i}' is not defined, can not override handlers")
+            LOG.debug(
+                "interface '%s' is not defined, can not override handlers", args=(i,)
+            )
             continue
 
         if len(app.handler.list(i)) > 1:
@@ -65,7 +76,9 @@ def add_handler_override_options(app):
 
             # don't display the option if no handlers are overridable
             if not len(choices) > 0:
-                LOG.debug(f"no handlers are overridable within the {i} interface")
+                LOG.debug(
+                    "no handlers are overridable within the %s interface", args=(i,)
+                )
                 continue
 
             # override things that we need to control
@@ -107,6 +120,19 @@ def handler_override(app):
             getattr(app, f"_setup_{i}_handler")()
 
 
+def print_config_profile(app):
+    """
+    This is a ``pre_close`` hook that prints the config profile report to
+    ``stderr`` if ``App.Meta.config_profile`` is enabled.
+
+    Args:
+        app (instance): The application object.
+
+    """
+    if app.config is not None and app.config.profile is not None:
+        print(app.config.profile.report(), file=sys.stderr)
+
+
 def cement_signal_handler(signum, frame):
     """
     Catch a signal, run the ``signal`` hook, and then raise an exception
@@ -120,7 +146,7 @@ def cement_signal_handler(signum, frame):
         cement.core.exc.CaughtSignal: Raised, passing ``signum``, and ``frame``
 
     """
-    LOG.debug("Caught signal %s" % signum)
+    LOG.debug("Caught signal %s", args=(signum,))
 
     # FIXME: Maybe this isn't ideal... perhaps make
     # App.Meta.signal_handler a decorator that take the app object
@@ -128,8 +154,7 @@ def cement_signal_handler(signum, frame):
     for f_global in frame.f_globals.values():
         if isinstance(f_global, App):
             app = f_global
-            for _result in app.hook.run("signal", app, signum, frame):
-                pass  # pragma: nocover
+            app.hook.fire("signal", app, signum, frame)  # pragma: nocover
 
     raise exc.CaughtSignal(signum, frame)
 
@@ -182,6 +207,30 @@ class App(meta.MetaMixin):
         The quiet argument help text that is displayed in ``--help``.
         """
 
+        config_profile = False
+        """
+        Whether or not to profile the configuration (also set to ``True`` if
+        the ``config_profile`` option is passed at command line).  Records the
+        parse duration, size, and the settings set or overridden by each
+        config file, as well as the environment variables that override
+        settings, in ``app.config.profile`` (see
+        ``cement.core.config.ConfigProfile``), and prints a report to
+        ``stderr`` when the app is closed.  Config files are parsed one by one
+        (ignoring ``config_parse_workers``), and no files are parsed if the
+        ``config_snapshot`` is used.
+        """
+
+        config_profile_argument_options = None
+        """
+        The argument option(s) to toggle config profiling via cli (i.e.
+        ``['--config-profile']``).  Disabled by default.
+        """
+
+        config_profile_argument_help = "profile configuration parsing"
+        """
+        The config profile argument help text that is displayed in ``--help``.
+        """
+
         exit_on_close = False
         """
         Whether or not to call ``sys.exit()`` when ``close()`` is called.
@@ -367,6 +416,46 @@ class App(meta.MetaMixin):
         config_defaults = None
         """Default configuration dictionary.  Must be of type ``dict``."""
 
+        config_snapshot = False
+        """
+        Whether or not to store a snapshot of the parsed configuration (the
+        ``config_defaults`` merged with all config files) on disk, and load
+        it in a single read on subsequent startups rather than parsing every
+        config file again.  The snapshot is keyed by the path, modification
+        time and size of each config file, the ``config_defaults``, the
+        config handler, and the Cement version, and is rebuilt whenever any
+        of them change.  Only supported by config handlers that implement
+        ``_get_snapshot()`` and ``_load_snapshot()`` (i.e. those based on
+        ``ConfigParserConfigHandler``).
+        """
+
+        config_snapshot_dir = None
+        """
+        The directory to store the config snapshot in.  Defaults to
+        ``$XDG_CACHE_HOME/<app_label>/`` (``~/.cache/<app_label>/``).
+        """
+
+        config_dirs_cache = False
+        """
+        Whether or not to cache the config files found in each config
+        directory by the directory's modification time, so that unchanged
+        directories are not listed again when the application is reloaded
+        (i.e. by ``run_forever()``).  Note that config files are still parsed
+        on every reload.
+        """
+
+        config_parse_workers = None
+        """
+        The number of threads used to read and decode config files
+        concurrently (i.e. for ``config_dirs`` holding many files, or on
+        network file systems).  The decoded files are merged in the order of
+        precedence, so the resulting configuration is identical to parsing
+        them one by one (the default).  Only supported by config handlers
+        that implement ``_decode_file()``, files that can not be decoded
+        separately (i.e. INI files with a ``[DEFAULT]`` section) are parsed
+        in order as usual.
+        """
+
         meta_defaults = {}
         """
         Default meta-data dictionary used to pass high level options from the
@@ -454,6 +543,24 @@ class App(meta.MetaMixin):
         A handler class that implements the Platform interface.
         """
 
+        lazy_handlers = []
+        """
+        List of handler interfaces whose handlers are not setup during
+        ``app.setup()``, but rather on first use.  The application member
+        (i.e. ``app.mail``) is a proxy until it is first accessed, at which
+        point the handler is resolved, setup, and replaces the proxy.  This
+        can considerably reduce startup time for short lived applications
+        that do not use every handler on every invocation.
+
+        Supported interfaces are ``mail``, ``cache``, ``output``,
+        ``template``, and ``platform``.
+
+        I.e. ``['mail', 'cache', 'template']``
+
+        Note that a lazy handler's ``config_defaults`` are not merged into
+        the application configuration until the handler is first used.
+        """
+
         extensions = []
         """List of additional framework extensions to load."""
 
@@ -743,6 +850,7 @@ class App(meta.MetaMixin):
                 os.environ["CEMENT_FRAMEWORK_LOGGING"] = "1"
             else:
                 os.environ["CEMENT_FRAMEWORK_LOGGING"] = "0"
+        misc.MinimalLogger.refresh()
 
         self._suppress_loggers()
 
@@ -755,6 +863,7 @@ class App(meta.MetaMixin):
         self._parsed_args = None
         self._last_rendered = None
         self._extended_members = []
+        self._config_dirs_cache = {}
         self.__saved_stdout__ = None
         self.__saved_stderr__ = None
         self.__retry_hooks__ = []
@@ -787,8 +896,16 @@ class App(meta.MetaMixin):
                 self._meta.quiet = True
                 self._suppress_output()
 
+        self._check_config_profile_argument()
         self._lay_cement()
 
+    def _check_config_profile_argument(self):
+        # hack for the command line config profile option, it has to be known
+        # before the config files are parsed
+        options = self._meta.config_profile_argument_options
+        if options is not None and any(x in self.argv for x in options):
+            self._meta.config_profile = True
+
     @property
     def label(self):
         return self._meta.label
@@ -838,7 +955,7 @@ class App(meta.MetaMixin):
         if hasattr(self, member_name):
             raise exc.FrameworkError("App member '%s' already exists!" % member_name)
         LOG.debug(
-            "extending appication with '.{}' ({})".format(member_name, member_object)
+            "extending appication with '.%s' (%s)", args=(member_name, member_object)
         )
         setattr(self, member_name, member_object)
         if member_name not in self._extended_members:
@@ -871,10 +988,10 @@ class App(meta.MetaMixin):
         complete.
 
         """
-        LOG.debug("now setting up the '%s' application" % self._meta.label)
+        LOG.debug("now setting up the '%s' application", args=(self._meta.label,))
 
         if self._meta.bootstrap is not None:
-            LOG.debug("importing bootstrap code from %s" % self._meta.bootstrap)
+            LOG.debug("importing bootstrap code from %s", args=(self._meta.bootstrap,))
 
             if (
                 self._meta.bootstrap not in sys.modules
@@ -888,8 +1005,7 @@ class App(meta.MetaMixin):
             else:
                 reload_module(self._loaded_bootstrap)
 
-        for _result in self.hook.run("pre_setup", self):
-            pass
+        self.hook.fire("pre_setup", self)
 
         self._setup_extension_handler()
         self._setup_signals()
@@ -907,8 +1023,7 @@ class App(meta.MetaMixin):
         for hook_spec in self.__retry_hooks__:
             self.hook.register(*hook_spec)
 
-        for _result in self.hook.run("post_setup", self):
-            pass
+        self.hook.fire("post_setup", self)
 
     def run(self):
         """
@@ -925,8 +1040,7 @@ class App(meta.MetaMixin):
         return_val = None
 
         LOG.debug("running pre_run hook")
-        for _result in self.hook.run("pre_run", self):
-            pass
+        self.hook.fire("pre_run", self)
 
         # If controller exists, then dispatch it
         if self.controller:
@@ -935,8 +1049,7 @@ class App(meta.MetaMixin):
             self._parse_args()  # pragma: nocover
 
         LOG.debug("running post_run hook")
-        for _result in self.hook.run("post_run", self):
-            pass
+        self.hook.fire("post_run", self)
 
         return return_val
 
@@ -976,7 +1089,7 @@ class App(meta.MetaMixin):
         This function is useful for reloading a running applications, for
         example to reload configuration settings, etc.
         """
-        LOG.debug("reloading the %s application" % self._meta.label)
+        LOG.debug("reloading the %s application", args=(self._meta.label,))
         self._unlay_cement()
         self._lay_cement()
         self.setup()
@@ -987,7 +1100,7 @@ class App(meta.MetaMixin):
 
         self._extended_members = []
         self.handler.__handlers__ = {}
-        self.hook.__hooks__ = {}
+        self.hook.reset()
 
     def close(self, code=None):
         """
@@ -1001,15 +1114,16 @@ class App(meta.MetaMixin):
             to.  Note: ``sys.exit()`` will only be called if
             ``App.Meta.exit_on_close==True``.
         """
-        for _result in self.hook.run("pre_close", self):
-            pass
+        self.hook.fire("pre_close", self)
+        self._close(code)
 
-        LOG.debug("closing the %s application" % self._meta.label)
+    def _close(self, code=None):
+        # everything after the pre_close hook
+        LOG.debug("closing the %s application", args=(self._meta.label,))
 
         # in theory, this should happen last-last... but at that point `self`
         # would be kind of busted after _unlay_cement() is run.
-        for _result in self.hook.run("post_close", self):
-            pass
+        self.hook.fire("post_close", self)
 
         self._unlay_cement()
 
@@ -1048,14 +1162,10 @@ class App(meta.MetaMixin):
             else:
                 data = result
 
+        # resolved after pre_render, which may unsuppress output
+        out, oh = self._resolve_render_target(out, handler)
         kw["template"] = template
 
-        if handler is not None:
-            oh = self.handler.resolve("output", handler)
-            oh._setup(self)
-        else:
-            oh = self.output
-
         if oh is None:
             LOG.debug("render() called, but no output handler defined.")
             out_text = ""
@@ -1078,6 +1188,20 @@ class App(meta.MetaMixin):
         self._last_rendered = (data, out_text)
         return out_text
 
+    def _resolve_render_target(self, out, handler):
+        # returns the ``(out, output_handler)`` to render with
+        if out is _DEFAULT_OUT:
+            # write to the current sys.stdout, so that redirecting it works
+            out = sys.stdout
+
+        if handler is not None:
+            oh = self.handler.resolve("output", handler)
+            oh._setup(self)
+        else:
+            oh = unwrap_handler(self.output)
+
+        return out, oh
+
     @property
     def last_rendered(self):
         """
@@ -1110,7 +1234,7 @@ class App(meta.MetaMixin):
             logger = logging.getLogger(name)
 
             if "cement" not in name:
-                LOG.debug(f"setting log level for '{name}' to ERROR")
+                LOG.debug("setting log level for '%s' to ERROR", args=(name,))
                 logger.setLevel(logging.ERROR)
 
     def _suppress_output(self):
@@ -1132,7 +1256,7 @@ class App(meta.MetaMixin):
 
     def _lay_cement(self):
         """Initialize the framework."""
-        LOG.debug("laying cement for the '%s' application" % self._meta.label)
+        LOG.debug("laying cement for the '%s' application", args=(self._meta.label,))
 
         self.interface = InterfaceManager(self)
         self.handler = HandlerManager(self)
@@ -1150,6 +1274,7 @@ class App(meta.MetaMixin):
         self.hook.define("signal")
         self.hook.define("pre_render")
         self.hook.define("post_render")
+        self.hook.define("config_changed")
 
         # define application hooks from meta
         for label in self._meta.define_hooks:
@@ -1158,6 +1283,7 @@ class App(meta.MetaMixin):
         # register some built-in framework hooks
         self.hook.register("post_setup", add_handler_override_options, weight=-99)
         self.hook.register("post_argument_parsing", handler_override, weight=-99)
+        self.hook.register("pre_close", print_config_profile, weight=99)
 
         # register application hooks from meta.  the hooks listed in
         # App.Meta.hooks are registered here, so obviously can not be
@@ -1167,7 +1293,9 @@ class App(meta.MetaMixin):
         self.__retry_hooks__ = []
         for hook_spec in self._meta.hooks:
             if not self.hook.defined(hook_spec[0]):
-                LOG.debug("hook %s not defined, will retry after setup" % hook_spec[0])
+                LOG.debug(
+                    "hook %s not defined, will retry after setup", args=(hook_spec[0],)
+                )
                 self.__retry_hooks__.append(hook_spec)
             else:
                 self.hook.register(*hook_spec)
@@ -1188,13 +1316,11 @@ class App(meta.MetaMixin):
             self.handler.register(handler_class)
 
     def _parse_args(self):
-        for _result in self.hook.run("pre_argument_parsing", self):
-            pass
+        self.hook.fire("pre_argument_parsing", self)
 
         self._parsed_args = self.args.parse(self.argv)
 
-        for _result in self.hook.run("post_argument_parsing", self):
-            pass
+        self.hook.fire("post_argument_parsing", self)
 
     def catch_signal(self, signum):
         """
@@ -1206,8 +1332,8 @@ class App(meta.MetaMixin):
         """
 
         LOG.debug(
-            "adding signal handler %s for signal %s"
-            % (self._meta.signal_handler, signum)
+            "adding signal handler %s for signal %s",
+            args=(self._meta.signal_handler, signum),
         )
         signal.signal(signum, self._meta.signal_handler)
 
@@ -1225,28 +1351,64 @@ class App(meta.MetaMixin):
         )
         return han
 
+    def _resolve_member_handler(self, handler_type, handler_def, raise_error=True):
+        # the handler is attached to the app as ``app.<handler_type>``
+        if handler_type in self._meta.lazy_handlers:
+            LOG.debug(
+                "deferring setup of %s.%s handler until first use",
+                args=(self._meta.label, handler_type),
+            )
+            return LazyHandler(
+                self, handler_type, handler_type, handler_def, raise_error=raise_error
+            )
+
+        return self._resolve_handler(handler_type, handler_def, raise_error=raise_error)
+
     def _setup_extension_handler(self):
-        LOG.debug("setting up %s.extension handler" % self._meta.label)
+        LOG.debug("setting up %s.extension handler", args=(self._meta.label,))
         self.ext = self._resolve_handler("extension", self._meta.extension_handler)
         self.ext.load_extensions(self._meta.core_extensions)
         self.ext.load_extensions(self._meta.extensions)
 
     def _find_config_files(self, path):
-        found_files = []
-        if not os.path.isdir(path):
+        cache = None
+        if self._meta.config_dirs_cache is True:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return []
+
+            cache = self._config_dirs_cache
+            if path in cache and cache[path][0] == mtime:
+                return list(cache[path][1])
+
+        try:
+            with os.scandir(path) as entries:
+                names = [x.name for x in entries]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        files = os.listdir(path)
-        files.sort()
-        for f in files:
+
+        found_files = []
+        for f in sorted(names):
             if f.endswith(self._meta.config_file_suffix):
                 found_files.append(fs.join(path, f))
-        return found_files
+
+        # entries added within the timestamp resolution of the file system
+        # would not change the mtime, so recently modified listings are not
+        # cached
+        if cache is not None and time() - mtime / 1e9 > 2:
+            cache[path] = (mtime, found_files)
+
+        return list(found_files)
 
     def _setup_config_handler(self):
-        LOG.debug("setting up %s.config handler" % self._meta.label)
+        LOG.debug("setting up %s.config handler", args=(self._meta.label,))
         label = self._meta.label
         ext = self._meta.config_file_suffix
         self.config = self._resolve_handler("config", self._meta.config_handler)
+        if self._meta.config_profile is True:
+            self.config.profile = config.ConfigProfile()
+
         if self._meta.config_section is None:
             self._meta.config_section = label
 
@@ -1261,8 +1423,9 @@ class App(meta.MetaMixin):
         if self._meta.config_dirs is None:
             self._meta.config_dirs = []
 
-        config_files = []
-        config_dirs = []
+        # ordered sets (dicts) of paths
+        config_files = {}
+        config_dirs = {}
 
         template_dict = {
             "label": self._meta.label,
@@ -1274,55 +1437,50 @@ class App(meta.MetaMixin):
         # paths take precedence).
 
         for f in self._meta.core_system_config_files:
-            f = f.format(**template_dict)
-            if f not in config_files:
-                config_files.append(f)
+            config_files[f.format(**template_dict)] = None
 
         for d in self._meta.core_system_config_dirs:
             d = d.format(**template_dict)
-            if d not in config_dirs:
-                config_dirs.append(d)
+            config_dirs[d] = None
             for f in self._find_config_files(d):
-                if f not in config_files:
-                    config_files.append(f)
+                config_files[f] = None
 
         for f in self._meta.config_files:
-            f = f.format(**template_dict)
-            if f not in config_files:
-                config_files.append(f)
+            config_files[f.format(**template_dict)] = None
 
         for d in self._meta.config_dirs:
             d = d.format(**template_dict)
-            if d not in config_dirs:
-                config_dirs.append(d)
+            config_dirs[d] = None
             for f in self._find_config_files(d):
-                if f not in config_files:
-                    config_files.append(f)
+                config_files[f] = None
 
         for f in self._meta.core_user_config_files:
-            f = f.format(**template_dict)
-            if f not in config_files:
-                config_files.append(f)
+            config_files[f.format(**template_dict)] = None
 
         for d in self._meta.core_user_config_dirs:
             d = d.format(**template_dict)
-            if d not in config_dirs:
-                config_dirs.append(d)
+            config_dirs[d] = None
             for f in self._find_config_files(d):
-                if f not in config_files:
-                    config_files.append(f)
+                config_files[f] = None
 
-        # reset for final lists
+        # reset for final lists (as add_config_dir() and add_config_file()
+        # would, without a linear search for each path)
 
-        self._meta.config_files = []
-        self._meta.config_dirs = []
+        self._meta.config_dirs = list(dict.fromkeys(map(fs.abspath, config_dirs)))
+        self._meta.config_files = list(dict.fromkeys(map(fs.abspath, config_files)))
+        config_files = list(config_files)
 
-        for d in config_dirs:
-            self.add_config_dir(d)
+        snapshot_key = None
+        if self._meta.config_snapshot is True:
+            snapshot_key = self._get_config_snapshot_key()
+
+        if snapshot_key is not None and self._load_config_snapshot(snapshot_key):
+            LOG.debug("loaded config snapshot, skipping config files")
+        else:
+            self._parse_config_files(config_files)
 
-        for f in config_files:
-            self.add_config_file(f)
-            self.config.parse_file(f)
+            if snapshot_key is not None:
+                self._save_config_snapshot(snapshot_key)
 
         self.validate_config()
 
@@ -1366,16 +1524,144 @@ class App(meta.MetaMixin):
                 # add to meta-data
                 self._meta.extensions.append(ext)
 
+    def _parse_config_files(self, config_files):
+        if self.config.profile is not None:
+            for f in config_files:
+                self._profile_config_file(f)
+            return
+
+        workers = self._meta.config_parse_workers
+        if not workers or workers < 2 or len(config_files) < 2:
+            for f in config_files:
+                self.config.parse_file(f)
+            return
+
+        def decode(file_path):
+            file_path = fs.abspath(file_path)
+            if not os.path.exists(file_path):
+                return file_path, None
+            return file_path, self.config._decode_file(file_path)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            decoded = list(executor.map(decode, config_files))
+
+        for file_path, dict_obj in decoded:
+            if dict_obj is None:
+                self.config.parse_file(file_path)
+            else:
+                LOG.debug("merging decoded config file '%s'", args=(file_path,))
+                self.config.merge(dict_obj)
+
+    def _get_config_values(self):
+        # the config settings as stored (without environment overrides)
+        snapshot = self.config._get_snapshot()
+        values = {}
+        if snapshot is not None:
+            for section, section_dict in snapshot[1].items():
+                for key, value in section_dict.items():
+                    values[(section, key)] = value
+        return values
+
+    def _profile_config_file(self, file_path):
+        file_path = fs.abspath(file_path)
+        before = self._get_config_values()
+        start = perf_counter()
+        if not self.config.parse_file(file_path):
+            return
+        duration = perf_counter() - start
+
+        keys = []
+        overrides = []
+        for section_key, value in self._get_config_values().items():
+            if section_key not in before:
+                keys.append(section_key)
+            elif before[section_key] != value:
+                keys.append(section_key)
+                overrides.append(section_key)
+
+        size = os.path.getsize(file_path)
+        self.config.profile.add_file(file_path, duration, size, keys, overrides)
+
+    def _get_config_snapshot_path(self):
+        path = self._meta.config_snapshot_dir
+        if path is None:
+            cache_dir = os.environ.get("XDG_CACHE_HOME", fs.join(fs.HOME_DIR, ".cache"))
+            path = fs.join(cache_dir, self._meta.label)
+        return fs.join(fs.abspath(path), "config.snapshot")
+
+    def _get_config_snapshot_key(self):
+        files = []
+        for f in self._meta.config_files:
+            try:
+                stat = os.stat(f)
+                files.append((f, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                files.append((f, None, None))
+
+        handler = self.config.__class__
+        parts = (
+            get_version(),
+            "%s.%s" % (handler.__module__, handler.__qualname__),
+            self._meta.config_section,
+            self._meta.config_defaults,
+            files,
+        )
+
+        try:
+            return hashlib.sha256(pickle.dumps(parts)).hexdigest()
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            LOG.debug("unable to snapshot config: %s", args=(e,))
+            return None
+
+    def _load_config_snapshot(self, key):
+        path = self._get_config_snapshot_path()
+        try:
+            with open(path, "rb") as f:
+                snapshot_key, snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            LOG.debug("unable to load config snapshot %s: %s", args=(path, e))
+            return False
+
+        if snapshot_key != key:
+            LOG.debug("config snapshot %s is out of date", args=(path,))
+            return False
+
+        if not self.config._load_snapshot(snapshot):
+            LOG.debug("config handler does not support loading snapshots")
+            return False
+
+        return True
+
+    def _save_config_snapshot(self, key):
+        snapshot = self.config._get_snapshot()
+        if snapshot is None:
+            LOG.debug("config handler does not support snapshots")
+            return
+
+        path = self._get_config_snapshot_path()
+        tmp_path = "%s.%s" % (path, os.getpid())
+        try:
+            fs.ensure_dir_exists(os.path.dirname(path))
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as e:
+            LOG.debug("unable to save config snapshot %s: %s", args=(path, e))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _setup_mail_handler(self):
-        LOG.debug("setting up %s.mail handler" % self._meta.label)
-        self.mail = self._resolve_handler("mail", self._meta.mail_handler)
+        LOG.debug("setting up %s.mail handler", args=(self._meta.label,))
+        self.mail = self._resolve_member_handler("mail", self._meta.mail_handler)
 
     def _setup_log_handler(self):
-        LOG.debug("setting up %s.log handler" % self._meta.label)
+        LOG.debug("setting up %s.log handler", args=(self._meta.label,))
         self.log = self._resolve_handler("log", self._meta.log_handler)
 
     def _setup_plugin_handler(self):
-        LOG.debug("setting up %s.plugin handler" % self._meta.label)
+        LOG.debug("setting up %s.plugin handler", args=(self._meta.label,))
 
         # plugin dirs
         if self._meta.plugin_dirs is None:
@@ -1429,8 +1715,8 @@ class App(meta.MetaMixin):
             LOG.debug("no output handler defined, skipping.")
             return
 
-        LOG.debug("setting up %s.output handler" % self._meta.label)
-        self.output = self._resolve_handler(
+        LOG.debug("setting up %s.output handler", args=(self._meta.label,))
+        self.output = self._resolve_member_handler(
             "output", self._meta.output_handler, raise_error=False
         )
 
@@ -1440,8 +1726,8 @@ class App(meta.MetaMixin):
             return
 
         label = self._meta.label
-        LOG.debug("setting up %s.template handler" % self._meta.label)
-        self.template = self._resolve_handler(
+        LOG.debug("setting up %s.template handler", args=(self._meta.label,))
+        self.template = self._resolve_member_handler(
             "template", self._meta.template_handler, raise_error=False
         )
         # template module
@@ -1487,21 +1773,23 @@ class App(meta.MetaMixin):
             self.add_template_dir(path)
 
     def _setup_platform_handler(self):
-        LOG.debug("setting up %s.platform handler" % self._meta.label)
-        self.platform = self._resolve_handler("platform", self._meta.platform_handler)
+        LOG.debug("setting up %s.platform handler", args=(self._meta.label,))
+        self.platform = self._resolve_member_handler(
+            "platform", self._meta.platform_handler
+        )
 
     def _setup_cache_handler(self):
         if self._meta.cache_handler is None:
             LOG.debug("no cache handler defined, skipping.")
             return
 
-        LOG.debug("setting up %s.cache handler" % self._meta.label)
-        self.cache = self._resolve_handler(
+        LOG.debug("setting up %s.cache handler", args=(self._meta.label,))
+        self.cache = self._resolve_member_handler(
             "cache", self._meta.cache_handler, raise_error=False
         )
 
     def _setup_arg_handler(self):
-        LOG.debug("setting up %s.arg handler" % self._meta.label)
+        LOG.debug("setting up %s.arg handler", args=(self._meta.label,))
         self.args = self._resolve_handler("argument", self._meta.argument_handler)
         self.args.prog = self._meta.label
 
@@ -1519,6 +1807,13 @@ class App(meta.MetaMixin):
                 action="store_true",
                 help=self._meta.quiet_argument_help,
             )
+        if self._meta.config_profile_argument_options is not None:
+            self.args.add_argument(
+                *self._meta.config_profile_argument_options,
+                dest="config_profile",
+                action="store_true",
+                help=self._meta.config_profile_argument_help,
+            )
 
         # merge handler override meta-data
         if self._meta.handler_override_options is not None:
@@ -1695,6 +1990,127 @@ class App(meta.MetaMixin):
             self.close()
 
 
+class AsyncApp(App):
+
+    """
+    App subclass that runs the application inside an ``asyncio`` event loop
+    owned by the app (``app.loop``), which is created at setup and closed
+    when the app is closed.  Exposed controller commands may be coroutine
+    functions (``async def``), and are awaited in that loop, as are
+    coroutine functions registered to the ``pre_run``, ``post_run`` and
+    ``pre_close`` hooks (see ``HookManager.run_async()``).  Hooks, handlers
+    and commands can therefore share loop bound resources such as HTTP or
+    database connection pools.
+
+    Example:
+
+        .. code-block:: python
+
+            from cement import AsyncApp, Controller, ex
+
+            class Base(Controller):
+                class Meta:
+                    label = 'base'
+
+                @ex(help='fetch all the things')
+                async def fetch(self):
+                    await asyncio.gather(*[get(url) for url in URLS])
+
+            class MyApp(AsyncApp):
+                class Meta:
+                    label = 'myapp'
+                    handlers = [Base]
+
+            with MyApp() as app:
+                app.run()
+
+    """
+
+    class Meta:
+
+        """
+        Application meta-data (see ``App.Meta``).  Defined so that
+        ``App.Meta`` is not merged in again when ``AsyncApp`` is combined
+        with other ``App`` subclasses (i.e. ``TestApp``).
+        """
+
+    def __init__(self, label=None, **kw):
+        self.loop = None
+        super().__init__(label, **kw)
+
+    def setup(self):
+        if self.loop is None or self.loop.is_closed():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+        super().setup()
+
+    def run(self):
+        """
+        Run the application inside ``app.loop``, see ``run_async()``.
+
+        Returns:
+            unknown: The result of the executed (and awaited) controller
+            function if a base controller is set and a controller function is
+            called, otherwise ``None``.
+
+        """
+        return self.loop.run_until_complete(self.run_async())
+
+    async def run_async(self):
+        """
+        The coroutine wrapped by ``run()``, for use when the application is
+        run from code that is already executing in ``app.loop``.
+
+        Returns:
+            unknown: The result of the executed (and awaited) controller
+            function if a base controller is set and a controller function is
+            called, otherwise ``None``.
+
+        """
+        return_val = None
+
+        LOG.debug("running pre_run hook")
+        await self.hook.run_async("pre_run", self)
+
+        # If controller exists, then dispatch it
+        if self.controller:
+            return_val = self.controller._dispatch()
+            if inspect.isawaitable(return_val):
+                return_val = await return_val
+        else:
+            self._parse_args()  # pragma: nocover
+
+        LOG.debug("running post_run hook")
+        await self.hook.run_async("post_run", self)
+
+        return return_val
+
+    def close(self, code=None):
+        """
+        Close the application.  This runs (and awaits) the ``pre_close``
+        hook, closes ``app.loop``, and then runs the ``post_close`` hook.
+
+        Args:
+            code: An exit code to exit with (``int``), if ``None`` is
+            passed then exit with whatever ``self.exit_code`` is currently set
+            to.  Note: ``sys.exit()`` will only be called if
+            ``App.Meta.exit_on_close==True``.
+        """
+        if self.loop is None or self.loop.is_closed():
+            # not setup (or setup failed), so there is no loop to close
+            super().close(code)
+            return
+
+        self.loop.run_until_complete(self.hook.run_async("pre_close", self))
+
+        LOG.debug("closing the %s event loop", args=(self._meta.label,))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+        self._close(code)
+
+
 class TestApp(App):
 
     """
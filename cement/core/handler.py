@@ -88,8 +88,8 @@ class Handler(ABC, meta.MetaMixin):
 
         if self._meta.config_defaults is not None:
             LOG.debug(
-                "merging config defaults from '%s' " % self
-                + "into section '%s'" % self._meta.config_section
+                "merging config defaults from '%s' into section '%s'",
+                args=(self, self._meta.config_section),
             )
             dict_obj = {}
             dict_obj[self._meta.config_section] = self._meta.config_defaults
@@ -104,6 +104,91 @@ class Handler(ABC, meta.MetaMixin):
         pass  # pragma: nocover
 
 
+class LazyHandler:
+
+    """
+    Proxy that stands in for an application handler (i.e. ``app.mail``)
+    until it is first used.  On first attribute access the handler is
+    resolved, and setup, via ``App._resolve_handler()`` and the proxy
+    replaces itself on the application object with the real handler, so
+    that only the first access carries any overhead.
+
+    Args:
+        app (instance): The application object.
+        member_name (str): The application member the handler is attached
+            to (i.e. ``mail``).
+        interface (str): The interface of the handler (i.e. ``mail``).
+        handler_def (str,instance,Handler): The loose reference of the
+            handler as accepted by ``HandlerManager.resolve()``.
+
+    Keyword Args:
+        raise_error (bool): Whether or not to raise an exception if unable
+            to resolve the handler.
+
+    """
+
+    def __init__(self, app, member_name, interface, handler_def, raise_error=True):
+        self.__dict__["_lazy_spec"] = (
+            app,
+            member_name,
+            interface,
+            handler_def,
+            raise_error,
+        )
+        self.__dict__["_lazy_handler"] = None
+        self.__dict__["_lazy_resolved"] = False
+
+    def _resolve(self):
+        if self._lazy_resolved is False:
+            app, member_name, interface, handler_def, raise_error = self._lazy_spec
+            LOG.debug(
+                "resolving lazy %s handler '%s' on first access",
+                args=(interface, handler_def),
+            )
+            han = app._resolve_handler(interface, handler_def, raise_error=raise_error)
+            self.__dict__["_lazy_handler"] = han
+            self.__dict__["_lazy_resolved"] = True
+
+            # only replace ourself if nothing else has been set in the mean
+            # time (i.e. by a handler override)
+            if getattr(app, member_name, None) is self:
+                setattr(app, member_name, han)
+
+        return self._lazy_handler
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __bool__(self):
+        return self._resolve() is not None
+
+    def __repr__(self):
+        _, _, interface, handler_def, _ = self._lazy_spec
+        if self._lazy_resolved is True:
+            return repr(self._lazy_handler)
+        return "<LazyHandler {}.{} (unresolved)>".format(interface, handler_def)
+
+
+def unwrap_handler(handler):
+    """
+    Return the real handler behind a :class:`LazyHandler` proxy, resolving
+    it if necessary.  Any other object is returned as-is.
+
+    Args:
+        handler: A handler, lazy handler proxy, or ``None``.
+
+    Returns:
+        The resolved handler object (or ``None``).
+
+    """
+    if isinstance(handler, LazyHandler):
+        return handler._resolve()
+    return handler
+
+
 class HandlerManager:
     """
     Manages the handler system to define, get, resolve, etc handlers with
@@ -246,8 +331,8 @@ class HandlerManager:
 
         interface = obj._meta.interface
         LOG.debug(
-            "registering handler '%s' into handlers['%s']['%s']"
-            % (handler_class, interface, obj._meta.label)
+            "registering handler '%s' into handlers['%s']['%s']",
+            args=(handler_class, interface, obj._meta.label),
         )
 
         if interface not in self.app.interface.list():
@@ -264,10 +349,8 @@ class HandlerManager:
 
             if force is True:
                 LOG.debug(
-                    "handlers['{}']['{}'] already exists".format(
-                        interface, obj._meta.label
-                    )
-                    + ", but `force==True`"
+                    "handlers['%s']['%s'] already exists, but `force==True`",
+                    args=(interface, obj._meta.label),
                 )
             else:
                 raise exc.InterfaceError(
@@ -397,15 +480,13 @@ class HandlerManager:
             if not self.registered(interface, han._meta.label):
                 self.register(handler_def)
 
-        msg = "Unable to resolve handler '{}' of interface '{}'".format(
-            handler_def, interface
-        )
+        msg = "Unable to resolve handler '%s' of interface '%s'"
         if han is not None:
             if setup is True:
                 han._setup(self.app)
             return han
         elif han is None and raise_error:
-            raise exc.FrameworkError(msg)
+            raise exc.FrameworkError(msg % (handler_def, interface))
         elif han is None:
-            LOG.debug(msg)
+            LOG.debug(msg, args=(handler_def, interface))
             return None
@@ -2,9 +2,14 @@
 Cement core hooks module.
 """
 
+import asyncio
+import inspect
 import operator
 import types
 
+from bisect import bisect_right
+from itertools import groupby
+
 from cement.core import exc
 from cement.utils.misc import minimal_logger
 
@@ -22,6 +27,17 @@ class HookManager:
         self.app = app
         self.__hooks__ = {}
 
+        # hook functions per hook name, in order of weight (reset whenever a
+        # hook function is registered)
+        self._compiled = {}
+
+    def reset(self):
+        """
+        Remove all defined hooks, and the hook functions registered in them.
+        """
+        self.__hooks__ = {}
+        self._compiled = {}
+
     def list(self):
         """
         List all defined hooks.
@@ -53,7 +69,7 @@ class HookManager:
                     app.hook.define('my_hook_name')
 
         """
-        LOG.debug("defining hook '%s'" % name)
+        LOG.debug("defining hook '%s'", args=(name,))
         if name in self.__hooks__:
             raise exc.FrameworkError("Hook name '%s' already defined!" % name)
         self.__hooks__[name] = []
@@ -116,16 +132,31 @@ class HookManager:
 
         """
         if name not in self.__hooks__:
-            LOG.debug("hook name '%s' is not defined! ignoring..." % name)
+            LOG.debug("hook name '%s' is not defined! ignoring...", args=(name,))
             return False
 
         LOG.debug(
-            "registering hook '%s' from %s into hooks['%s']"
-            % (func.__name__, func.__module__, name)
+            "registering hook '%s' from %s into hooks['%s']",
+            args=(func.__name__, func.__module__, name),
         )
 
-        # Hooks are as follows: (weight, name, func)
-        self.__hooks__[name].append((int(weight), func.__name__, func))
+        # Hooks are as follows: (weight, name, func), and are kept in order of
+        # weight (hooks of equal weight run in the order they are registered)
+        hooks = self.__hooks__[name]
+        weight = int(weight)
+        pos = bisect_right([hook[0] for hook in hooks], weight)
+        hooks.insert(pos, (weight, func.__name__, func))
+        self._compiled.pop(name, None)
+
+    def _get_funcs(self, name):
+        try:
+            return self._compiled[name]
+        except KeyError:
+            if name not in self.__hooks__:
+                raise exc.FrameworkError("Hook name '%s' is not defined!" % name)
+            funcs = tuple(hook[2] for hook in self.__hooks__[name])
+            self._compiled[name] = funcs
+            return funcs
 
     def run(self, name, *args, **kwargs):
         """
@@ -163,18 +194,14 @@ class HookManager:
                         pass
 
         """
-        if name not in self.__hooks__:
-            raise exc.FrameworkError("Hook name '%s' is not defined!" % name)
-
-        # Will order based on weight (the first item in the tuple)
-        self.__hooks__[name].sort(key=operator.itemgetter(0))
-        for hook in self.__hooks__[name]:
-            LOG.debug(
-                "running hook '{}' ({}) from {}".format(
-                    name, hook[2], hook[2].__module__
+        funcs = self._get_funcs(name)
+        debug = LOG.logging_is_enabled
+        for func in funcs:
+            if debug:
+                LOG.debug(
+                    "running hook '%s' (%s) from %s", args=(name, func, func.__module__)
                 )
-            )
-            res = hook[2](*args, **kwargs)
+            res = func(*args, **kwargs)
 
             # Check if result is a nested generator - needed to support e.g.
             # asyncio
@@ -183,3 +210,123 @@ class HookManager:
                     yield _res
             else:
                 yield res
+
+    def fire(self, name, *args, **kwargs):
+        """
+        Run all defined hooks in the namespace, discarding their results.
+        This is the same as exhausting ``run()`` without the overhead of
+        yielding each result, and is what the framework uses for hooks whose
+        results are ignored.
+
+        Args:
+            name (str): The name of the hook function.
+            args (tuple): Additional arguments to be passed to the hook
+                functions.
+            kwargs (dict): Additional keyword arguments to be passed to the
+                hook functions.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the hook ``name`` is not
+                defined
+
+        Example:
+
+            .. code-block:: python
+
+                from cement import App
+
+                with App('myapp') as app:
+                    app.hook.define('my_hook_name')
+                    app.hook.register('my_hook_name', my_hook_func)
+                    app.hook.fire('my_hook_name', app)
+
+        """
+        funcs = self._get_funcs(name)
+        debug = LOG.logging_is_enabled
+        for func in funcs:
+            if debug:
+                LOG.debug(
+                    "running hook '%s' (%s) from %s", args=(name, func, func.__module__)
+                )
+            res = func(*args, **kwargs)
+
+            # generator hooks only do their work when consumed
+            if isinstance(res, types.GeneratorType):
+                for _res in res:
+                    pass
+
+    async def run_async(self, name, *args, **kwargs):
+        """
+        Run all defined hooks in the namespace, awaiting the result of hook
+        functions that are coroutine functions (or otherwise return an
+        awaitable).  Hooks of different weights are run in order of weight,
+        as with ``run()``, however the awaitables of hooks that share the
+        same weight are awaited concurrently via ``asyncio.gather()``.
+        Regular (non-async) hook functions can be mixed in freely.
+
+        Args:
+            name (str): The name of the hook function.
+            args (tuple): Additional arguments to be passed to the hook
+                functions.
+            kwargs (dict): Additional keyword arguments to be passed to the
+                hook functions.
+
+        Returns:
+            list: The results of each hook function executed, in order of
+            weight (and registration).
+
+        Raises:
+            cement.core.exc.FrameworkError: If the hook ``name`` is not
+                defined
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from cement import App
+
+                async def my_hook_func(app):
+                    await warm_remote_cache()
+
+                with App('myapp') as app:
+                    app.hook.define('my_hook_name')
+                    app.hook.register('my_hook_name', my_hook_func)
+                    loop = asyncio.get_event_loop()
+                    loop.run_until_complete(
+                        app.hook.run_async('my_hook_name', app)
+                    )
+
+        """
+        if name not in self.__hooks__:
+            raise exc.FrameworkError("Hook name '%s' is not defined!" % name)
+
+        debug = LOG.logging_is_enabled
+        results = []
+        weighted = groupby(list(self.__hooks__[name]), key=operator.itemgetter(0))
+        for weight, hooks in weighted:
+            # (position in results, awaitable) of hooks with this weight
+            pending = []
+            for hook in hooks:
+                func = hook[2]
+                if debug:
+                    LOG.debug(
+                        "running hook '%s' (%s) from %s",
+                        args=(name, func, func.__module__),
+                    )
+                res = func(*args, **kwargs)
+
+                if inspect.isawaitable(res):
+                    pending.append((len(results), res))
+                    results.append(None)
+                elif isinstance(res, types.GeneratorType):
+                    results.extend(res)
+                else:
+                    results.append(res)
+
+            if pending:
+                awaited = await asyncio.gather(*[x[1] for x in pending])
+                for (pos, _awaitable), res in zip(pending, awaited):
+                    results[pos] = res
+
+        return results
@@ -119,7 +119,7 @@ class InterfaceManager:
         """
 
         LOG.debug(
-            "defining interface '{}' ({})".format(ibc.Meta.interface, ibc.__name__)
+            "defining interface '%s' (%s)", args=(ibc.Meta.interface, ibc.__name__)
         )
 
         if ibc.Meta.interface in self.__interfaces__:
@@ -180,7 +180,7 @@ class TemplateHandler(TemplateInterface, Handler):
         if not os.path.exists(dest):
             os.makedirs(dest)
 
-        LOG.debug("copying source template {} -> {}".format(src, dest))
+        LOG.debug("copying source template %s -> %s", args=(src, dest))
 
         # here's the fun
         for cur_dir, sub_dirs, files in os.walk(src):
@@ -193,11 +193,11 @@ class TemplateHandler(TemplateInterface, Handler):
                 # where to go as `dest`)
                 cur_dir_dest = dest
             elif self._match_patterns(cur_dir, ignore_patterns):
-                LOG.debug("not copying ignored directory: %s" % cur_dir)
+                LOG.debug("not copying ignored directory: %s", args=(cur_dir,))
                 continue
             elif self._match_patterns(cur_dir, exclude_patterns):
                 LOG.debug(
-                    "not rendering excluded directory as template: " + "%s" % cur_dir
+                    "not rendering excluded directory as template: %s", args=(cur_dir,)
                 )
 
                 cur_dir_stub = re.sub(escaped_src_pattern, "", escaped_cur_dir)
@@ -207,7 +207,7 @@ class TemplateHandler(TemplateInterface, Handler):
                 cur_dir_dest = os.path.join(dest, cur_dir_stub)
             else:
                 # render the cur dir
-                LOG.debug("rendering directory as template: %s" % cur_dir)
+                LOG.debug("rendering directory as template: %s", args=(cur_dir,))
 
                 cur_dir_stub = re.sub(escaped_src_pattern, "", escaped_cur_dir)
                 cur_dir_stub = self.render(cur_dir_stub, data)
@@ -224,16 +224,20 @@ class TemplateHandler(TemplateInterface, Handler):
                 full_path = os.path.join(cur_dir, sub_dir)
 
                 if self._match_patterns(full_path, ignore_patterns):
-                    LOG.debug("not copying ignored sub-directory: " + "%s" % full_path)
+                    LOG.debug(
+                        "not copying ignored sub-directory: %s", args=(full_path,)
+                    )
                     continue
                 elif self._match_patterns(full_path, exclude_patterns):
                     LOG.debug(
-                        "not rendering excluded sub-directory as template: "
-                        + "%s" % full_path
+                        "not rendering excluded sub-directory as template: %s",
+                        args=(full_path,),
                     )
                     sub_dir_dest = os.path.join(cur_dir_dest, sub_dir)
                 else:
-                    LOG.debug("rendering sub-directory as template: %s" % full_path)
+                    LOG.debug(
+                        "rendering sub-directory as template: %s", args=(full_path,)
+                    )
 
                     new_sub_dir = re.sub(
                         escaped_src_pattern, "", self.render(escaped_sub_dir, data)
@@ -241,7 +245,7 @@ class TemplateHandler(TemplateInterface, Handler):
                     sub_dir_dest = os.path.join(cur_dir_dest, new_sub_dir)
 
                 if not os.path.exists(sub_dir_dest):
-                    LOG.debug("creating sub-directory %s" % sub_dir_dest)
+                    LOG.debug("creating sub-directory %s", args=(sub_dir_dest,))
                     os.makedirs(sub_dir_dest)
 
             for _file in files:
@@ -255,22 +259,22 @@ class TemplateHandler(TemplateInterface, Handler):
 
                 if os.path.exists(_file_dest):
                     if force is True:
-                        LOG.debug("overwriting existing file: %s " % _file_dest)
+                        LOG.debug("overwriting existing file: %s ", args=(_file_dest,))
                     else:
                         assert False, (
                             "Destination file already exists: %s " % _file_dest
                         )
 
                 if self._match_patterns(_file, ignore_patterns):
-                    LOG.debug("not copying ignored file: " + "%s" % _file)
+                    LOG.debug("not copying ignored file: %s", args=(_file,))
                     continue
 
                 elif self._match_patterns(_file, exclude_patterns):
-                    LOG.debug("not rendering excluded file: " + "%s" % _file)
+                    LOG.debug("not rendering excluded file: %s", args=(_file,))
                     shutil.copy(_file, _file_dest)
 
                 else:
-                    LOG.debug("rendering file as template: %s" % _file)
+                    LOG.debug("rendering file as template: %s", args=(_file,))
                     f = open(_file, "r")
                     content = f.read()
                     f.close()
@@ -287,13 +291,15 @@ class TemplateHandler(TemplateInterface, Handler):
             template_prefix = template_dir.rstrip("/")
             template_path = template_path.lstrip("/")
             full_path = fs.abspath(os.path.join(template_prefix, template_path))
-            LOG.debug("attemping to load output template from file %s" % full_path)
+            LOG.debug(
+                "attemping to load output template from file %s", args=(full_path,)
+            )
             if os.path.exists(full_path):
                 content = open(full_path, "r").read()
-                LOG.debug("loaded output template from file %s" % full_path)
+                LOG.debug("loaded output template from file %s", args=(full_path,))
                 return (content, full_path)
             else:
-                LOG.debug("output template file %s does not exist" % full_path)
+                LOG.debug("output template file %s does not exist", args=(full_path,))
                 continue
 
         return (None, None)
@@ -306,8 +312,8 @@ class TemplateHandler(TemplateInterface, Handler):
         )
 
         LOG.debug(
-            "attemping to load output template '%s' from module %s"
-            % (template_path, template_module)
+            "attemping to load output template '%s' from module %s",
+            args=(template_path, template_module),
         )
 
         # see if the module exists first
@@ -315,21 +321,23 @@ class TemplateHandler(TemplateInterface, Handler):
             try:
                 __import__(template_module, globals(), locals(), [], 0)
             except ImportError:
-                LOG.debug("unable to import template module '%s'." % template_module)
+                LOG.debug(
+                    "unable to import template module '%s'.", args=(template_module,)
+                )
                 return (None, None)
 
         # get the template content
         try:
             content = pkgutil.get_data(template_module, template_path)
             LOG.debug(
-                "loaded output template '%s' from module %s"
-                % (template_path, template_module)
+                "loaded output template '%s' from module %s",
+                args=(template_path, template_module),
             )
             return (content, full_module_path)
         except IOError:
             LOG.debug(
-                "output template '%s' does not exist in module %s"
-                % (template_path, template_module)
+                "output template '%s' does not exist in module %s",
+                args=(template_path, template_module),
             )
             return (None, None)
 
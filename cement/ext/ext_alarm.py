@@ -35,7 +35,7 @@ class AlarmManager:
             msg (str): The message to display if the alarm is triggered.
         """
 
-        LOG.debug("setting application alarm for %s seconds" % time)
+        LOG.debug("setting application alarm for %s seconds", args=(time,))
         self.msg = msg
         signal.alarm(int(time))
 
@@ -2,9 +2,19 @@
 Cement argparse extension module.
 """
 
+import hashlib
+import heapq
 import re
 
-from argparse import SUPPRESS, ArgumentParser, RawDescriptionHelpFormatter
+from argparse import (
+    OPTIONAL,
+    SUPPRESS,
+    ArgumentParser,
+    RawDescriptionHelpFormatter,
+    _SubParsersAction,
+)
+from functools import partial
+from importlib import import_module
 
 from cement.core.arg import ArgumentHandler
 from cement.core.controller import ControllerHandler
@@ -13,6 +23,25 @@ from cement.utils.misc import minimal_logger
 
 LOG = minimal_logger(__name__)
 
+# compiled parser trees, keyed by a fingerprint of the controllers (and root
+# parser) they were built from.  the fingerprint is only valid in the current
+# process.  see ArgparseController.Meta.parser_cache
+_PARSER_CACHE = {}
+
+#: The maximum number of compiled parser trees held in the parser cache.
+PARSER_CACHE_SIZE = 32
+
+# argparse actions of options that take no value
+_NO_VALUE_ACTIONS = (
+    "store_const",
+    "store_true",
+    "store_false",
+    "append_const",
+    "count",
+    "help",
+    "version",
+)
+
 
 def _clean_label(label):
     return re.sub("_", "-", label)
@@ -77,7 +106,7 @@ class ArgparseArgumentHandler(ArgumentParser, ArgumentHandler):
 
         See the :py:class:`argparse.ArgumentParser` documentation for help.
         """
-        LOG.debug(f"adding '{args[0]}' argument with kwargs={kwargs}")
+        LOG.debug("adding '%s' argument with kwargs=%s", args=(args[0], kwargs))
 
         help = kwargs.get("help")
         action = kwargs.get("action")
@@ -210,6 +239,104 @@ class expose:
 ex = expose
 
 
+class LazyController:
+
+    """
+    Declares a nested controller by its dotted import path, so that the
+    module defining it is only imported (and the controller registered) when
+    the command line actually routes into it.  Until then, a lightweight
+    placeholder sub-parser is added so that the controller is still listed
+    in the ``--help`` output of the controller it is stacked on.
+
+    Lazy controllers are declared on the ``base`` controller via
+    ``ArgparseController.Meta.lazy_controllers``.
+
+    Args:
+        label (str): The label of the controller (must match
+            ``Meta.label`` of the imported class).
+        path (str): Dotted import path to the controller class (i.e.
+            ``myapp.controllers.aws.AWS``).
+
+    Keyword Args:
+        stacked_on (str): The label of the controller to nest on (must match
+            ``Meta.stacked_on`` of the imported class).
+        help (str): Help text listed for the controller before it is
+            imported.
+        aliases (list): Aliases for the controller/sub-parser (should match
+            ``Meta.aliases`` of the imported class).
+        hide (bool): Whether the controller should be visible in ``--help``.
+
+    Example:
+
+        .. code-block:: python
+
+            class Base(ArgparseController):
+                class Meta:
+                    label = 'base'
+                    lazy_controllers = [
+                        LazyController(
+                            'aws',
+                            'myapp.controllers.aws.AWS',
+                            help='manage aws resources',
+                        ),
+                    ]
+
+    """
+
+    def __init__(
+        self, label, path, stacked_on="base", help=None, aliases=None, hide=False
+    ):
+        self.label = label
+        self.path = path
+        self.stacked_on = stacked_on
+        self.help = help or "%s controller" % _clean_label(label)
+        self.aliases = aliases or []
+        self.hide = hide
+
+    def __repr__(self):
+        return "<LazyController %s (%s)>" % (self.label, self.path)
+
+    def _get_names(self):
+        return [_clean_label(self.label)] + self.aliases
+
+    def _load(self):
+        if "." not in self.path:
+            raise FrameworkError(
+                "Invalid lazy controller path '%s' (expecting "
+                "'module.path.ClassName')" % self.path
+            )
+
+        module_path, class_name = self.path.rsplit(".", 1)
+        try:
+            module = import_module(module_path)
+        except ImportError as e:
+            raise FrameworkError(e.args[0])
+
+        try:
+            contr = getattr(module, class_name)
+        except AttributeError:
+            raise FrameworkError(
+                "Lazy controller class '%s' not found in module '%s'"
+                % (class_name, module_path)
+            )
+
+        meta = contr.Meta
+        stacked_type = getattr(meta, "stacked_type", "embedded")
+        stacked_on = getattr(meta, "stacked_on", "base")
+        if getattr(meta, "label", None) != self.label:
+            raise FrameworkError(
+                "Lazy controller label '%s' does not match '%s.Meta.label'"
+                % (self.label, self.path)
+            )
+        elif stacked_type != "nested" or stacked_on != self.stacked_on:
+            raise FrameworkError(
+                "Lazy controller '%s' must be nested on '%s'"
+                % (self.label, self.stacked_on)
+            )
+
+        return contr
+
+
 class ArgparseController(ControllerHandler):
 
     """
@@ -363,16 +490,62 @@ class ArgparseController(ControllerHandler):
         #: exception ``error: too few arguments``.
         default_func = "_default"
 
+        #: Whether or not to cache the compiled parser tree (only honored on
+        #: the ``base`` controller).  When enabled, the tree of sub-parsers
+        #: built for all controllers and commands is cached in memory, keyed
+        #: by a fingerprint of the registered controller classes, their
+        #: meta-data, their exposed commands, and the arguments already
+        #: defined on the root parser.  Subsequent dispatches with an
+        #: identical fingerprint reuse the cached tree (re-bound to the new
+        #: app) rather than rebuilding it, so app instances sharing a tree
+        #: should not run at the same time.  Trees of controllers that add
+        #: arguments at run time (in ``_pre_argument_parsing()``) are not
+        #: cached.
+        #:
+        #: The cache is not persisted, and the fingerprint includes the
+        #: identity of objects such as command functions, so this only helps
+        #: repeated ``App`` instances in one process (i.e. after
+        #: ``app.reload()``, or in server mode).  It does not speed up a
+        #: single run of a command line application.
+        parser_cache = False
+
+        #: A list of ``LazyController`` objects declaring nested controllers
+        #: that are only imported and registered when the command line routes
+        #: into them (only honored on the ``base`` controller).  Lazy
+        #: controllers that are not loaded are listed in ``--help`` using the
+        #: help text of the declaration.
+        lazy_controllers = []
+
+    #: Exposed command meta-data of the class (and its bases), keyed by
+    #: member name.  Built once when the class is created, see
+    #: ``__init_subclass__()``.
+    __cement_commands__ = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # collect exposed commands once per class, rather than scanning the
+        # class on every dispatch (commands must be exposed when the class
+        # is defined)
+        commands = {}
+        for member in dir(cls):
+            meta = getattr(getattr(cls, member, None), "__cement_meta__", None)
+            if meta is not None:
+                commands[member] = meta
+        cls.__cement_commands__ = commands
+
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
         self.app = None
         self._parser = None
+        self._commands = None
 
         if self._meta.label == "base":
             self._sub_parser_parents = {}
             self._sub_parsers = {}
             self._controllers = []
             self._controllers_map = {}
+            self._lazy_stubs = []
 
         if self._meta.help is None:
             self._meta.help = "%s controller" % _clean_label(self._meta.label)
@@ -389,12 +562,90 @@ class ArgparseController(ControllerHandler):
         except AssertionError as e:
             raise FrameworkError(e.args[0])
 
-    def _setup_controllers(self):
-        # need a list to maintain order
-        resolved_controllers = []
+    def _get_option_nargs(self):
+        # the number of values taken by the options that may precede a lazy
+        # controller (of the root parser, and of registered controllers),
+        # where None is any number of values
+        option_nargs = {}
+        for action in self.app.args._actions:
+            for option in action.option_strings:
+                option_nargs[option] = _get_nargs_count(action.nargs)
+
+        for contr in self.app.handler.list("controller"):
+            for options, kw in getattr(contr.Meta, "arguments", []):
+                if kw.get("action") in _NO_VALUE_ACTIONS:
+                    nargs = 0
+                else:
+                    nargs = _get_nargs_count(kw.get("nargs"))
+                for option in options:
+                    option_nargs[option] = nargs
+        return option_nargs
+
+    def _get_positional_tokens(self, argv):
+        # the positional arguments in argv, skipping option values as
+        # argparse does (unknown options are assumed to take no value)
+        option_nargs = self._get_option_nargs()
+        tokens = set()
+        skip = 0
+        for token in argv:
+            is_option = len(token) > 1 and token[0] in self.app.args.prefix_chars
+            if token == "--":
+                break
+            elif skip is None and not is_option:
+                continue
+            elif skip and not is_option:
+                skip -= 1
+                continue
+
+            skip = 0
+            if not is_option:
+                tokens.add(token)
+            elif "=" not in token:
+                skip = option_nargs.get(token, 0)
+        return tokens
+
+    def _get_lazy_chain(self, spec, specs, loading):
+        # the lazy controller and its lazy ancestors that are not loading
+        # yet, or None if they are not stacked on a registered controller
+        chain = []
+        while spec.label not in loading:
+            if spec in chain:
+                return None
+            chain.append(spec)
+            if self.app.handler.registered("controller", spec.stacked_on):
+                break
+            elif spec.stacked_on not in specs:
+                return None
+            spec = specs[spec.stacked_on]
+        return chain
+
+    def _setup_lazy_controllers(self):
+        # import and register lazy controllers whose label (or alias) is on
+        # the command line (along with the lazy controllers they are stacked
+        # on), everything else only gets a placeholder parser
+        tokens = self._get_positional_tokens(list(self.app.argv or []))
+
+        specs = {}
+        for spec in self._meta.lazy_controllers:
+            if not self.app.handler.registered("controller", spec.label):
+                specs[spec.label] = spec
+
+        loading = set()
+        for spec in specs.values():
+            if tokens.intersection(spec._get_names()):
+                chain = self._get_lazy_chain(spec, specs, loading)
+                loading.update([x.label for x in chain or []])
+
+        self._lazy_stubs = []
+        for spec in specs.values():
+            if spec.label in loading:
+                LOG.debug("loading lazy controller %s", args=(spec,))
+                self.app.handler.register(spec._load())
+            else:
+                self._lazy_stubs.append(spec)
 
-        # need a dict to do key/label based lookup
-        resolved_controllers_map = {}
+    def _setup_controllers(self):
+        self._setup_lazy_controllers()
 
         # list to maintain which controllers we haven't resolved yet
         unresolved_controllers = []
@@ -406,78 +657,19 @@ class ArgparseController(ControllerHandler):
             contr = self.app.handler.resolve("controller", contr, setup=True)
             unresolved_controllers.append(contr)
 
-        # treat self/base separately
-        resolved_controllers.append(self)
-        resolved_controllers_map["base"] = self
-
         # resolve controllers in the order that they are nested/embedded,
         # otherwise argparse does weird things
+        resolved_controllers = [self] + _resolve_controller_order(
+            self._meta.label, unresolved_controllers
+        )
+        resolved_controllers_map = {"base": self}
+        for contr in resolved_controllers[1:]:
+            resolved_controllers_map[contr._meta.label] = contr
 
-        LOG.debug("resolving controller nesting/embedding order")
-
-        current_parent = self._meta.label
-        while unresolved_controllers:
-            LOG.debug("unresolved controllers > %s" % unresolved_controllers)
-            LOG.debug("current parent > %s" % current_parent)
-
-            # handle all controllers nested on parent
-            current_children = []
-            resolved_child_controllers = []
-            for contr in list(unresolved_controllers):
-                # if stacked_on is the current parent, we want to process
-                # its children in this run first
-                if contr._meta.stacked_on == current_parent:
-                    current_children.append(contr)
-                    if contr._meta.stacked_type == "embedded":
-                        resolved_child_controllers.append(contr)
-                    else:
-                        resolved_child_controllers.insert(0, contr)
-                    unresolved_controllers.remove(contr)
-                    LOG.debug(
-                        "resolved controller %s %s on %s"
-                        % (contr, contr._meta.stacked_type, current_parent)
-                    )
-
-                # if not, fall back on whether the stacked_on parent is
-                # already resolved
-                elif contr._meta.stacked_on in resolved_controllers_map.keys():
-                    resolved_controllers.append(contr)
-                    resolved_controllers_map[contr._meta.label] = contr
-                    unresolved_controllers.remove(contr)
-                    LOG.debug(
-                        "resolved controller %s %s on %s"
-                        % (contr, contr._meta.stacked_type, contr._meta.stacked_on)
-                    )
-
-            resolved_controllers.extend(resolved_child_controllers)
-            for contr in resolved_child_controllers:
-                resolved_controllers_map[contr._meta.label] = contr
-
-            # then, for all those controllers... handler all controllers
-            # nested on them
-            resolved_child_controllers = []
-            for child_contr in current_children:
-                for contr in list(unresolved_controllers):
-                    if contr._meta.stacked_on == child_contr._meta.label:
-                        if contr._meta.stacked_type == "embedded":
-                            resolved_child_controllers.append(contr)
-                        else:
-                            resolved_child_controllers.insert(0, contr)
-
-                        unresolved_controllers.remove(contr)
-                        LOG.debug(
-                            "resolved controller %s %s on %s"
-                            % (contr, contr._meta.stacked_type, child_contr._meta.label)
-                        )
-
-            resolved_controllers.extend(resolved_child_controllers)
-            for contr in resolved_child_controllers:
-                resolved_controllers_map[contr._meta.label] = contr
-
-            # re-iterate with the next in line as the parent (handles multiple
-            # level nesting)
-            if unresolved_controllers:
-                current_parent = unresolved_controllers[0]._meta.label
+        LOG.debug(
+            "resolved nesting/embedding order of %s controllers",
+            args=(len(resolved_controllers),),
+        )
 
         self._controllers = resolved_controllers
         self._controllers_map = resolved_controllers_map
@@ -509,8 +701,8 @@ class ArgparseController(ControllerHandler):
         if "help" not in kwargs.keys():
             kwargs["help"] = contr._meta.help
         if "formatter_class" not in kwargs.keys():
-            kwargs["formatter_class"] = lambda prog: contr._meta.parser_formatter(
-                prog,
+            kwargs["formatter_class"] = partial(
+                contr._meta.parser_formatter,
                 max_help_position=self._meta.formatter_max_help_position,
                 width=self._meta.formatter_width,
             )
@@ -541,8 +733,8 @@ class ArgparseController(ControllerHandler):
             if "help" in kwargs:
                 del kwargs["help"]
         elif "formatter_class" not in kwargs.keys():
-            kwargs["formatter_class"] = lambda prog: contr._meta.command_formatter(
-                prog,
+            kwargs["formatter_class"] = partial(
+                contr._meta.command_formatter,
                 max_help_position=self._meta.formatter_max_help_position,
                 width=self._meta.formatter_width,
             )
@@ -566,17 +758,15 @@ class ArgparseController(ControllerHandler):
 
         kwargs = self._get_subparser_options(self)
 
+        # labels of controllers that have other controllers stacked on them
+        stacked_on_labels = {x._meta.stacked_on for x in self._controllers[1:]}
+        stacked_on_labels.update(x.stacked_on for x in self._lazy_stubs)
+
         # only create a subparser if there are commands or nested
         # controllers
         cmds = self._collect_commands()
-        contrs = [
-            x
-            for x in self._controllers
-            if x._meta.label != self._meta.label
-            and x._meta.stacked_on == self._meta.label
-        ]
 
-        if len(cmds) > 0 or len(contrs) > 0:
+        if len(cmds) > 0 or self._meta.label in stacked_on_labels:
             sub = self.app.args.add_subparsers(**kwargs)
             parents["base"] = sub
 
@@ -597,7 +787,8 @@ class ArgparseController(ControllerHandler):
 
         # and if only base controller registered... go ahead and return
         if len(self.app.handler.list("controller")) <= 1:
-            return  # pragma: nocover
+            self._setup_lazy_parsers()
+            return
 
         # note that the order of self._controllers was already organized by
         # stacking/embedding order in self._setup_controllers ... order is
@@ -626,13 +817,8 @@ class ArgparseController(ControllerHandler):
                 # only create a subparser if there are commands or nested
                 # controllers
                 cmds = contr._collect_commands()
-                contrs = [
-                    x
-                    for x in self._controllers
-                    if x._meta.label != label and x._meta.stacked_on == label
-                ]
 
-                if len(cmds) > 0 or len(contrs) > 0:
+                if len(cmds) > 0 or label in stacked_on_labels:
                     parents[label] = parsers[label].add_subparsers(**kwargs)
 
                 # add an invisible controller option so we can figure out what
@@ -651,6 +837,123 @@ class ArgparseController(ControllerHandler):
                 parents[label] = parents[stacked_on]
                 parsers[label] = parsers[stacked_on]
 
+        self._setup_lazy_parsers()
+
+    def _setup_lazy_parsers(self):
+        # placeholder sub-parsers for lazy controllers that were not loaded,
+        # these are only ever used for --help (routing into one loads it)
+        parents = self._sub_parser_parents
+        for spec in self._lazy_stubs:
+            if spec.stacked_on not in parents:
+                # stacked on another lazy controller that was not loaded
+                continue
+
+            kwargs = dict(aliases=spec.aliases)
+            if spec.hide is not True:
+                kwargs["help"] = spec.help
+            parser = parents[spec.stacked_on].add_parser(
+                _clean_label(spec.label), **kwargs
+            )
+            parser._setup(self.app)
+
+    def _build_parsers(self):
+        # this should only be run by the base controller
+        key = self._get_parser_cache_key()
+        if key is not None and key in _PARSER_CACHE:
+            LOG.debug("using cached parser tree %s", args=(key,))
+            self._load_parsers(_PARSER_CACHE[key])
+            return
+
+        self._setup_parsers()
+
+        for contr in self._controllers:
+            self._process_arguments(contr)
+            self._process_commands(contr)
+
+        if key is not None:
+            LOG.debug("caching parser tree %s", args=(key,))
+            while len(_PARSER_CACHE) >= PARSER_CACHE_SIZE:
+                del _PARSER_CACHE[next(iter(_PARSER_CACHE))]
+            _PARSER_CACHE[key] = (
+                self._sub_parsers,
+                self._sub_parser_parents,
+                self._dispatch_option,
+                self._controller_option,
+            )
+
+    def _get_parser_cache_key(self):
+        if self._meta.parser_cache is not True:
+            return None
+
+        # cached trees are shared, and must not be modified after being built
+        for contr in self._controllers:
+            func = contr.__class__._pre_argument_parsing
+            if func is not ArgparseController._pre_argument_parsing:
+                LOG.debug(
+                    "not caching parser tree, %s adds arguments at run time",
+                    args=(contr,),
+                )
+                return None
+
+        return self._get_parser_fingerprint()
+
+    def _get_parser_fingerprint(self):
+        parts = [
+            self.app.args.__class__,
+            self.app.args.prog,
+            self.app.args._meta.__dict__,
+        ]
+
+        # anything already added to the root parser (i.e. by the framework or
+        # extensions in post_setup) is part of the cached tree
+        for action in self.app.args._actions:
+            items = [(k, v) for k, v in vars(action).items() if k != "container"]
+            parts.append((action.__class__, sorted(items)))
+
+        for contr in self._controllers:
+            parts.append(
+                (
+                    contr.__class__.__module__,
+                    contr.__class__.__qualname__,
+                    sorted(contr._meta.__dict__.items()),
+                )
+            )
+            for command in contr._collect_commands():
+                parts.append(
+                    sorted((k, v) for k, v in command.items() if k != "controller")
+                )
+
+        for spec in self._lazy_stubs:
+            parts.append(
+                (
+                    spec.label,
+                    spec.path,
+                    spec.stacked_on,
+                    spec.help,
+                    spec.aliases,
+                    spec.hide,
+                )
+            )
+
+        return hashlib.md5(repr(parts).encode()).hexdigest()
+
+    def _load_parsers(self, cached):
+        parsers, parents, dispatch_option, controller_option = cached
+
+        for parser in _walk_parsers(parsers["base"]):
+            parser.app = self.app
+
+        self.app.args = parsers["base"]
+        self._sub_parsers = parsers
+        self._sub_parser_parents = parents
+        self._dispatch_option = dispatch_option
+        self._controller_option = controller_option
+        self._parser = parsers["base"]
+
+        for contr in self._controllers:
+            if contr._meta.stacked_type == "nested":
+                contr._parser = parsers[contr._meta.label]
+
     def _get_parser_by_controller(self, controller):
         if controller._meta.stacked_type == "embedded":
             parser = self._get_parser(controller._meta.stacked_on)
@@ -676,17 +979,17 @@ class ArgparseController(ControllerHandler):
     def _process_arguments(self, controller):
         label = controller._meta.label
 
-        LOG.debug("processing arguments for '%s' " % label + "controller namespace")
+        LOG.debug("processing arguments for '%s' controller namespace", args=(label,))
 
         parser = self._get_parser_by_controller(controller)
         arguments = controller._collect_arguments()
         for arg, kw in arguments:
-            LOG.debug("adding argument (args={}, kwargs={})".format(arg, kw))
+            LOG.debug("adding argument (args=%s, kwargs=%s)", args=(arg, kw))
             parser.add_argument(*arg, **kw)
 
     def _process_commands(self, controller):
         label = controller._meta.label
-        LOG.debug("processing commands for '%s' " % label + "controller namespace")
+        LOG.debug("processing commands for '%s' controller namespace", args=(label,))
 
         commands = controller._collect_commands()
         for command in commands:
@@ -694,8 +997,8 @@ class ArgparseController(ControllerHandler):
 
             func_name = command["func_name"]
             LOG.debug(
-                "adding command '%s' " % command["label"]
-                + "(controller={}, func={})".format(controller._meta.label, func_name)
+                "adding command '%s' (controller=%s, func=%s)",
+                args=(command["label"], controller._meta.label, func_name),
             )
 
             cmd_parent = self._get_parser_parent_by_controller(controller)
@@ -717,11 +1020,11 @@ class ArgparseController(ControllerHandler):
 
             # add additional arguments to the sub-command namespace
             LOG.debug(
-                "processing arguments for '%s' " % command["label"]
-                + "command namespace"
+                "processing arguments for '%s' command namespace",
+                args=(command["label"],),
             )
             for arg, kw in command["arguments"]:
-                LOG.debug("adding argument (args={}, kwargs={})".format(arg, kw))
+                LOG.debug("adding argument (args=%s, kwargs=%s)", args=(arg, kw))
                 command_parser.add_argument(*arg, **kw)
 
     def _collect(self):
@@ -732,29 +1035,26 @@ class ArgparseController(ControllerHandler):
 
     def _collect_arguments(self):
         LOG.debug(
-            "collecting arguments from %s " % self
-            + "(stacked_on='%s', stacked_type='%s')"
-            % (self._meta.stacked_on, self._meta.stacked_type)
+            "collecting arguments from %s (stacked_on='%s', stacked_type='%s')",
+            args=(self, self._meta.stacked_on, self._meta.stacked_type),
         )
         return self._meta.arguments
 
     def _collect_commands(self):
-        LOG.debug(
-            "collecting commands from %s " % self
-            + "(stacked_on='%s', stacked_type='%s')"
-            % (self._meta.stacked_on, self._meta.stacked_type)
-        )
+        if self._commands is None:
+            LOG.debug(
+                "collecting commands from %s (stacked_on='%s', stacked_type='%s')",
+                args=(self, self._meta.stacked_on, self._meta.stacked_type),
+            )
 
-        commands = []
-        for member in dir(self.__class__):
-            if member.startswith("_"):
-                continue
-            elif hasattr(getattr(self, member), "__cement_meta__"):
-                func = getattr(self.__class__, member).__cement_meta__
-                func["controller"] = self
-                commands.append(func)
+            # copy the class level meta-data, which is shared by all instances
+            self._commands = [
+                dict(meta, controller=self)
+                for member, meta in self.__cement_commands__.items()
+                if not member.startswith("_")
+            ]
 
-        return commands
+        return self._commands
 
     def _get_exposed_commands(self):
         """
@@ -764,14 +1064,7 @@ class ArgparseController(ControllerHandler):
 
             exposed_commands (list): List of exposed commands (labels)
         """
-        # get exposed commands
-        exposed = []
-        for member_key in dir(self):
-            member = getattr(self, member_key)
-            if hasattr(member, "__cement_meta__"):
-                exposed.append(_clean_label(member_key))
-
-        return exposed
+        return [_clean_label(x) for x in self.__cement_commands__.keys()]
 
     def _pre_argument_parsing(self):
         """
@@ -844,13 +1137,9 @@ class ArgparseController(ControllerHandler):
         pass
 
     def _dispatch(self):
-        LOG.debug("controller dispatch passed off to %s" % self)
+        LOG.debug("controller dispatch passed off to %s", args=(self,))
         self._setup_controllers()
-        self._setup_parsers()
-
-        for contr in self._controllers:
-            self._process_arguments(contr)
-            self._process_commands(contr)
+        self._build_parsers()
 
         for contr in self._controllers:
             contr._pre_argument_parsing()
@@ -900,5 +1189,146 @@ class ArgparseController(ControllerHandler):
             )  # pragma: nocover
 
 
+class _ControllerOrder:
+
+    """
+    The state of ``_resolve_controller_order()``, with a parent to children
+    index so that resolving runs in (near) linear time.
+    """
+
+    def __init__(self, controllers):
+        self.controllers = list(controllers)
+        self.resolved = [False] * len(self.controllers)
+        self.children = {}
+        for pos, contr in enumerate(self.controllers):
+            self.children.setdefault(contr._meta.stacked_on, []).append(pos)
+
+        self.order = []
+
+        # heap of positions of controllers whose parent is resolved
+        self.ready = []
+
+    def _take_children(self, labels):
+        # mark the unresolved children of labels resolved, nested
+        # controllers latest registered first, then embedded controllers
+        nested = []
+        embedded = []
+        for label in labels:
+            for pos in self.children.pop(label, []):
+                if self.resolved[pos]:
+                    continue
+                self.resolved[pos] = True
+                if self.controllers[pos]._meta.stacked_type == "embedded":
+                    embedded.append(pos)
+                else:
+                    nested.append(pos)
+        nested.reverse()
+        return nested + embedded
+
+    def _add(self, positions):
+        self.order.extend(positions)
+        for pos in positions:
+            label = self.controllers[pos]._meta.label
+            for child_pos in self.children.get(label, []):
+                heapq.heappush(self.ready, child_pos)
+
+    def _add_ready(self):
+        # add the controllers whose parent is resolved in registration
+        # order, deferring those registered before a parent that is resolved
+        # in this pass to the next pass
+        last_pos = -1
+        deferred = []
+        while self.ready:
+            pos = heapq.heappop(self.ready)
+            if self.resolved[pos]:
+                continue
+            elif pos < last_pos:
+                deferred.append(pos)
+                continue
+            self.resolved[pos] = True
+            last_pos = pos
+            self._add([pos])
+        for pos in deferred:
+            heapq.heappush(self.ready, pos)
+
+    def _add_level(self, parent_label):
+        current_children = [
+            pos for pos in self.children.get(parent_label, []) if not self.resolved[pos]
+        ]
+        child_positions = self._take_children([parent_label])
+        self._add_ready()
+        self._add(child_positions)
+
+        labels = [self.controllers[pos]._meta.label for pos in current_children]
+        self._add(self._take_children(labels))
+
+    def _get_unresolved_error(self):
+        unresolved = [
+            x for pos, x in enumerate(self.controllers) if not self.resolved[pos]
+        ]
+        return FrameworkError(
+            "Unable to resolve controller(s) stacked on a non-existent "
+            "controller: %s"
+            % ", ".join(
+                "%s (stacked on %s)" % (x._meta.label, x._meta.stacked_on)
+                for x in unresolved
+            )
+        )
+
+    def resolve(self, parent_label):
+        current_parent = parent_label
+        first_unresolved = 0
+        while first_unresolved < len(self.controllers):
+            resolved_count = len(self.order)
+            self._add_level(current_parent)
+            if len(self.order) == resolved_count:
+                raise self._get_unresolved_error()
+
+            while (
+                first_unresolved < len(self.controllers)
+                and self.resolved[first_unresolved]
+            ):
+                first_unresolved += 1
+            if first_unresolved < len(self.controllers):
+                current_parent = self.controllers[first_unresolved]._meta.label
+
+        return [self.controllers[pos] for pos in self.order]
+
+
+def _resolve_controller_order(parent_label, controllers):
+    """
+    Order ``controllers`` (in registration order, not including the parent)
+    so that argparse sub-parsers can be created in sequence.  Starting from
+    the parent, each pass takes anything whose parent is already resolved
+    (in registration order), then the children of the current parent
+    (nested controllers latest registered first, then embedded controllers
+    in registration order), then their own children in the same manner.
+
+    This runs in (near) linear time, and raises ``FrameworkError`` for
+    controllers that are stacked on a controller that does not exist.
+    """
+    return _ControllerOrder(controllers).resolve(parent_label)
+
+
+def _get_nargs_count(nargs):
+    # the number of command line values taken by an argument with nargs,
+    # None meaning any number
+    if nargs is None or nargs == OPTIONAL:
+        return 1
+    elif isinstance(nargs, int):
+        return nargs
+    return None
+
+
+def _walk_parsers(parser):
+    yield parser
+    for action in parser._actions:
+        if isinstance(action, _SubParsersAction):
+            # aliases map to the same sub-parser
+            sub_parsers = {id(x): x for x in action.choices.values()}
+            for sub_parser in sub_parsers.values():
+                yield from _walk_parsers(sub_parser)
+
+
 def load(app):
     app.handler.register(ArgparseArgumentHandler)
@@ -57,6 +57,10 @@ class ColorLogHandler(LoggingLogHandler):
             rotate=False,
             max_bytes=512_000,
             max_files=4,
+            sample_rate=1,
+            rate_limit=0,
+            rate_limit_burst=0,
+            rate_limit_exempt_level="WARNING",
             colorize_file_log=False,
             colorize_console_log=True,
         )
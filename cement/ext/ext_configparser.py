@@ -5,7 +5,7 @@ Cement configparser extension module.
 import os
 import re
 
-from configparser import RawConfigParser
+from configparser import Interpolation, RawConfigParser
 
 from cement.core import config
 from cement.utils.misc import minimal_logger
@@ -25,6 +25,12 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
 
     Additional arguments and keyword arguments are passed directly to
     RawConfigParser on initialization.
+
+    Configuration settings can be overridden by environment variables named
+    ``<CONFIG_SECTION>_<KEY>`` (for the application's config section) or
+    ``<CONFIG_SECTION>_<SECTION>_<KEY>``.  The names of these environment
+    variables are resolved once per setting, while their values are read
+    from ``os.environ`` on every lookup.
     """
 
     class Meta:
@@ -34,6 +40,10 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         label = "configparser"
         """The string identifier of this handler."""
 
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._env_var_names = {}
+
     def merge(self, dict_obj, override=True):
         """
         Merge a dictionary into our config.  If override is True then
@@ -49,9 +59,21 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
 
         """
         assert isinstance(dict_obj, dict), "Dictionary object required."
+        self._clear_converted()
+
+        # writing directly to the parser's storage is only equivalent to
+        # set() when neither it, nor the interpolation, are customized
+        if type(self).set is not ConfigParserConfigHandler.set:
+            self._merge(dict_obj, override)
+        elif type(self._interpolation) is not Interpolation:
+            self._merge(dict_obj, override)
+        else:
+            self._merge_fast(dict_obj, override)
 
+    def _merge(self, dict_obj, override=True):
+        # merge via set(), one key at a time
         for section in list(dict_obj.keys()):
-            if type(dict_obj[section]) == dict:
+            if isinstance(dict_obj[section], dict):
                 if section not in self.get_sections():
                     self.add_section(section)
 
@@ -66,6 +88,36 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
                 # we don't support nested config blocks, so no need to go
                 # further down to more nested dicts.
 
+    def _merge_fast(self, dict_obj, override=True):
+        # merge by writing directly to the parser's storage
+        for section, values in dict_obj.items():
+            if not isinstance(values, dict):
+                continue
+            elif not section or section == self.default_section:
+                self._merge({section: values}, override)
+                continue
+
+            if section not in self._sections:
+                self.add_section(section)
+            self._merge_section_fast(self._sections[section], values, override)
+
+    def _merge_section_fast(self, section_dict, values, override):
+        optionxform = self.optionxform
+        if override:
+            for key, value in values.items():
+                section_dict[optionxform(key)] = value
+            return
+
+        # only set keys that don't exist (note that, as with keys(), the
+        # existing keys have been passed through optionxform)
+        existing = set(section_dict)
+        existing.update(self._defaults)
+        for key, value in values.items():
+            if key not in existing:
+                option = optionxform(key)
+                section_dict[option] = value
+                existing.add(option)
+
     def _parse_file(self, file_path):
         """
         Parse a configuration file at ``file_path`` and store it.
@@ -83,6 +135,49 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         # will likely raise an exception anyhow.
         return True
 
+    def _decode_file(self, file_path):
+        self._check_file_size(file_path)
+
+        # read into a separate parser, configured as we are
+        parser = RawConfigParser(
+            dict_type=self._dict,
+            allow_no_value=self._allow_no_value,
+            delimiters=self._delimiters,
+            comment_prefixes=self._comment_prefixes,
+            inline_comment_prefixes=self._inline_comment_prefixes,
+            strict=self._strict,
+            empty_lines_in_values=self._empty_lines_in_values,
+            default_section=self.default_section,
+        )
+        parser.optionxform = self.optionxform
+        parser.read(file_path)
+
+        # settings of the default section apply to all sections, and can
+        # not be merged
+        if parser._defaults:
+            return None
+
+        res = {}
+        for section, values in parser._sections.items():
+            res[section] = dict(values)
+        return res
+
+    def _get_snapshot(self):
+        sections = {}
+        for section, values in self._sections.items():
+            sections[section] = dict(values)
+        return (dict(self._defaults), sections)
+
+    def _load_snapshot(self, snapshot):
+        defaults, sections = snapshot
+        self._clear_converted()
+        self._defaults.update(defaults)
+        for section, values in sections.items():
+            if not RawConfigParser.has_section(self, section):
+                RawConfigParser.add_section(self, section)
+            self._sections[section].update(values)
+        return True
+
     def keys(self, section):
         """
         Return a list of keys within ``section``.
@@ -154,10 +249,26 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         env_var = re.sub("[^0-9a-zA-Z]+", "_", env_var)
         return env_var
 
+    def _get_env_override(self, section, key):
+        config_section = self.app._meta.config_section
+        try:
+            env_var = self._env_var_names[(config_section, section, key)]
+        except KeyError:
+            env_var = self._get_env_var(section, key)
+            self._env_var_names[(config_section, section, key)] = env_var
+
+        return env_var, os.environ.get(env_var)
+
+    def _get_converted_key(self, section, key, convert):
+        # converted values are only valid for the same environment override
+        return (section, key, convert, self._get_env_override(section, key)[1])
+
     def get(self, section, key, **kwargs):
-        env_var = self._get_env_var(section, key)
-        if env_var in os.environ.keys():
-            return os.environ[env_var]
+        env_var, value = self._get_env_override(section, key)
+        if value is not None:
+            if self.profile is not None:
+                self.profile.add_env_override(env_var, section, key)
+            return value
         else:
             return RawConfigParser.get(self, section, key, **kwargs)
 
@@ -165,8 +276,17 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         return RawConfigParser.has_section(self, section)
 
     def set(self, section, key, value):
+        self._clear_converted()
         return RawConfigParser.set(self, section, key, value)
 
+    def remove_option(self, section, key):
+        self._clear_converted()
+        return RawConfigParser.remove_option(self, section, key)
+
+    def remove_section(self, section):
+        self._clear_converted()
+        return RawConfigParser.remove_section(self, section)
+
 
 def load(app):
     app.handler.register(ConfigParserConfigHandler)
@@ -69,7 +69,7 @@ class Environment:
         Writes ``os.getpid()`` out to ``self.pid_file``.
         """
         pid = str(os.getpid())
-        LOG.debug("writing pid ({}) out to {}".format(pid, self.pid_file))
+        LOG.debug("writing pid (%s) out to %s", args=(pid, self.pid_file))
 
         # setup pid
         if self.pid_file:
@@ -87,8 +87,8 @@ class Environment:
         """
         # set the running uid/gid
         LOG.debug(
-            "setting process uid(%s) and gid(%s)"
-            % (self.user.pw_uid, self.group.gr_gid)
+            "setting process uid(%s) and gid(%s)",
+            args=(self.user.pw_uid, self.group.gr_gid),
         )
         os.setgid(self.group.gr_gid)
         os.setuid(self.user.pw_uid)
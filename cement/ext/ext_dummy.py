@@ -44,7 +44,7 @@ class DummyOutputHandler(OutputHandler):
 
         """
         LOG.debug("not rendering any output to console")
-        LOG.debug("DATA: %s" % data)
+        LOG.debug("DATA: %s", args=(data,))
         return None
 
 
@@ -75,8 +75,8 @@ class DummyTemplateHandler(TemplateHandler):
             data (dict): The data dictionary to render.
 
         """
-        LOG.debug("CONTENT: %s" % content)
-        LOG.debug("DATA: %s" % data)
+        LOG.debug("CONTENT: %s", args=(content,))
+        LOG.debug("DATA: %s", args=(data,))
         return None
 
     def copy(self, src, dest, data):
@@ -89,7 +89,7 @@ class DummyTemplateHandler(TemplateHandler):
             dest (str): The destination directory.
             data (dict): The data dictionary to render with templates.
         """
-        LOG.debug("COPY: {} -> {}".format(src, dest))
+        LOG.debug("COPY: %s -> %s", args=(src, dest))
 
 
 class DummyMailHandler(MailHandler):
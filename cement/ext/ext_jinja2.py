@@ -55,7 +55,7 @@ class Jinja2OutputHandler(OutputHandler):
 
         """
 
-        LOG.debug("rendering content using '%s' as a template." % template)
+        LOG.debug("rendering content using '%s' as a template.", args=(template,))
         content, _type, _path = self.templater.load(template)
         return self.templater.render(content, data)
 
@@ -131,7 +131,7 @@ class Jinja2TemplateHandler(TemplateHandler):
             str: The rendered template text
 
         """
-        LOG.debug("rendering content as text via %s" % self.__module__)
+        LOG.debug("rendering content as text via %s", args=(self.__module__,))
 
         if not isinstance(content, str):
             content = content.decode("utf-8")
@@ -108,7 +108,7 @@ class JsonOutputHandler(output.OutputHandler):
             str: A JSON encoded string.
 
         """
-        LOG.debug("rendering output as Json via %s" % self.__module__)
+        LOG.debug("rendering output as Json via %s", args=(self.__module__,))
         return self._json.dumps(data_dict, **kw)
 
 
@@ -128,7 +128,9 @@ class JsonConfigHandler(ConfigParserConfigHandler):
 
         label = "json"
 
-        #: Backend JSON library module to use (`json`, `ujson`).
+        #: Backend JSON library module to use (`json`, `ujson`, `orjson`).
+        #: Config files are passed to its ``loads()`` function as bytes
+        #: (except for `json`, as utf-8 decoded strings).
         json_module = "json"
 
     def __init__(self, *args, **kw):
@@ -139,6 +141,29 @@ class JsonConfigHandler(ConfigParserConfigHandler):
         super()._setup(app)
         self._json = __import__(self._meta.json_module, globals(), locals(), [], 0)
 
+    def _decode_file(self, file_path):
+        """
+        Decode JSON configuration file settings from file_path, without
+        modifying the config.
+
+        Args:
+            file_path (str): The file system path to the JSON configuration
+            file.
+
+        Returns:
+            dict: The decoded configuration.
+
+        """
+        with self._open_file(file_path) as f:
+            content = f.read()
+            if len(content) > 0:
+                # the standard library decodes bytes slower than we do
+                if self._json.__name__ == "json":
+                    content = content.decode("utf-8")
+                return self._json.loads(content)
+
+        return {}
+
     def _parse_file(self, file_path):
         """
         Parse JSON configuration file settings from file_path, overwriting
@@ -152,11 +177,7 @@ class JsonConfigHandler(ConfigParserConfigHandler):
             bool
 
         """
-        with open(file_path, "r") as f:
-            content = f.read()
-            if content is not None and len(content) > 0:
-                self.merge(self._json.loads(content))
-
+        self.merge(self._decode_file(file_path))
         return True
 
 
@@ -0,0 +1,218 @@
+"""
+Cement jsonlog extension module.
+"""
+
+import logging
+
+from functools import partial
+
+from cement.ext.ext_logging import LoggingLogHandler
+from cement.utils.misc import minimal_logger
+
+LOG = minimal_logger(__name__)
+
+# attributes of every log record, that are not extra fields
+RECORD_ATTRIBUTES = frozenset(
+    list(logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys())
+    + ["message", "asctime", "namespace"]
+)
+
+
+class JsonFormatter(logging.Formatter):
+
+    """
+    A logging formatter that formats each record as a single line JSON
+    object.  Static fields (the same for every record) are serialized once
+    and spliced into each line, so only the fields of the record itself
+    (``time``, ``level``, ``message``, extra fields, and exception info) are
+    serialized per record.
+
+    Args:
+        json_module: The JSON module used to serialize records (``json``,
+            or a drop-in replacement such as ``ujson`` or ``orjson``).
+
+    Keyword Args:
+        static_fields (dict): Fields included in every record.  The ``pid``
+            field (if any) is updated in forked processes.
+        namespace (str): The default namespace of records (that were not
+            logged with a namespace of their own).
+        datefmt (str): The date format of the ``time`` field.
+
+    """
+
+    def __init__(self, json_module, static_fields=None, namespace=None, datefmt=None):
+        super().__init__(datefmt=datefmt)
+        if hasattr(json_module, "JSONEncoder"):
+            # json.dumps() creates an encoder per call when passed options
+            self._encode = json_module.JSONEncoder(default=str).encode
+        else:
+            self._encode = partial(json_module.dumps, default=str)
+        self._decode = isinstance(self._encode({}), bytes)
+        self._static_fields = dict(static_fields or {})
+        self._namespace = namespace
+        self._namespace_field = ""
+        if namespace:
+            self._namespace_field = self._dumps_fields(dict(namespace=namespace))
+        self._pid = self._static_fields.get("pid")
+        self._prefix = self._get_prefix(self._namespace_field)
+        self._time = (None, None)
+
+    def _dumps_fields(self, fields):
+        # the serialized fields, without the enclosing braces
+        res = self._encode(fields)
+        if self._decode:
+            res = res.decode("utf-8")
+        return res[1:-1]
+
+    def _get_prefix(self, namespace_field):
+        # the serialized static fields, to prepend the record fields with
+        fields = [self._dumps_fields(self._static_fields), namespace_field]
+        return "{" + "".join(["%s, " % x for x in fields if x])
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        # without milliseconds, the time only changes once a second
+        created = int(record.created)
+        if created != self._time[0]:
+            self._time = (created, super().formatTime(record, datefmt))
+        return self._time[1]
+
+    def format(self, record):
+        """
+        Format a log record as JSON.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            str: The JSON encoded record.
+
+        """
+        if self._pid is not None and record.process != self._pid:
+            # a forked process (i.e. a daemon or prefork worker)
+            self._pid = self._static_fields["pid"] = record.process
+            self._prefix = self._get_prefix(self._namespace_field)
+
+        namespace = getattr(record, "namespace", None)
+        if not namespace or namespace == self._namespace:
+            prefix = self._prefix
+        else:
+            prefix = self._get_prefix(self._dumps_fields(dict(namespace=namespace)))
+
+        data = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key in record.__dict__.keys() - RECORD_ATTRIBUTES:
+            data[key] = record.__dict__[key]
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+
+        return prefix + self._dumps_fields(data) + "}"
+
+
+class JsonLogHandler(LoggingLogHandler):
+
+    """
+    This class implements the Log Handler interface.  It is
+    a sub-class of :class:`cement.ext.ext_logging.LoggingLogHandler` which is
+    based on the standard :py:class:`logging` library, but logs each record
+    to the console and file as a single line JSON object, for log pipelines
+    that ingest structured logs.
+
+    Each record holds the ``app`` label, the ``host`` and ``pid`` of the
+    :ref:`Platform <cement.core.platform>` handler, and ``Meta.static_fields``,
+    as well as the ``namespace``, ``time``, ``level`` and ``message`` of the
+    record.  Extra fields passed to a log call (i.e.
+    ``app.log.info('msg', extra={'user': 'me'})``) are included as is.
+
+    The ``file_format``, ``console_format`` and ``debug_format`` meta options
+    do not apply.
+
+    """
+
+    class Meta:
+
+        """Handler meta-data."""
+
+        #: The string identifier of the handler.
+        label = "jsonlog"
+
+        #: Class to use as the formatter
+        formatter_class = JsonFormatter
+
+        #: Backend JSON library module to use (`json`, `ujson`, `orjson`)
+        json_module = "json"
+
+        #: Additional fields to include in every record.
+        static_fields = {}
+
+        #: Default configuration settings.  Will be overridden by the same
+        #: settings in any application configuration file under a
+        #: ``[log.jsonlog]`` block.
+        config_defaults = dict(
+            file=None,
+            level="INFO",
+            to_console=True,
+            rotate=False,
+            max_bytes=512_000,
+            max_files=4,
+            sample_rate=1,
+            rate_limit=0,
+            rate_limit_burst=0,
+            rate_limit_exempt_level="WARNING",
+        )
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._json = None
+
+    def _setup(self, app_obj):
+        self._json = __import__(self._meta.json_module, globals(), locals(), [], 0)
+        super()._setup(app_obj)
+
+    def _get_static_fields(self):
+        fields = dict(app=self.app._meta.label)
+        if self.app.platform is not None:
+            fields["host"] = self.app.platform.host
+            fields["pid"] = self.app.platform.pid
+        fields.update(self._meta.static_fields)
+        return fields
+
+    def _get_json_format(self):
+        # there is no format string, but namespaces passed to log calls are
+        # passed on to the formatter as the namespace extra attribute
+        self._update_extras("{namespace}")
+        return None
+
+    def _get_console_format(self):
+        return self._get_json_format()
+
+    def _get_file_format(self):
+        return self._get_json_format()
+
+    def _get_json_formatter(self):
+        return self._meta.formatter_class(
+            self._json,
+            static_fields=self._get_static_fields(),
+            namespace=self._meta.namespace,
+            datefmt=self._meta.date_format,
+        )
+
+    def _get_console_formatter(self, format):
+        return self._get_json_formatter()
+
+    def _get_file_formatter(self, format):
+        return self._get_json_formatter()
+
+
+def load(app):
+    app.handler.register(JsonLogHandler)
@@ -4,7 +4,14 @@ Cement logging extension module.
 
 import logging
 import os
+import queue
 import re
+import threading
+import weakref
+
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from time import monotonic
 
 from cement.core import log
 from cement.utils import fs
@@ -14,6 +21,134 @@ LOG = minimal_logger(__name__)
 
 NullHandler = logging.NullHandler
 
+# log handlers with a running queue listener (see ``async_logging``)
+_QUEUE_LOG_HANDLERS = weakref.WeakSet()
+
+
+def _restart_queue_listeners():
+    # the listener threads do not survive fork(), so anything logged by a
+    # forked child (i.e. a daemon or prefork worker) would never be handled
+    for handler in list(_QUEUE_LOG_HANDLERS):
+        handler._restart_queue_listener()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_queue_listeners)
+
+
+def _format_extra(template, key, value):
+    # format an extra attribute value with a Meta.attribute_formats template
+    return template.format(**{key: value})
+
+
+def _get_rate_limits(sample_rate, rate_limit, burst):
+    # the valid (sample_rate, rate_limit, burst) of a RateLimitFilter
+    rate_limit = max(float(rate_limit), 0)
+    if not burst:
+        burst = rate_limit
+    return (max(int(sample_rate), 1), rate_limit, max(float(burst), 1))
+
+
+class RateLimitFilter(logging.Filter):
+
+    """
+    A logging filter that samples (passing 1 in ``sample_rate`` records),
+    and then rate limits records with a token bucket (passing on average
+    ``rate_limit`` records per second, in bursts of up to ``burst`` records).
+    Records are sampled and rate limited per namespace and level, and the
+    number of records suppressed is counted in ``suppressed``.
+
+    Records at or above ``exempt_level`` always pass, unless their level has
+    limits of its own in ``levels``.
+
+    Keyword Args:
+        sample_rate (int): Pass 1 in ``sample_rate`` records (``1`` passes
+            all records).
+        rate_limit (float): The number of records per second to pass on
+            average (``0`` being unlimited).
+        burst (int): The number of records that may pass at once (the size
+            of the token bucket).  Defaults to ``rate_limit``.
+        exempt_level (int): The level (i.e. ``logging.WARNING``) at or above
+            which records are not sampled or rate limited.  ``None`` applies
+            the limits to all levels.
+        levels (dict): The ``sample_rate``, ``rate_limit`` and ``burst`` of
+            specific levels, keyed by level (i.e.
+            ``{logging.ERROR: dict(rate_limit=10)}``).  A missing
+            ``sample_rate`` or ``rate_limit`` defaults to that of all
+            levels, and a missing ``burst`` to the ``rate_limit`` of the
+            level.
+
+    """
+
+    def __init__(
+        self,
+        sample_rate=1,
+        rate_limit=0,
+        burst=None,
+        exempt_level=logging.WARNING,
+        levels=None,
+    ):
+        super().__init__()
+        self._limits = _get_rate_limits(sample_rate, rate_limit, burst)
+        self.sample_rate, self.rate_limit, self.burst = self._limits
+        self.exempt_level = exempt_level
+
+        # (sample_rate, rate_limit, burst) per level with limits of its own
+        self._levels = {}
+        for level, kw in (levels or {}).items():
+            self._levels[level] = _get_rate_limits(
+                kw.get("sample_rate", sample_rate),
+                kw.get("rate_limit", rate_limit),
+                kw.get("burst"),
+            )
+
+        #: The number of suppressed records per ``(namespace, level)``.
+        self.suppressed = {}
+
+        # per (namespace, level): [sampled count, tokens, last refill time]
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _get_limits(self, levelno):
+        try:
+            return self._levels[levelno]
+        except KeyError:
+            pass
+
+        if self.exempt_level is not None and levelno >= self.exempt_level:
+            return None
+        return self._limits
+
+    def filter(self, record):
+        limits = self._get_limits(record.levelno)
+        if limits is None:
+            return True
+
+        sample_rate, rate_limit, burst = limits
+        key = (getattr(record, "namespace", record.name), record.levelname)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [0, burst, monotonic()]
+
+            passed = bucket[0] % sample_rate == 0
+            bucket[0] += 1
+
+            if passed and rate_limit:
+                now = monotonic()
+                tokens = bucket[1] + (now - bucket[2]) * rate_limit
+                bucket[1] = min(tokens, burst)
+                bucket[2] = now
+                if bucket[1] >= 1:
+                    bucket[1] -= 1
+                else:
+                    passed = False
+
+            if not passed:
+                self.suppressed[key] = self.suppressed.get(key, 0) + 1
+
+        return passed
+
 
 class LoggingLogHandler(log.LogHandler):
 
@@ -89,6 +224,13 @@ class LoggingLogHandler(log.LogHandler):
 
         #: The default configuration dictionary to populate the ``log``
         #: section.
+        #:
+        #: Records below ``rate_limit_exempt_level`` (``none`` for all levels)
+        #: are sampled (``sample_rate``) and rate limited (``rate_limit`` and
+        #: ``rate_limit_burst``).  Levels can have limits of their own with
+        #: the same settings suffixed with the level (i.e.
+        #: ``rate_limit_error = 10``), which apply even at or above the
+        #: exempt level.
         config_defaults = dict(
             file=None,
             level="INFO",
@@ -96,6 +238,10 @@ class LoggingLogHandler(log.LogHandler):
             rotate=False,
             max_bytes=512_000,
             max_files=4,
+            sample_rate=1,
+            rate_limit=0,
+            rate_limit_burst=0,
+            rate_limit_exempt_level="WARNING",
         )
 
         #: List of arguments to use for the cli options
@@ -106,12 +252,24 @@ class LoggingLogHandler(log.LogHandler):
         #: The help description for the log level argument
         log_level_argument_help = "logging level"
 
+        #: Whether to log asynchronously.  If ``True``, a ``QueueHandler``
+        #: is attached to the backend logger, and the console and file
+        #: handlers are run on a ``QueueListener`` thread, so that logging
+        #: never blocks the calling thread on I/O.  Queued records are
+        #: flushed on ``pre_close``, or when the handlers are reconfigured
+        #: (i.e. by ``set_level()``).
+        async_logging = False
+
     levels = ["INFO", "WARNING", "ERROR", "DEBUG", "CRITICAL"]
 
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
         self.app = None
         self.extras = set()
+        self._extra_formatters = {}
+        self._queue_handler = None
+        self._queue_listener = None
+        self._rate_limit_filter = None
 
     def _setup(self, app_obj):
         super()._setup(app_obj)
@@ -126,10 +284,11 @@ class LoggingLogHandler(log.LogHandler):
 
         level = self.app.config.get(self._meta.config_section, "level")
         self.set_level(level)
+        self._setup_rate_limit()
 
         LOG.debug(
-            "logging initialized for '%s' using %s"
-            % (self._meta.namespace, self.__class__.__name__)
+            "logging initialized for '%s' using %s",
+            args=(self._meta.namespace, self.__class__.__name__),
         )
 
     def set_file(self, file):
@@ -138,6 +297,7 @@ class LoggingLogHandler(log.LogHandler):
         self.app.config.set(self._meta.config_section, "file", file)
         file = fs.abspath(file)
 
+        self._stop_queue_listener()
         if current_file:
             os.rename(fs.abspath(current_file), file)
 
@@ -146,6 +306,7 @@ class LoggingLogHandler(log.LogHandler):
 
         self._setup_console_log()
         self._setup_file_log()
+        self._start_queue_listener()
 
     def set_level(self, level):
         """
@@ -156,6 +317,7 @@ class LoggingLogHandler(log.LogHandler):
         :param level: The log level to set.
 
         """
+        self._stop_queue_listener()
         self.clear_loggers(self._meta.namespace)
         for namespace in self._meta.clear_loggers:
             self.clear_loggers(namespace)
@@ -173,6 +335,8 @@ class LoggingLogHandler(log.LogHandler):
         # file
         self._setup_file_log()
 
+        self._start_queue_listener()
+
     def get_level(self):
         """Returns the current log level."""
         return logging.getLevelName(self.backend.level)
@@ -185,16 +349,28 @@ class LoggingLogHandler(log.LogHandler):
 
         self.backend = logging.getLogger("cement:app:%s" % namespace)
 
+    def _update_extras(self, log_format):
+        # extra record attributes used by format, and the callables that
+        # format their values (compiled once, rather than on every log call)
+        extras = re.findall("\\{(.*?)\\}", log_format)
+        extras = [x for x in extras if x not in self._meta.log_record_attributes]
+        self.extras = list(set(self.extras) | set(extras))
+
+        for key in self.extras:
+            template = self._meta.attribute_formats.get(key, f"{{{key}}}")
+            if template == f"{{{key}}}" and key.isidentifier():
+                # same as the template, without parsing it
+                self._extra_formatters[key] = format
+            else:
+                self._extra_formatters[key] = partial(_format_extra, template, key)
+
     def _get_console_format(self):
         if self.get_level() == logging.getLevelName(logging.DEBUG):
             format = self._meta.debug_format
         else:
             format = self._meta.console_format
 
-        extras = re.findall("\\{(.*?)\\}", format)
-        extras = [x for x in extras if x not in self._meta.log_record_attributes]
-        self.extras = list(set(self.extras) | set(extras))
-
+        self._update_extras(format)
         return format
 
     def _get_file_format(self):
@@ -203,10 +379,7 @@ class LoggingLogHandler(log.LogHandler):
         else:
             format = self._meta.file_format
 
-        extras = re.findall("\\{(.*?)\\}", format)
-        extras = [x for x in extras if x not in self._meta.log_record_attributes]
-        self.extras = list(set(self.extras) | set(extras))
-
+        self._update_extras(format)
         return format
 
     def _get_file_formatter(self, format):
@@ -222,8 +395,8 @@ class LoggingLogHandler(log.LogHandler):
     def _setup_console_log(self):
         """Add a console log handler."""
         namespace = self._meta.namespace
-        to_console = self.app.config.get(self._meta.config_section, "to_console")
-        if is_true(to_console):
+        to_console = self.app.config.get_bool(self._meta.config_section, "to_console")
+        if to_console:
             console_handler = logging.StreamHandler()
             format = self._get_console_format()
             formatter = self._get_console_formatter(format)
@@ -244,9 +417,9 @@ class LoggingLogHandler(log.LogHandler):
 
         namespace = self._meta.namespace
         file_path = self.app.config.get(self._meta.config_section, "file")
-        rotate = self.app.config.get(self._meta.config_section, "rotate")
-        max_bytes = self.app.config.get(self._meta.config_section, "max_bytes")
-        max_files = self.app.config.get(self._meta.config_section, "max_files")
+        rotate = self.app.config.get_bool(self._meta.config_section, "rotate")
+        max_bytes = self.app.config.get_int(self._meta.config_section, "max_bytes")
+        max_files = self.app.config.get_int(self._meta.config_section, "max_files")
         if file_path:
             file_path = fs.abspath(file_path)
             log_dir = os.path.dirname(file_path)
@@ -257,7 +430,7 @@ class LoggingLogHandler(log.LogHandler):
                 from logging.handlers import RotatingFileHandler
 
                 file_handler = RotatingFileHandler(
-                    file_path, maxBytes=int(max_bytes), backupCount=int(max_files)
+                    file_path, maxBytes=max_bytes, backupCount=max_files
                 )
             else:
                 from logging import FileHandler
@@ -278,25 +451,175 @@ class LoggingLogHandler(log.LogHandler):
 
         self.backend.addHandler(file_handler)
 
+    def _get_rate_limit_levels(self):
+        # the limits of levels with settings of their own (i.e. the
+        # sample_rate_debug, rate_limit_error or rate_limit_burst_error
+        # settings), keyed by level
+        section = self._meta.config_section
+        keys = self.app.config.keys(section)
+        settings = [
+            ("sample_rate", "sample_rate", self.app.config.get_int),
+            ("rate_limit", "rate_limit", self.app.config.get_float),
+            ("burst", "rate_limit_burst", self.app.config.get_int),
+        ]
+
+        levels = {}
+        for level in self.levels:
+            kw = {}
+            for arg, setting, get in settings:
+                key = "%s_%s" % (setting, level.lower())
+                if key in keys:
+                    kw[arg] = get(section, key)
+            if kw:
+                levels[getattr(logging, level)] = kw
+        return levels
+
+    def _get_rate_limit_exempt_level(self):
+        # the level at or above which records are not sampled or rate
+        # limited, where None (i.e. the setting is 'none') is no level
+        section = self._meta.config_section
+        if "rate_limit_exempt_level" not in self.app.config.keys(section):
+            return logging.WARNING
+
+        level = self.app.config.get(section, "rate_limit_exempt_level")
+        level = logging.getLevelName(str(level).upper())
+        if not isinstance(level, int):
+            return None
+        return level
+
+    def _setup_rate_limit(self):
+        """Add a sampling and rate limiting filter, if enabled."""
+        section = self._meta.config_section
+        sample_rate = self.app.config.get_int(section, "sample_rate")
+        rate_limit = self.app.config.get_float(section, "rate_limit")
+        burst = self.app.config.get_int(section, "rate_limit_burst")
+        levels = self._get_rate_limit_levels()
+
+        suppressed = {}
+        if self._rate_limit_filter is not None:
+            suppressed = self._rate_limit_filter.suppressed
+            self.backend.removeFilter(self._rate_limit_filter)
+            self._rate_limit_filter = None
+
+        if sample_rate > 1 or rate_limit > 0 or levels:
+            # records are sampled and rate limited per namespace
+            self._update_extras("{namespace}")
+            self._rate_limit_filter = RateLimitFilter(
+                sample_rate=sample_rate,
+                rate_limit=rate_limit,
+                burst=burst,
+                exempt_level=self._get_rate_limit_exempt_level(),
+                levels=levels,
+            )
+            self._rate_limit_filter.suppressed = suppressed
+            self.backend.addFilter(self._rate_limit_filter)
+
+    def get_suppressed(self):
+        """
+        Returns the number of log records suppressed by sampling and rate
+        limiting (per the ``sample_rate``, ``rate_limit`` and
+        ``rate_limit_burst`` settings).
+
+        Returns:
+            dict: The number of suppressed records per
+            ``(namespace, level)``.
+
+        """
+        if self._rate_limit_filter is None:
+            return {}
+        return dict(self._rate_limit_filter.suppressed)
+
+    def _log_suppressed(self):
+        """
+        Log a summary of the records suppressed by sampling and rate limiting
+        (which are no longer applied afterward).
+        """
+        suppressed = self.get_suppressed()
+        if self._rate_limit_filter is not None:
+            self.backend.removeFilter(self._rate_limit_filter)
+            self._rate_limit_filter = None
+
+        # logged at the level of the suppressed records
+        for (namespace, level), count in sorted(suppressed.items()):
+            levelno = logging.getLevelName(level)
+            if self.backend.isEnabledFor(levelno):
+                msg = "suppressed %s %s log records by sampling/rate limiting" % (
+                    count,
+                    level,
+                )
+                kwargs = self._get_logging_kwargs(namespace)
+                self.backend.log(levelno, msg, **kwargs)
+
+    def _start_queue_listener(self):
+        """Move the log handlers behind a queue, if ``async_logging``."""
+        if not self._meta.async_logging:
+            return
+
+        handlers = list(self.backend.handlers)
+        for handler in handlers:
+            self.backend.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self.backend.addHandler(self._queue_handler)
+        self._queue_listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._queue_listener.start()
+        _QUEUE_LOG_HANDLERS.add(self)
+
+    def _restart_queue_listener(self):
+        """
+        Start a new queue listener (with a new queue) in a forked child
+        process.  Records queued by the parent before the fork are left to
+        the parent.
+        """
+        if self._queue_listener is None:
+            return  # pragma: nocover
+
+        log_queue = queue.SimpleQueue()
+        self._queue_handler.queue = log_queue
+        self._queue_listener = QueueListener(
+            log_queue, *self._queue_listener.handlers, respect_handler_level=True
+        )
+        self._queue_listener.start()
+
+    def _stop_queue_listener(self):
+        """
+        Stop the queue listener (if running), after it has handled all
+        queued records, and move the log handlers back to the backend logger
+        so that anything logged afterward is handled synchronously.
+        """
+        if self._queue_listener is None:
+            return
+
+        listener = self._queue_listener
+        self._queue_listener = None
+        _QUEUE_LOG_HANDLERS.discard(self)
+        listener.stop()
+
+        self.backend.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        for handler in listener.handlers:
+            self.backend.addHandler(handler)
+
     def _get_logging_kwargs(self, namespace, **kw):
         if namespace is None:
             namespace = self._meta.namespace
 
-        if "extra" not in kw.keys():
+        if "extra" not in kw:
             kw["extra"] = {}
+        extra = kw["extra"]
 
-        for key in self.extras:
-            if key in kw["extra"].keys():
+        for key, formatter in self._extra_formatters.items():
+            if key in extra:
                 continue
-
-            template = self._meta.attribute_formats.get(key, f"{{{key}}}")
-
-            if key in kw.keys():
-                kw["extra"][key] = template.format(**{key: kw.pop(key)})
+            elif key in kw:
+                extra[key] = formatter(kw.pop(key))
             elif key == "namespace":
-                kw["extra"][key] = template.format(**{key: namespace})
+                extra[key] = formatter(namespace)
             else:
-                kw["extra"][key] = ""
+                extra[key] = ""
 
         return kw
 
@@ -317,6 +640,9 @@ class LoggingLogHandler(log.LogHandler):
                 system.
 
         """
+        if not self.backend.isEnabledFor(logging.INFO):
+            return
+
         kwargs = self._get_logging_kwargs(namespace, **kw)
         self.backend.info(msg, **kwargs)
 
@@ -337,6 +663,9 @@ class LoggingLogHandler(log.LogHandler):
                 system.
 
         """
+        if not self.backend.isEnabledFor(logging.WARNING):
+            return
+
         kwargs = self._get_logging_kwargs(namespace, **kw)
         self.backend.warning(msg, **kwargs)
 
@@ -357,6 +686,9 @@ class LoggingLogHandler(log.LogHandler):
                 system.
 
         """
+        if not self.backend.isEnabledFor(logging.ERROR):
+            return
+
         kwargs = self._get_logging_kwargs(namespace, **kw)
         self.backend.error(msg, **kwargs)
 
@@ -377,6 +709,9 @@ class LoggingLogHandler(log.LogHandler):
                 system.
 
         """
+        if not self.backend.isEnabledFor(logging.CRITICAL):
+            return
+
         kwargs = self._get_logging_kwargs(namespace, **kw)
         self.backend.critical(msg, **kwargs)
 
@@ -397,6 +732,9 @@ class LoggingLogHandler(log.LogHandler):
                 system.
 
         """
+        if not self.backend.isEnabledFor(logging.DEBUG):
+            return
+
         kwargs = self._get_logging_kwargs(namespace, **kw)
         self.backend.debug(msg, **kwargs)
 
@@ -419,7 +757,38 @@ def handle_logging_arguments(app):
             app._meta.debug = True
 
 
+def handle_config_changed(app, changes):
+    section = app.log._meta.config_section
+    if "level" in changes.get(section, []) and not is_true(app.debug):
+        app.log.set_level(app.config.get(section, "level"))
+
+
+def handle_rate_limit_config_changed(app, changes):
+    if not isinstance(app.log, LoggingLogHandler):
+        return  # pragma: nocover
+
+    changed = changes.get(app.log._meta.config_section, [])
+    if any(key.startswith(("sample_rate", "rate_limit")) for key in changed):
+        app.log._setup_rate_limit()
+
+
+def log_suppressed(app):
+    if isinstance(app.log, LoggingLogHandler):
+        app.log._log_suppressed()
+
+
+def flush_log_queue(app):
+    if isinstance(app.log, LoggingLogHandler):
+        app.log._stop_queue_listener()
+
+
 def load(app):
     app.handler.register(LoggingLogHandler)
     app.hook.register("pre_argument_parsing", add_logging_arguments)
     app.hook.register("post_argument_parsing", handle_logging_arguments)
+    app.hook.register("config_changed", handle_config_changed)
+    app.hook.register("config_changed", handle_rate_limit_config_changed)
+    app.hook.register("pre_close", log_suppressed, weight=99)
+
+    # after anything else that might log on close
+    app.hook.register("pre_close", flush_log_queue, weight=100)
@@ -0,0 +1,149 @@
+"""
+Cement marshal extension module.
+"""
+
+import marshal
+import struct
+
+from cement.core.exc import FrameworkError
+from cement.ext.ext_configparser import ConfigParserConfigHandler
+from cement.utils.misc import minimal_logger
+
+LOG = minimal_logger(__name__)
+
+#: The magic bytes that compiled config files start with.
+MAGIC = b"CFGB"
+
+#: The version of the compiled config file format.
+FORMAT_VERSION = 1
+
+# magic, format version, marshal version
+HEADER = struct.Struct("!4sBB")
+
+
+def dumps(dict_obj):
+    """
+    Encode a configuration dictionary (of sections, as passed to
+    ``ConfigHandler.merge()``) in the compiled config file format.
+
+    Args:
+        dict_obj (dict): The configuration dictionary.
+
+    Returns:
+        bytes: The compiled configuration.
+
+    Raises:
+        cement.core.exc.FrameworkError: If the dictionary holds values that
+            can not be compiled (only builtin types are supported).
+
+    """
+    assert isinstance(dict_obj, dict), "Dictionary object required."
+
+    try:
+        data = marshal.dumps(dict_obj)
+    except ValueError as e:
+        raise FrameworkError("Unable to compile config: %s" % e)
+
+    return HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version) + data
+
+
+def loads(data):
+    """
+    Decode a configuration dictionary from the compiled config file format.
+
+    Args:
+        data (bytes): The compiled configuration.
+
+    Returns:
+        dict: The configuration dictionary.
+
+    Raises:
+        cement.core.exc.FrameworkError: If ``data`` is not a compiled config,
+            or was compiled by a newer version of Cement or Python.
+
+    """
+    try:
+        magic, format_version, marshal_version = HEADER.unpack_from(data)
+    except struct.error:
+        magic = None
+
+    if magic != MAGIC:
+        raise FrameworkError("Data is not a compiled config")
+    elif format_version > FORMAT_VERSION or marshal_version > marshal.version:
+        raise FrameworkError(
+            "Compiled config format %s (marshal version %s) is not supported, "
+            "recompile it" % (format_version, marshal_version)
+        )
+
+    offset = HEADER.size
+    try:
+        return marshal.loads(memoryview(data)[offset:])
+    except (EOFError, ValueError, TypeError) as e:
+        raise FrameworkError("Invalid compiled config: %s" % e)
+
+
+class MarshalConfigHandler(ConfigParserConfigHandler):
+
+    """
+    This class implements the :ref:`Config <cement.core.config>` Handler
+    interface, and provides the same functionality of
+    :ref:`ConfigParserConfigHandler <cement.ext.ext_configparser>`
+    but with compiled (binary) configuration files, that are decoded without
+    any text parsing.  Intended for machine generated configuration, that is
+    read far more often than it is written.
+
+    Configuration files are compiled from INI, Yaml, or JSON configuration
+    files with the ``cement config compile`` command, or by writing the
+    result of ``dumps()`` to a file.  Compiled files are encoded with the
+    Python ``marshal`` module, and must only be read from trusted sources.
+
+    """
+
+    class Meta:
+
+        """Handler meta-data."""
+
+        label = "marshal"
+
+    def _decode_file(self, file_path):
+        """
+        Decode compiled configuration file settings from file_path, without
+        modifying the config.
+
+        Args:
+            file_path (str): The file system path to the compiled
+                configuration file.
+
+        Returns:
+            dict: The decoded configuration.
+
+        """
+        with self._open_file(file_path) as f:
+            data = f.read()
+            if len(data) > 0:
+                try:
+                    return loads(data)
+                except FrameworkError as e:
+                    raise FrameworkError("%s: %s" % (file_path, e.msg))
+
+        return {}
+
+    def _parse_file(self, file_path):
+        """
+        Parse compiled configuration file settings from file_path, overwriting
+        existing config settings.
+
+        Args:
+            file_path (str): The file system path to the compiled
+                configuration file.
+
+        Returns:
+            bool
+
+        """
+        self.merge(self._decode_file(file_path))
+        return True
+
+
+def load(app):
+    app.handler.register(MarshalConfigHandler)
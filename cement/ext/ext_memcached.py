@@ -78,7 +78,7 @@ class MemcachedCacheHandler(cache.CacheHandler):
             value.
 
         """
-        LOG.debug("getting cache value using key '%s'" % key)
+        LOG.debug("getting cache value using key '%s'", args=(key,))
         res = self.mc.get(key, **kw)
         if res is None:
             return fallback
@@ -117,7 +117,7 @@ class MemcachedCacheHandler(cache.CacheHandler):
 
         """
         if time is None:
-            time = int(self._config("expire_time"))
+            time = self.app.config.get_int(self._meta.config_section, "expire_time")
 
         self.mc.set(key, value, time=time, **kw)
 
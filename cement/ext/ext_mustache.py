@@ -72,7 +72,7 @@ class MustacheOutputHandler(OutputHandler):
 
         """
 
-        LOG.debug("rendering content using '%s' as a template." % template)
+        LOG.debug("rendering content using '%s' as a template.", args=(template,))
         content, _type, _path = self.templater.load(template)
         return self.templater.render(content, data)
 
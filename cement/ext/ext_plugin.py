@@ -57,13 +57,15 @@ class CementPluginHandler(plugin.PluginHandler):
             if "enabled" not in self.app.config.keys(plugin_section):
                 continue
             if is_true(self.app.config.get(plugin_section, "enabled")):
-                LOG.debug("enabling plugin '%s' per application config" % plugin)
+                LOG.debug("enabling plugin '%s' per application config", args=(plugin,))
                 if plugin not in self._enabled_plugins:
                     self._enabled_plugins.append(plugin)  # pragma: nocover
                 if plugin in self._disabled_plugins:
                     self._disabled_plugins.remove(plugin)  # pragma: nocover
             else:
-                LOG.debug("disabling plugin '%s' per application config" % plugin)
+                LOG.debug(
+                    "disabling plugin '%s' per application config", args=(plugin,)
+                )
                 if plugin not in self._disabled_plugins:
                     self._disabled_plugins.append(plugin)  # pragma: nocover
                 if plugin in self._enabled_plugins:
@@ -87,17 +89,17 @@ class CementPluginHandler(plugin.PluginHandler):
         #
         # See: https://github.com/datafolklabs/cement/issues/386
 
-        LOG.debug("attempting to load '{}' from '{}'".format(plugin_name, plugin_dir))
+        LOG.debug("attempting to load '%s' from '%s'", args=(plugin_name, plugin_dir))
 
         if not os.path.exists(plugin_dir):
-            LOG.debug("plugin directory '%s' does not exist." % plugin_dir)
+            LOG.debug("plugin directory '%s' does not exist.", args=(plugin_dir,))
             return False
 
         try:
             f, path, desc = imp.find_module(plugin_name, [plugin_dir])
         except ImportError:
             LOG.debug(
-                "plugin '{}' does not exist in '{}'.".format(plugin_name, plugin_dir)
+                "plugin '%s' does not exist in '%s'.", args=(plugin_name, plugin_dir)
             )
             return False
 
@@ -137,11 +139,12 @@ class CementPluginHandler(plugin.PluginHandler):
                 __import__(base_package, globals(), locals(), [], 0)
             except ImportError:
                 LOG.debug(
-                    "unable to import plugin bootstrap module '%s'." % base_package
+                    "unable to import plugin bootstrap module '%s'.",
+                    args=(base_package,),
                 )
                 return False
 
-        LOG.debug("attempting to load '{}' from '{}'".format(plugin_name, base_package))
+        LOG.debug("attempting to load '%s' from '%s'", args=(plugin_name, base_package))
         # We don't catch this because it would make debugging a nightmare
         # FIXME: not sure how to test/cover this
         if full_module not in sys.modules:
@@ -168,7 +171,7 @@ class CementPluginHandler(plugin.PluginHandler):
             cement.core.exc.FrameworkError: If the plugin can not be loaded
 
         """
-        LOG.debug("loading application plugin '%s'" % plugin_name)
+        LOG.debug("loading application plugin '%s'", args=(plugin_name,))
 
         # first attempt to load from plugin_dirs
         for load_dir in self.load_dirs:
@@ -0,0 +1,143 @@
+"""
+Cement prefork extension module.
+"""
+
+import os
+import traceback
+
+from cement.ext.ext_logging import flush_log_queue
+from cement.ext.ext_server import ServerManager, get_config_defaults
+from cement.utils.misc import minimal_logger
+
+LOG = minimal_logger(__name__)
+
+
+class PreforkManager(ServerManager):
+
+    """
+    The manager class that is attached to the application object via
+    ``App.extend()``.  Like the ``ServerManager`` of the server extension,
+    it fully sets up the application once and then receives invocations
+    over a local UNIX socket (see ``cement.ext.ext_server.forward()``).
+    However, each invocation is run in a child process forked from the
+    warm application, so every invocation inherits the setup state
+    copy-on-write while being isolated from all others, and up to
+    ``config['prefork']['max_workers']`` invocations run in parallel.
+
+    Note that calling ``stop()`` from within a command only affects the
+    child process running it, use ``max_requests`` or a signal to stop the
+    parent.
+
+    Usage:
+
+    .. code-block:: python
+
+        with MyApp() as app:
+            if app.argv == ['--serve']:
+                app.prefork.serve()
+            else:
+                app.run()
+
+    """
+
+    class Meta:
+
+        """Prefork meta-data."""
+
+        #: The configuration section holding the prefork settings.
+        config_section = "prefork"
+
+    def __init__(self, app, *args, **kw):
+        super().__init__(app, *args, **kw)
+        self._workers = set()
+
+    def serve(self, path=None, max_requests=None):
+        """
+        Listen on a UNIX socket, and fork a child process to handle each
+        request until ``max_requests`` have been received, or a signal is
+        caught.  Returns once all child processes have exited.
+
+        Keyword Args:
+            path (str): The path of the UNIX socket.  Defaults to
+                ``config['prefork']['socket']``.
+            max_requests (int): The number of requests to handle before
+                returning.  Defaults to ``config['prefork']['max_requests']``
+                (``0`` being unlimited).
+
+        """
+        try:
+            super().serve(path, max_requests)
+        finally:
+            while self._workers:
+                self._reap(block=True)
+
+    def _reap(self, block=False):
+        # collect exited child processes, waiting for one if block is True
+        options = 0 if block else os.WNOHANG
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, options)
+            except ChildProcessError:  # pragma: nocover
+                self._workers.clear()
+                break
+
+            if pid == 0:
+                break
+
+            LOG.debug("prefork worker %s exited with status %s", args=(pid, status))
+            self._workers.discard(pid)
+            if block:
+                break
+
+    def _exit_child(self, exit_code):  # pragma: nocover
+        # os._exit() skips the close hooks, so the records still queued by
+        # async logging must be handled first
+        try:
+            flush_log_queue(self.app)
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _serve_connection(self, conn):
+        max_workers = int(self.app.config.get(self._meta.config_section, "max_workers"))
+
+        self._reap()
+        while len(self._workers) >= max_workers:
+            self._reap(block=True)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: nocover
+            # the child only serves this connection, and must never return
+            # into the accept loop (or run the parent's cleanup)
+            exit_code = 0
+            try:
+                self._socket.close()
+                super()._serve_connection(conn)
+            except BaseException:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                self._exit_child(exit_code)
+
+        LOG.debug("forked prefork worker %s", args=(pid,))
+        self._workers.add(pid)
+
+
+def prefork_extend_app(app):
+    defaults = get_config_defaults(app, "prefork")
+    defaults["prefork"]["max_workers"] = os.cpu_count() or 1
+    app.config.merge(defaults, override=False)
+    app.extend("prefork", PreforkManager(app))
+
+
+def prefork_snapshot(app):
+    app.prefork._snapshot()
+
+
+def load(app):
+    app.hook.register("post_setup", prefork_extend_app, weight=-1)
+
+    # after anything else has added arguments to the root parser
+    app.hook.register("post_setup", prefork_snapshot, weight=100)
@@ -55,12 +55,12 @@ class PrintOutputHandler(output.OutputHandler):
 
         """
         if "out" in data_dict.keys():
-            LOG.debug("rendering content as text via %s" % self.__module__)
+            LOG.debug("rendering content as text via %s", args=(self.__module__,))
             return data_dict["out"] + "\n"
         else:
             LOG.debug(
-                "no 'out' key found in data dict. "
-                "not rendering content via %s" % self.__module__
+                "no 'out' key found in data dict. not rendering content via %s",
+                args=(self.__module__,),
             )
             return None
 
@@ -102,7 +102,7 @@ class PrintDictOutputHandler(output.OutputHandler):
             str: A text string.
 
         """
-        LOG.debug("rendering content as text via %s" % self.__module__)
+        LOG.debug("rendering content as text via %s", args=(self.__module__,))
         out = ""
         for key, val in data_dict.items():
             out = out + "{}: {}\n".format(key, val)
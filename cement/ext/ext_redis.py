@@ -73,7 +73,7 @@ class RedisCacheHandler(cache.CacheHandler):
             value.
 
         """
-        LOG.debug("getting cache value using key '%s'" % key)
+        LOG.debug("getting cache value using key '%s'", args=(key,))
         res = self.r.get(key)
         if res is None:
             return fallback
@@ -94,7 +94,7 @@ class RedisCacheHandler(cache.CacheHandler):
 
         """
         if time is None:
-            time = int(self._config("expire_time"))
+            time = self.app.config.get_int(self._meta.config_section, "expire_time")
 
         if time == 0:
             self.r.set(key, value)
@@ -24,7 +24,7 @@ def extend_scrub(app):
             for regex, replace in app._meta.scrub:
                 text = re.sub(regex, replace, text)
         else:
-            LOG.debug("text is not str > %s" % type(text))
+            LOG.debug("text is not str > %s", args=(type(text),))
         return text
 
     app.extend("scrub", scrub)
@@ -0,0 +1,383 @@
+"""
+Cement server extension module.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import tempfile
+import traceback
+
+from copy import deepcopy
+
+from cement.core.exc import FrameworkError
+from cement.core.meta import MetaMixin
+from cement.utils import fs
+from cement.utils.misc import minimal_logger
+
+LOG = minimal_logger(__name__)
+
+
+def _get_exit_code(code):
+    # translate the code of a SystemExit exception
+    if code is None:
+        return 0
+    elif isinstance(code, int):
+        return code
+    else:
+        print(code, file=sys.stderr)
+        return 1
+
+
+def _read_message(sock_file):
+    line = sock_file.readline()
+    if not line:
+        raise FrameworkError("Connection closed before a message was received")
+    return json.loads(line.decode("utf-8"))
+
+
+def _write_message(sock_file, message):
+    sock_file.write(json.dumps(message).encode("utf-8") + b"\n")
+    sock_file.flush()
+
+
+def _get_runtime_dir():
+    # $XDG_RUNTIME_DIR is private to the user, otherwise fall back to a per
+    # user directory in the temp dir (created with mode 0700 when serving)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    return os.path.join(tempfile.gettempdir(), "cement-%s" % os.getuid())
+
+
+def _check_socket_dir(path):
+    # the directory must not allow another user to replace the socket
+    st = os.stat(path)
+    if st.st_uid not in (0, os.getuid()):
+        raise FrameworkError(
+            "Server socket directory %s is owned by another user" % path
+        )
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not st.st_mode & stat.S_ISVTX:
+        raise FrameworkError(
+            "Server socket directory %s is writable by other users" % path
+        )
+
+
+class ServerManager(MetaMixin):
+
+    """
+    The manager class that is attached to the application object via
+    ``App.extend()``.  It keeps one fully setup application (imports done,
+    handlers setup, parser tree built) warm, and runs it for each argv
+    vector received over a local UNIX socket, returning the exit code and
+    the captured ``stdout``/``stderr`` of each invocation.
+
+    Each request is a single line of JSON (``{"argv": [...], "cwd": "..."}``)
+    and gets a single line of JSON in response
+    (``{"exit_code": 0, "stdout": "...", "stderr": "..."}``).  See
+    ``forward()`` for the client side.
+
+    Output is captured by swapping ``sys.stdout``, ``sys.stderr`` and the
+    streams of the application's console log handlers, so output written
+    directly to the underlying file descriptors (i.e. by a subprocess) is not
+    captured.  Requests are handled one at a time.
+
+    Usage:
+
+    .. code-block:: python
+
+        with MyApp() as app:
+            if app.argv == ['--serve']:
+                app.server.serve()
+            else:
+                app.run()
+
+    """
+
+    class Meta:
+
+        """Server meta-data."""
+
+        #: The configuration section holding the server settings.
+        config_section = "server"
+
+        #: The size of the listen backlog of the server socket.
+        backlog = 16
+
+    def __init__(self, app, *args, **kw):
+        super().__init__(*args, **kw)
+        self.app = app
+        self._args = None
+        self._running = False
+        self._socket = None
+
+    def _snapshot(self):
+        # the root parser, before controllers/commands are added at run time
+        self._args = deepcopy(self.app.args, {id(self.app): self.app})
+
+    def serve(self, path=None, max_requests=None):
+        """
+        Listen on a UNIX socket, and handle requests until ``stop()`` is
+        called (i.e. from within a command), ``max_requests`` have been
+        handled, or a signal is caught.
+
+        Keyword Args:
+            path (str): The path of the UNIX socket.  Defaults to
+                ``config['server']['socket']``, which is in
+                ``$XDG_RUNTIME_DIR`` or else in a private (``0700``) per
+                user directory in the temp dir.  The socket is only
+                accessible by the current user.
+            max_requests (int): The number of requests to handle before
+                returning.  Defaults to ``config['server']['max_requests']``
+                (``0`` being unlimited).
+
+        """
+        section = self._meta.config_section
+        if path is None:
+            path = self.app.config.get(section, "socket")
+        if max_requests is None:
+            max_requests = int(self.app.config.get(section, "max_requests"))
+
+        path = fs.abspath(path)
+        sock_dir = os.path.dirname(path)
+        if not os.path.exists(sock_dir):
+            os.makedirs(sock_dir, mode=0o700)
+        _check_socket_dir(sock_dir)
+        if os.path.exists(path):
+            LOG.debug("removing stale server socket %s", args=(path,))
+            os.remove(path)
+
+        sock = self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # no window where the socket is accessible by other users
+            umask = os.umask(0o077)
+            try:
+                sock.bind(path)
+            finally:
+                os.umask(umask)
+            sock.listen(self._meta.backlog)
+            LOG.debug("serving %s on %s", args=(self.app._meta.label, path))
+
+            self._running = True
+            count = 0
+            while self._running:
+                conn, _addr = sock.accept()
+                with conn:
+                    self._serve_connection(conn)
+
+                count += 1
+                if max_requests and count >= max_requests:
+                    break
+        finally:
+            self._running = False
+            sock.close()
+            if os.path.exists(path):
+                os.remove(path)
+
+    def stop(self):
+        """
+        Stop serving once the current request has been handled.
+        """
+        self._running = False
+
+    def _serve_connection(self, conn):
+        with conn.makefile("rwb") as sock_file:
+            try:
+                request = _read_message(sock_file)
+                argv = request["argv"]
+                assert isinstance(argv, list), "argv must be a list"
+            except Exception as e:
+                LOG.debug("invalid server request: %s", args=(e,))
+                res = dict(exit_code=2, stdout="", stderr="Invalid request: %s\n" % e)
+            else:
+                res = self.handle(argv, cwd=request.get("cwd"))
+            _write_message(sock_file, res)
+
+    def handle(self, argv, cwd=None):
+        """
+        Run the application with ``argv``, capturing its output.
+
+        Args:
+            argv (list): The arguments to run the application with.
+
+        Keyword Args:
+            cwd (str): The directory to run the application in.
+
+        Returns:
+            dict: The ``exit_code``, ``stdout`` and ``stderr`` of the run.
+
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        saved = (sys.stdout, sys.stderr, os.getcwd())
+        streams = self._swap_log_streams(stdout, stderr)
+        sys.stdout = stdout
+        sys.stderr = stderr
+        try:
+            if cwd is not None:
+                os.chdir(cwd)
+            exit_code = self._run(argv)
+        finally:
+            sys.stdout, sys.stderr = saved[0], saved[1]
+            for handler, stream in streams:
+                handler.stream = stream
+            os.chdir(saved[2])
+
+        return dict(
+            exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+        )
+
+    def _swap_log_streams(self, stdout, stderr):
+        # console log handlers hold on to the streams they were created with
+        swapped = []
+        backend = getattr(self.app.log, "backend", None)
+        if not isinstance(backend, logging.Logger):
+            return swapped  # pragma: nocover
+
+        for handler in backend.handlers:
+            if not isinstance(handler, logging.StreamHandler):
+                continue
+            elif isinstance(handler, logging.FileHandler):
+                continue
+            elif handler.stream in (sys.stdout, sys.__stdout__):
+                swapped.append((handler, handler.stream))
+                handler.stream = stdout
+            elif handler.stream in (sys.stderr, sys.__stderr__):
+                swapped.append((handler, handler.stream))
+                handler.stream = stderr
+
+        return swapped
+
+    def _run(self, argv):
+        app = self.app
+        if self._args is None:
+            self._snapshot()  # pragma: nocover
+
+        # handlers overridden at command line (i.e. '-o json') are restored
+        # after the run
+        overrides = {}
+        for i in app._meta.handler_override_options or {}:
+            key = "%s_handler" % i
+            overrides[i] = getattr(app._meta, key, None)
+
+        app._meta.argv = list(argv)
+        app.exit_code = 0
+        app.args = deepcopy(self._args, {id(app): app})
+        app._parsed_args = None
+
+        try:
+            app.run()
+            exit_code = app.exit_code
+        except SystemExit as e:
+            exit_code = _get_exit_code(e.code)
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            for i, handler in overrides.items():
+                if getattr(app._meta, "%s_handler" % i, None) != handler:
+                    setattr(app._meta, "%s_handler" % i, handler)
+                    getattr(app, "_setup_%s_handler" % i)()
+
+        return exit_code
+
+
+def forward(path, argv=None, cwd=None, stdout=None, stderr=None):
+    """
+    Forward an invocation to an application served via
+    ``ServerManager.serve()``, writing its output to ``stdout`` and
+    ``stderr``.  This is intended for a thin client script, that falls back
+    to running the application directly if the server is not available.
+
+    Args:
+        path (str): The path of the UNIX socket.
+
+    Keyword Args:
+        argv (list): The arguments to run the application with.  Defaults
+            to ``sys.argv[1:]``.
+        cwd (str): The directory to run the application in.  Defaults to
+            the current working directory.
+        stdout: A file like object to write output to.  Defaults to
+            ``sys.stdout``.
+        stderr: A file like object to write errors to.  Defaults to
+            ``sys.stderr``.
+
+    Returns:
+        int: The exit code of the invocation.
+
+    Raises:
+        OSError: If the server is not available.
+        PermissionError: If the socket is not owned by the current user.
+
+    Example:
+
+        .. code-block:: python
+
+            import sys
+            from cement.ext.ext_server import forward
+
+            try:
+                sys.exit(forward('/path/to/myapp.sock'))
+            except OSError:
+                from myapp.main import main
+                main()
+
+    """
+    if argv is None:
+        argv = list(sys.argv[1:])
+    if cwd is None:
+        cwd = os.getcwd()
+    if stdout is None:
+        stdout = sys.stdout
+    if stderr is None:
+        stderr = sys.stderr
+
+    path = fs.abspath(path)
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(
+            "Server socket %s is not owned by the current user" % path
+        )
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        sock.connect(path)
+        with sock.makefile("rwb") as sock_file:
+            _write_message(sock_file, dict(argv=list(argv), cwd=cwd))
+            res = _read_message(sock_file)
+
+    stdout.write(res["stdout"])
+    stderr.write(res["stderr"])
+    return res["exit_code"]
+
+
+def get_config_defaults(app, section):
+    """
+    Returns the default settings of a server config ``section``.
+    """
+    defaults = {}
+    defaults[section] = {}
+    defaults[section]["socket"] = os.path.join(
+        _get_runtime_dir(), "%s-%s.sock" % (app._meta.label, section)
+    )
+    defaults[section]["max_requests"] = 0
+    return defaults
+
+
+def server_extend_app(app):
+    app.config.merge(get_config_defaults(app, "server"), override=False)
+    app.extend("server", ServerManager(app))
+
+
+def server_snapshot(app):
+    app.server._snapshot()
+
+
+def load(app):
+    app.hook.register("post_setup", server_extend_app, weight=-1)
+
+    # after anything else has added arguments to the root parser
+    app.hook.register("post_setup", server_snapshot, weight=100)
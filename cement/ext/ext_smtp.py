@@ -9,7 +9,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from cement.core import mail
-from cement.utils.misc import is_true, minimal_logger
+from cement.utils.misc import minimal_logger
 
 import socks
 
@@ -55,38 +55,25 @@ class SMTPMailHandler(mail.MailHandler):
 
     def _get_params(self, **kw):
         params = {}
+        section = self._meta.config_section
+        config = self.app.config
 
         # some keyword args override configuration defaults
-        for item in ["to", "from_addr", "cc", "bcc", "subject", "password"]:
-            config_item = self.app.config.get(self._meta.config_section, item)
-            params[item] = kw.get(item, config_item)
+        for item in ["to", "cc", "bcc"]:
+            params[item] = kw.get(item, config.get_list(section, item))
+
+        for item in ["from_addr", "subject", "password"]:
+            params[item] = kw.get(item, config.get(section, item))
 
         # others don't
-        other_params = [
-            "proxy",
-            "proxy_host",
-            "proxy_port",
-            "ssl",
-            "tls",
-            "host",
-            "port",
-            "auth",
-            "username",
-            "timeout",
-        ]
-
-        for item in other_params:
-            value = self.app.config.get(self._meta.config_section, item)
-
-            if item in ("proxy_port", "port", "timeout"):
-                params[item] = int(value)
-            else:
-                params[item] = value
-
-        # also grab the subject_prefix
-        params["subject_prefix"] = self.app.config.get(
-            self._meta.config_section, "subject_prefix"
-        )
+        for item in ["proxy", "ssl", "tls", "auth"]:
+            params[item] = config.get_bool(section, item)
+
+        for item in ["proxy_port", "port", "timeout"]:
+            params[item] = config.get_int(section, item)
+
+        for item in ["proxy_host", "host", "username", "subject_prefix"]:
+            params[item] = config.get(section, item)
 
         return params
 
@@ -127,26 +114,26 @@ class SMTPMailHandler(mail.MailHandler):
         params = self._get_params(**kw)
 
         # proxy connection
-        if is_true(params["proxy"]):
+        if params["proxy"]:
             socks.set_default_proxy(
                 socks.HTTP, addr=params["proxy_host"], port=params["proxy_port"]
             )
             socks.wrap_module(smtplib)
 
         # SMTP server connection
-        if is_true(params["ssl"]):
+        if params["ssl"]:
             server = smtplib.SMTP_SSL(
                 host=params["host"], port=params["port"], timeout=params["timeout"]
             )
-            LOG.debug(f"{self._meta.label} : initiating ssl")
-        elif is_true(params["tls"]):
+            LOG.debug("%s : initiating ssl", args=(self._meta.label,))
+        elif params["tls"]:
             server = smtplib.SMTP(
                 host=params["host"], port=params["port"], timeout=params["timeout"]
             )
             server.ehlo()
             server.starttls()
             server.ehlo()
-            LOG.debug(f"{self._meta.label} : initiating tls")
+            LOG.debug("%s : initiating tls", args=(self._meta.label,))
         else:
             server = smtplib.SMTP(
                 host=params["host"], port=params["port"], timeout=params["timeout"]
@@ -157,7 +144,7 @@ class SMTPMailHandler(mail.MailHandler):
             if self.app.debug is True:
                 server.set_debuglevel(9)
 
-            if is_true(params["auth"]):
+            if params["auth"]:
                 server.login(params["username"], params["password"])
 
             self._send_message(server, body, **params)
@@ -14,6 +14,9 @@ from watchdog.observers import Observer
 
 LOG = minimal_logger(__name__)
 
+# marks settings that are not defined
+_MISSING = object()
+
 
 class WatchdogEventHandler(FileSystemEventHandler):
     """
@@ -33,6 +36,32 @@ class WatchdogEventHandler(FileSystemEventHandler):
         self.app.log.debug("Watchdog Event: %s" % event)  # pragma: nocover
 
 
+class WatchdogConfigEventHandler(WatchdogEventHandler):
+    """
+    Event handler used by ``WatchdogManager.watch_config()``, that reloads
+    the application's configuration files when they change.  Only events
+    that change a file (created, modified, moved) are handled, as reading a
+    file when reloading it fires (opened, closed) events as well.
+
+    :param app: The application object
+
+    """
+
+    def _reload_config(self, event, path):
+        if not event.is_directory and self.app.watchdog.is_config_file(path):
+            self.app.watchdog.reload_config(path)
+
+    def on_created(self, event):
+        self._reload_config(event, event.src_path)
+
+    def on_modified(self, event):
+        self._reload_config(event, event.src_path)
+
+    def on_moved(self, event):
+        # files replaced by editors are often moved into place
+        self._reload_config(event, event.dest_path)
+
+
 class WatchdogManager(MetaMixin):
     """
     The manager class that is attached to the application object via
@@ -47,6 +76,10 @@ class WatchdogManager(MetaMixin):
             app.watchdog.stop()
             app.watchdog.join()
 
+    Setting ``App.Meta.watchdog_config = True`` monitors the application's
+    configuration files, and applies changes to them without a full
+    ``App.reload()`` (see ``reload_config()``).
+
     """
 
     class Meta:
@@ -62,6 +95,10 @@ class WatchdogManager(MetaMixin):
         self.paths = []
         self.observer = self._meta.observer()
 
+        # the decoded settings of each watched config file, by path, in the
+        # order of precedence
+        self._config_files = None
+
     def add(self, path, event_handler=None, recursive=True):
         """
         Add a directory path and event handler to the observer.
@@ -80,27 +117,196 @@ class WatchdogManager(MetaMixin):
         """
         path = fs.abspath(path)
         if not os.path.exists(path):
-            LOG.debug("watchdog path %s does not exist... ignoring" % path)
+            LOG.debug("watchdog path %s does not exist... ignoring", args=(path,))
             return False
 
         if event_handler is None:
             event_handler = self._meta.default_event_handler
-        LOG.debug("adding path {} with event handler {}".format(path, event_handler))
+        LOG.debug("adding path %s with event handler %s", args=(path, event_handler))
         self.observer.schedule(event_handler(self.app), path, recursive=recursive)
         return True
 
+    def watch_config(self):
+        """
+        Monitor the application's configuration files (``App.Meta.config_files``),
+        and reload a file's settings when it changes.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the config handler does not
+                support decoding files (see
+                ``cement.core.config.ConfigHandler._decode_file()``).
+
+        """
+        self._config_files = {}
+        for path in self.app._meta.config_files:
+            path = fs.abspath(path)
+            decoded = self._decode_config_file(path)
+            if decoded is None:
+                raise FrameworkError(
+                    "Unable to watch config file '%s' with the %s config handler"
+                    % (path, self.app.config._meta.label)
+                )
+            self._config_files[path] = decoded
+
+        dirs = []
+        for path in self._config_files:
+            if os.path.dirname(path) not in dirs:
+                dirs.append(os.path.dirname(path))
+
+        for path in dirs:
+            self.add(path, WatchdogConfigEventHandler, recursive=False)
+
+    def is_config_file(self, path):
+        """
+        Return whether or not ``path`` is a watched configuration file.
+
+        Args:
+            path (str): The file system path.
+
+        Returns:
+            bool: ``True`` if ``path`` is watched, ``False`` otherwise.
+
+        """
+        if self._config_files is None:
+            return False
+        return fs.abspath(path) in self._config_files
+
+    def _decode_config_file(self, path):
+        if not os.path.exists(path):
+            return {}
+        return self.app.config._decode_file(path)
+
+    def _get_section_dict(self, decoded, section):
+        values = decoded.get(section)
+        if not isinstance(values, dict):
+            return {}
+        return values
+
+    def _defines(self, path, section, key):
+        return key in self._get_section_dict(self._config_files[path], section)
+
+    def _get_defined(self, paths, section, key, default=None):
+        # the value of the first config file in paths that defines the key
+        for path in paths:
+            if self._defines(path, section, key):
+                return self._config_files[path][section][key]
+        return default
+
+    def _get_config(self, section, key, default=None):
+        config = self.app.config
+        if config.has_section(section) and key in config.keys(section):
+            return config.get(section, key)
+        return default
+
+    def _get_default(self, section, key, default=None):
+        # the value of App.Meta.config_defaults, otherwise of the
+        # config_defaults of the handler owning the section (i.e. 'log.logging')
+        app_defaults = self.app._meta.config_defaults or {}
+        if isinstance(app_defaults.get(section), dict):
+            if key in app_defaults[section]:
+                return app_defaults[section][key]
+
+        interface, _sep, label = section.partition(".")
+        if not self.app.handler.registered(interface, label):
+            return default
+        handler = self.app.handler.resolve(interface, label)
+        if handler._meta.config_section not in (None, section):
+            return default
+        return (handler._meta.config_defaults or {}).get(key, default)
+
+    def _diff_config(self, path, old, new):
+        # yield the (section, key, value) settings to apply, when the decoded
+        # config file at path changed from old to new
+        paths = list(self._config_files)
+        index = paths.index(path)
+        earlier = list(reversed(paths[:index]))
+        later = paths[index:][1:]
+
+        for section in dict.fromkeys(list(new) + list(old)):
+            new_values = self._get_section_dict(new, section)
+            old_values = self._get_section_dict(old, section)
+            for key in dict.fromkeys(list(new_values) + list(old_values)):
+                if any(self._defines(p, section, key) for p in later):
+                    continue
+
+                value = new_values.get(key, _MISSING)
+                if value is _MISSING:
+                    value = self._get_defined(earlier, section, key, _MISSING)
+                if value is _MISSING:
+                    value = self._get_default(section, key, _MISSING)
+                if value is not _MISSING:
+                    yield section, key, value
+
+    def _set_config(self, section, key, value):
+        # set a config setting, and return whether or not it changed
+        before = self._get_config(section, key, _MISSING)
+        if not self.app.config.has_section(section):
+            self.app.config.add_section(section)
+        self.app.config.set(section, key, value)
+
+        # environment variables still take precedence
+        return self._get_config(section, key) != before
+
+    def _fire_config_changed(self, path, changes):
+        if changes:
+            LOG.debug("config file '%s' changed: %s", args=(path, changes))
+            self.app.hook.fire("config_changed", self.app, changes)
+
+    def reload_config(self, path):
+        """
+        Re-parse a watched configuration file, and apply the settings that
+        changed (added, modified, or removed) since it was last parsed.  The
+        order of precedence is honored: settings also defined in a later
+        config file are not applied, and removed settings revert to the value
+        of an earlier config file, or else to their default
+        (``App.Meta.config_defaults``, or the ``config_defaults`` of the
+        handler owning the section).  Removed settings without a default are
+        left unchanged.  If any setting changed, the ``config_changed`` hook is
+        run with the application object and a dictionary of changed keys by
+        section (i.e. ``{'log.logging': ['level']}``).
+
+        Note that when called by the watchdog observer, the config is
+        modified, and the hook is run, in the observer's thread.
+
+        Args:
+            path (str): The file system path of the configuration file.
+
+        Returns:
+            dict: The changed keys by section.
+
+        """
+        path = fs.abspath(path)
+        if not self.is_config_file(path):
+            raise FrameworkError("Config file '%s' is not watched" % path)
+
+        old = self._config_files[path]
+        new = self._decode_config_file(path)
+        if new is None:
+            self.app.log.warning(
+                "Unable to reload config file '%s', use App.reload() instead" % path
+            )
+            return {}
+
+        self._config_files[path] = new
+
+        changes = {}
+        for section, key, value in self._diff_config(path, old, new):
+            if self._set_config(section, key, value):
+                changes.setdefault(section, []).append(key)
+
+        self._fire_config_changed(path, changes)
+        return changes
+
     def start(self, *args, **kw):
         """
         Start the observer.  All ``*args`` and ``**kwargs`` are passed down
         to the backend observer.
         """
 
-        for _result in self.app.hook.run("watchdog_pre_start", self.app):
-            pass
+        self.app.hook.fire("watchdog_pre_start", self.app)
         LOG.debug("starting watchdog observer")
         self.observer.start(*args, **kw)
-        for _result in self.app.hook.run("watchdog_post_start", self.app):
-            pass
+        self.app.hook.fire("watchdog_post_start", self.app)
 
     def stop(self, *args, **kw):
         """
@@ -108,12 +314,10 @@ class WatchdogManager(MetaMixin):
         to the backend observer.
         """
 
-        for _result in self.app.hook.run("watchdog_pre_stop", self.app):
-            pass
+        self.app.hook.fire("watchdog_pre_stop", self.app)
         LOG.debug("stopping watchdog observer")
         self.observer.stop(*args, **kw)
-        for _result in self.app.hook.run("watchdog_post_stop", self.app):
-            pass
+        self.app.hook.fire("watchdog_post_stop", self.app)
 
     def join(self, *args, **kw):
         """
@@ -121,12 +325,10 @@ class WatchdogManager(MetaMixin):
         ``**kwargs`` are passed down to the backend observer.
         """
 
-        for _result in self.app.hook.run("watchdog_pre_join", self.app):
-            pass
+        self.app.hook.fire("watchdog_pre_join", self.app)
         LOG.debug("joining watchdog observer")
         self.observer.join(*args, **kw)
-        for _result in self.app.hook.run("watchdog_post_join", self.app):
-            pass
+        self.app.hook.fire("watchdog_post_join", self.app)
 
 
 def watchdog_extend_app(app):
@@ -144,6 +346,9 @@ def watchdog_cleanup(app):
 
 
 def watchdog_add_paths(app):
+    if getattr(app._meta, "watchdog_config", False) is True:
+        app.watchdog.watch_config()
+
     if hasattr(app._meta, "watchdog_paths"):
         for path_spec in app._meta.watchdog_paths:
             # odd... if a tuple is a single item it ends up as a str?
@@ -2,6 +2,8 @@
 Cement yaml extension module.
 """
 
+import os
+
 from cement.core import output
 from cement.ext.ext_configparser import ConfigParserConfigHandler
 from cement.utils.misc import minimal_logger
@@ -10,6 +12,9 @@ import yaml
 
 LOG = minimal_logger(__name__)
 
+#: The default pyYaml Loaders, in order of preference.
+LOADERS = ["CFullLoader", "FullLoader", "Loader"]
+
 
 def suppress_output_before_run(app):
     """
@@ -105,7 +110,7 @@ class YamlOutputHandler(output.OutputHandler):
             str: A Yaml encoded string.
 
         """
-        LOG.debug("rendering output as yaml via %s" % self.__module__)
+        LOG.debug("rendering output as yaml via %s", args=(self.__module__,))
         return yaml.dump(data_dict, **kw)
 
 
@@ -124,20 +129,53 @@ class YamlConfigHandler(ConfigParserConfigHandler):
     does *not* include external dependencies for optional extensions.
 
     Due to changes in pyYaml version 5.1 to deprecate `yaml.load` without
-    specifying a `Loader=...`, this class will attempt to parse the yaml
-    content with the 5.1 sugar method `full_load`, falling back to the
-    "unsafe" call for versions prior to 5.1.  The `full_load` method uses
-    the FullLoader, which is the default Loader when none is provided.  See
+    specifying a `Loader=...`, this class will parse the yaml content with
+    the `FullLoader` (the libyaml based `CFullLoader` when available),
+    falling back to the "unsafe" `Loader` for versions prior to 5.1.  See
     the pyYaml message on this deprecation: https://msg.pyyaml.org/load
+    Set ``Meta.loader`` to i.e. `CSafeLoader` to only allow standard YAML
+    tags.
 
     """
 
     class Meta:
         label = "yaml"
 
+        #: The pyYaml Loader class (or the name of one in the ``yaml``
+        #: module, i.e. ``CSafeLoader``) used to parse config files.
+        #: Defaults to ``CFullLoader``, ``FullLoader`` or ``Loader``,
+        #: whichever is available first.
+        loader = None
+
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
 
+    def _decode_file(self, file_path):
+        """
+        Decode Yaml configuration file settings from file_path, without
+        modifying the config.
+
+        Args:
+            file_path (str): The file system path to the Yaml configuration
+                             file.
+
+        Returns:
+            dict: The decoded configuration.
+
+        """
+        loader = self._meta.loader
+        if loader is None:
+            loader = next(x for x in LOADERS if hasattr(yaml, x))
+        if isinstance(loader, str):
+            loader = getattr(yaml, loader)
+
+        # decoded as a stream, rather than reading the whole file first
+        with self._open_file(file_path) as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                return yaml.load(f, Loader=loader)
+
+        return {}
+
     def _parse_file(self, file_path):
         """
         Parse Yaml configuration file settings from file_path, overwriting
@@ -148,13 +186,7 @@ class YamlConfigHandler(ConfigParserConfigHandler):
                              file.
 
         """
-        yaml_load = yaml.full_load if hasattr(yaml, "full_load") else yaml.load
-
-        with open(file_path, "r") as f:
-            content = f.read()
-            if content is not None and len(content) > 0:
-                self.merge(yaml_load(content))
-
+        self.merge(self._decode_file(file_path))
         return True
 
 
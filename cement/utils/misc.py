@@ -40,6 +40,25 @@ def rando(salt=None):
 
 
 class MinimalLogger:
+
+    """
+    The logger used by the Cement framework (see ``minimal_logger()``).
+
+    Whether framework logging is enabled (per the
+    ``CEMENT_FRAMEWORK_LOGGING`` environment variable) is resolved once, and
+    shared by all instances until ``refresh()`` is called, so that log calls
+    made while disabled return without reading the environment.  Messages
+    are ``%`` formatted with ``args`` only when logged, so callers should
+    pass arguments rather than formatting messages themselves:
+
+    .. code-block:: python
+
+        LOG.debug("setting up %s handler", args=(label,))
+
+    """
+
+    _enabled = None
+
     def __init__(self, namespace, debug, *args, **kw):
         self.namespace = namespace
         self.backend = logging.getLogger(namespace)
@@ -60,6 +79,26 @@ class MinimalLogger:
 
         self.backend.addHandler(console)
 
+        if MinimalLogger._enabled is None:
+            MinimalLogger.refresh()
+
+    @classmethod
+    def refresh(cls):
+        """
+        Resolve whether framework logging is enabled from the
+        ``CEMENT_FRAMEWORK_LOGGING`` environment variable, for all instances.
+        Must be called after modifying the environment variable.
+        """
+        if "CEMENT_FRAMEWORK_LOGGING" in os.environ.keys():
+            if is_true(os.environ["CEMENT_FRAMEWORK_LOGGING"]):
+                enabled = True
+            else:
+                enabled = False
+        else:
+            enabled = True  # pragma: nocover
+
+        MinimalLogger._enabled = enabled
+
     def _get_logging_kwargs(self, namespace, **kw):
         if not namespace:
             namespace = self.namespace
@@ -75,40 +114,32 @@ class MinimalLogger:
 
     @property
     def logging_is_enabled(self):
-        if "CEMENT_FRAMEWORK_LOGGING" in os.environ.keys():
-            if is_true(os.environ["CEMENT_FRAMEWORK_LOGGING"]):
-                res = True
-            else:
-                res = False
-        else:
-            res = True  # pragma: nocover
+        return MinimalLogger._enabled
 
-        return res
+    def _log(self, level, msg, args, namespace, kw):
+        if self.backend.isEnabledFor(level):
+            kwargs = self._get_logging_kwargs(namespace, **kw)
+            self.backend.log(level, msg, *args, **kwargs)
 
-    def info(self, msg, namespace=None, **kw):
+    def info(self, msg, namespace=None, args=(), **kw):
         if self.logging_is_enabled:
-            kwargs = self._get_logging_kwargs(namespace, **kw)
-            self.backend.info(msg, **kwargs)
+            self._log(logging.INFO, msg, args, namespace, kw)
 
-    def warning(self, msg, namespace=None, **kw):
+    def warning(self, msg, namespace=None, args=(), **kw):
         if self.logging_is_enabled:
-            kwargs = self._get_logging_kwargs(namespace, **kw)
-            self.backend.warning(msg, **kwargs)
+            self._log(logging.WARNING, msg, args, namespace, kw)
 
-    def error(self, msg, namespace=None, **kw):
+    def error(self, msg, namespace=None, args=(), **kw):
         if self.logging_is_enabled:
-            kwargs = self._get_logging_kwargs(namespace, **kw)
-            self.backend.error(msg, **kwargs)
+            self._log(logging.ERROR, msg, args, namespace, kw)
 
-    def fatal(self, msg, namespace=None, **kw):
+    def fatal(self, msg, namespace=None, args=(), **kw):
         if self.logging_is_enabled:
-            kwargs = self._get_logging_kwargs(namespace, **kw)
-            self.backend.fatal(msg, **kwargs)
+            self._log(logging.FATAL, msg, args, namespace, kw)
 
-    def debug(self, msg, namespace=None, **kw):
+    def debug(self, msg, namespace=None, args=(), **kw):
         if self.logging_is_enabled:
-            kwargs = self._get_logging_kwargs(namespace, **kw)
-            self.backend.debug(msg, **kwargs)
+            self._log(logging.DEBUG, msg, args, namespace, kw)
 
 
 def init_defaults(*sections):
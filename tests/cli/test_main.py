@@ -1,6 +1,8 @@
 import os
 
 from cement.cli.main import CementTestApp as App, main
+from cement.core.exc import FrameworkError
+from cement.ext.ext_marshal import loads
 from cement.utils.test import raises
 
 
@@ -24,3 +26,34 @@ def test_generate(tmp):
         app.run()
 
         assert os.path.exists(os.path.join(tmp.dir, "setup.py"))
+
+
+def test_config_compile(tmp):
+    ini = os.path.join(tmp.dir, "test.conf")
+    with open(ini, "w") as f:
+        f.write("[DEFAULT]\nkey = default\n[section]\nfoo = bar\n")
+
+    yml = os.path.join(tmp.dir, "test.yml")
+    with open(yml, "w") as f:
+        f.write("section:\n  foo: 1\n")
+
+    with App(argv=["config", "compile", ini]) as app:
+        app.run()
+
+    with open(os.path.join(tmp.dir, "test.cfgb"), "rb") as f:
+        assert loads(f.read()) == {"section": {"key": "default", "foo": "bar"}}
+
+    output = os.path.join(tmp.dir, "other.cfgb")
+    with App(argv=["config", "compile", yml, "-o", output]) as app:
+        app.run()
+
+    with open(output, "rb") as f:
+        assert loads(f.read()) == {"section": {"foo": 1}}
+
+    with raises(FrameworkError, match="requires a single source file"):
+        with App(argv=["config", "compile", ini, yml, "-o", output]) as app:
+            app.run()
+
+    with raises(FrameworkError, match="does not exist"):
+        with App(argv=["config", "compile", ini + ".bogus"]) as app:
+            app.run()
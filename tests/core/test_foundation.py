@@ -4,10 +4,12 @@ import platform
 import re
 import signal
 import sys
+import time
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 from cement import App, Controller, ex
+from cement.core.config import ConfigHandler
 from cement.core.exc import CaughtSignal, FrameworkError
 from cement.core.foundation import (
     TestApp,
@@ -17,6 +19,7 @@ from cement.core.foundation import (
 )
 from cement.core.handler import Handler
 from cement.core.interface import Interface
+from cement.ext.ext_configparser import ConfigParserConfigHandler
 from cement.utils import fs, misc, test
 from cement.utils.misc import init_defaults, minimal_logger
 
@@ -667,6 +670,202 @@ def test_config_dirs(tmp, rando):
         assert app.config.get(app._meta.label, "foo") == rando
 
 
+def test_config_snapshot(tmp, rando):
+    conf_path = os.path.join(tmp.dir, "test.conf")
+    snapshot_dir = os.path.join(tmp.dir, "cache")
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf_path]
+            config_snapshot = True
+            config_snapshot_dir = snapshot_dir
+
+    with open(conf_path, "w") as f:
+        f.write("[%s]\nfoo = bar\n\n[section]\nkey = value\n" % rando)
+
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "bar"
+    assert os.path.exists(os.path.join(snapshot_dir, "config.snapshot"))
+
+    # subsequent startups load the snapshot instead of parsing the files
+    with patch.object(ConfigParserConfigHandler, "_parse_file") as parse_file:
+        with ThisTestApp() as app:
+            assert app.config.get(rando, "foo") == "bar"
+            assert app.config.get("section", "key") == "value"
+            assert not parse_file.called
+
+    # the snapshot is rebuilt once a config file changes
+    with open(conf_path, "w") as f:
+        f.write("[%s]\nfoo = changed\n" % rando)
+
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "changed"
+
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "changed"
+        assert "section" not in app.config.get_sections()
+
+
+def test_config_snapshot_unsupported(tmp):
+    class ThisConfigHandler(ConfigParserConfigHandler):
+        class Meta:
+            label = "this_config"
+
+        def _get_snapshot(self):
+            return None
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            config_handler = "this_config"
+            handlers = [ThisConfigHandler]
+            config_snapshot = True
+            config_snapshot_dir = tmp.dir
+
+    with ThisTestApp() as app:
+        assert app.config._meta.label == "this_config"
+    assert not os.path.exists(os.path.join(tmp.dir, "config.snapshot"))
+
+
+def test_config_snapshot_load_unsupported(tmp, rando):
+    conf_path = os.path.join(tmp.dir, "%s.conf" % rando)
+    with open(conf_path, "w") as f:
+        f.write("[%s]\nfoo = bar\n" % rando)
+
+    class ThisConfigHandler(ConfigParserConfigHandler):
+        class Meta:
+            label = "this_config"
+
+        parsed = []
+
+        _load_snapshot = ConfigHandler._load_snapshot
+
+        def parse_file(self, file_path):
+            self.parsed.append(file_path)
+            return super().parse_file(file_path)
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_handler = "this_config"
+            config_files = [conf_path]
+            handlers = [ThisConfigHandler]
+            config_snapshot = True
+            config_snapshot_dir = tmp.dir
+
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "bar"
+    assert os.path.exists(os.path.join(tmp.dir, "config.snapshot"))
+    assert ThisConfigHandler.parsed == [conf_path]
+
+    # the config files are parsed instead
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "bar"
+    assert ThisConfigHandler.parsed == [conf_path, conf_path]
+
+
+def test_config_parse_workers(tmp, rando):
+    for i in range(20):
+        with open(os.path.join(tmp.dir, "%02d.conf" % i), "w") as f:
+            f.write("[%s]\nfoo = %s\nfile%s = %s\n" % (rando, i, i, i))
+            f.write("[section%s]\nkey = value\n" % (i % 3))
+
+    # can't be merged, so parsed in order
+    with open(os.path.join(tmp.dir, "10.conf"), "a") as f:
+        f.write("[DEFAULT]\ndefault_key = default\n")
+
+    def get_config(workers):
+        class ThisTestApp(TestApp):
+            class Meta:
+                label = rando
+                config_dirs = [tmp.dir]
+                config_parse_workers = workers
+
+        with ThisTestApp() as app:
+            return app.config._defaults, app.config.get_dict()
+
+    defaults, config = get_config(4)
+    assert (defaults, config) == get_config(None)
+    assert defaults == {"default_key": "default"}
+    assert config[rando]["foo"] == "19"
+    assert config["section2"]["key"] == "value"
+
+
+def test_config_profile(tmp, rando, capsys):
+    conf1 = os.path.join(tmp.dir, "1.conf")
+    conf2 = os.path.join(tmp.dir, "2.conf")
+    with open(conf1, "w") as f:
+        f.write("[%s]\nfoo = 1\nbar = 1\n" % rando)
+    with open(conf2, "w") as f:
+        f.write("[%s]\nfoo = 2\nbar = 1\nbaz = 2\n" % rando)
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf1, conf2, os.path.join(tmp.dir, "missing.conf")]
+            config_profile_argument_options = ["--config-profile"]
+
+    with ThisTestApp() as app:
+        assert app.config.profile is None
+
+    env_var = "%s_FOO" % rando.upper().replace("-", "_")
+    os.environ[env_var] = "3"
+    try:
+        with ThisTestApp(argv=["--config-profile"]) as app:
+            app.run()
+            assert app.config.get(rando, "foo") == "3"
+
+            profile = app.config.profile
+            assert [x["path"] for x in profile.files] == [conf1, conf2]
+            assert profile.files[0]["keys"] == [(rando, "foo"), (rando, "bar")]
+            assert profile.files[0]["size"] == os.path.getsize(conf1)
+            assert profile.files[1]["keys"] == [(rando, "foo"), (rando, "baz")]
+            assert profile.files[1]["overrides"] == [(rando, "foo")]
+            assert profile.env_overrides == {env_var: (rando, "foo")}
+    finally:
+        del os.environ[env_var]
+
+    err = capsys.readouterr().err
+    assert "Config Profile:" in err
+    assert "overrides %s.foo" % rando in err
+    assert "%s overrides %s.foo" % (env_var, rando) in err
+
+
+def test_config_dirs_cache(tmp, rando):
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_dirs = [tmp.dir]
+            config_dirs_cache = True
+
+    def write(name, value, mtime):
+        with open(os.path.join(tmp.dir, name), "w") as f:
+            f.write("[%s]\nfoo = %s\n" % (rando, value))
+        os.utime(tmp.dir, ns=(mtime, mtime))
+
+    write("1.conf", "1", 1000000000 * 10 ** 9)
+    with ThisTestApp() as app:
+        assert app.config.get(rando, "foo") == "1"
+        assert tmp.dir in app._config_dirs_cache
+
+        # unchanged directories are not listed again
+        write("2.conf", "2", 1000000000 * 10 ** 9)
+        app.reload()
+        assert app.config.get(rando, "foo") == "1"
+
+        write("3.conf", "3", 1000000001 * 10 ** 9)
+        app.reload()
+        assert app.config.get(rando, "foo") == "3"
+
+        # recently modified directories are not cached
+        write("4.conf", "4", time.time_ns())
+        app.reload()
+        assert app.config.get(rando, "foo") == "4"
+        write("5.conf", "5", os.stat(tmp.dir).st_mtime_ns)
+        app.reload()
+        assert app.config.get(rando, "foo") == "5"
+
+
 def test_core_system_template_dirs(tmp, rando):
     class ThisTestApp(TestApp):
         class Meta:
@@ -731,3 +930,108 @@ def test_plugin_dirs(tmp, rando):
     with ThisTestApp() as app:
         app.run()
         assert tmp.dir in app._meta.plugin_dirs
+
+
+def test_lazy_handlers():
+    from cement.core.handler import LazyHandler
+    from cement.ext.ext_dummy import DummyMailHandler, DummyOutputHandler
+
+    class MyApp(TestApp):
+        class Meta:
+            lazy_handlers = ["mail", "output", "cache", "template"]
+
+    with MyApp() as app:
+        # not resolved during setup
+        assert isinstance(app.mail, LazyHandler)
+        assert "unresolved" in repr(app.mail)
+        assert isinstance(app.template, LazyHandler)
+
+        # resolved and setup on first access
+        mail = app.mail
+        assert mail._meta.label == "dummy"
+        assert mail.app is app
+        assert isinstance(app.mail, DummyMailHandler)
+
+        # render resolves the output handler
+        app.render(dict(foo="bar"))
+        assert isinstance(app.output, DummyOutputHandler)
+
+        # no cache handler was defined
+        assert app.cache is None
+
+
+def test_lazy_handlers_unresolvable():
+    from cement.core.handler import LazyHandler
+
+    with TestApp(lazy_handlers=["output"], output_handler=object()) as app:
+        assert isinstance(app.output, LazyHandler)
+        assert not app.output
+        assert app.render(dict(foo="bar")) == ""
+
+
+def test_async_app():
+    import asyncio
+
+    from cement import AsyncApp
+
+    calls = []
+
+    async def pre_run_hook(app):
+        calls.append(("pre_run", asyncio.get_event_loop() is app.loop))
+
+    async def post_run_hook(app):
+        calls.append(("post_run", asyncio.get_event_loop() is app.loop))
+
+    async def pre_close_hook(app):
+        calls.append(("pre_close", asyncio.get_event_loop() is app.loop))
+
+    class Base(Controller):
+        class Meta:
+            label = "base"
+
+        @ex()
+        async def cmd1(self):
+            await asyncio.sleep(0)
+            calls.append(("cmd1", asyncio.get_event_loop() is self.app.loop))
+            return "cmd1"
+
+        @ex()
+        def cmd2(self):
+            return "cmd2"
+
+    class MyApp(AsyncApp, TestApp):
+        class Meta:
+            handlers = [Base]
+            hooks = [
+                ("pre_run", pre_run_hook),
+                ("post_run", post_run_hook),
+                ("pre_close", pre_close_hook),
+            ]
+
+    with MyApp(argv=["cmd1"]) as app:
+        assert app.run() == "cmd1"
+        loop = app.loop
+    assert loop.is_closed()
+    assert calls == [
+        ("pre_run", True),
+        ("cmd1", True),
+        ("post_run", True),
+        ("pre_close", True),
+    ]
+
+    # regular commands work as well
+    with MyApp(argv=["cmd2"]) as app:
+        assert app.run() == "cmd2"
+
+
+def test_async_app_close_without_setup():
+    from cement import AsyncApp
+
+    class MyApp(AsyncApp, TestApp):
+        pass
+
+    # closes like App does, without an event loop
+    app = MyApp()
+    assert app.loop is None
+    app.close()
+    assert app.loop is None
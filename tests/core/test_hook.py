@@ -1,5 +1,7 @@
 """Tests for cement.core.hook."""
 
+import asyncio
+
 from unittest.mock import Mock
 
 from cement.core.exc import FrameworkError
@@ -56,6 +58,118 @@ def test_register_and_run():
         assert results == ["kapla 3", "kapla 2", "kapla 1"]
 
 
+def test_register_keeps_weight_order():
+    def hook_one():
+        return "kapla 1"
+
+    def hook_two():
+        return "kapla 2"
+
+    def hook_three():
+        return "kapla 3"
+
+    with TestApp() as app:
+        app.hook.define("test_hook")
+        app.hook.register("test_hook", hook_one, weight=10)
+        app.hook.register("test_hook", hook_two)
+        app.hook.register("test_hook", hook_three, weight=10)
+
+        # sorted at registration, equal weights in order of registration
+        weights = [(x[0], x[1]) for x in app.hook.__hooks__["test_hook"]]
+        assert weights == [(0, "hook_two"), (10, "hook_one"), (10, "hook_three")]
+        assert list(app.hook.run("test_hook")) == ["kapla 2", "kapla 1", "kapla 3"]
+
+        # registering invalidates the compiled hook functions
+        app.hook.register("test_hook", hook_three, weight=-10)
+        res = list(app.hook.run("test_hook"))
+        assert res == ["kapla 3", "kapla 2", "kapla 1", "kapla 3"]
+
+
+def test_reset():
+    def hook_one():
+        return "kapla 1"
+
+    with TestApp() as app:
+        app.hook.define("test_hook")
+        app.hook.register("test_hook", hook_one)
+        assert list(app.hook.run("test_hook")) == ["kapla 1"]
+
+        # hook functions registered before the reset no longer run
+        app._unlay_cement()
+        assert not app.hook.defined("test_hook")
+        app.hook.define("test_hook")
+        assert list(app.hook.run("test_hook")) == []
+
+        app._lay_cement()
+        app.setup()
+
+
+def test_fire():
+    results = []
+
+    def hook_one(app, res):
+        results.append(res)
+
+    def hook_two(app, res):
+        # generators are exhausted even though results are discarded
+        for i in range(2):
+            results.append(res)
+            yield i
+
+    with TestApp() as app:
+        app.hook.define("test_hook")
+        app.hook.register("test_hook", hook_two, weight=1)
+        app.hook.register("test_hook", hook_one)
+        assert app.hook.fire("test_hook", app, "kapla") is None
+        assert results == ["kapla"] * 3
+
+        with raises(FrameworkError, match="Hook name .* is not defined!"):
+            app.hook.fire("some_bogus_hook")
+
+
+def test_run_async():
+    async def hook_one(app, events):
+        # only completes if hook_two runs concurrently (same weight)
+        events["one"].set()
+        await asyncio.wait_for(events["two"].wait(), 5)
+        return "kapla 1"
+
+    async def hook_two(app, events):
+        events["two"].set()
+        await asyncio.wait_for(events["one"].wait(), 5)
+        return "kapla 2"
+
+    def hook_three(app, events):
+        # lower weight, must run after both the above have completed
+        assert events["one"].is_set() and events["two"].is_set()
+        return "kapla 3"
+
+    def hook_four(app, events):
+        yield "kapla 4"
+        yield "kapla 5"
+
+    async def main(app):
+        events = dict(one=asyncio.Event(), two=asyncio.Event())
+        return await app.hook.run_async("test_hook", app, events)
+
+    with TestApp() as app:
+        app.hook.define("test_hook")
+        app.hook.register("test_hook", hook_three, weight=1)
+        app.hook.register("test_hook", hook_one)
+        app.hook.register("test_hook", hook_four, weight=2)
+        app.hook.register("test_hook", hook_two)
+
+        loop = asyncio.new_event_loop()
+        try:
+            res = loop.run_until_complete(main(app))
+            assert res == ["kapla 1", "kapla 2", "kapla 3", "kapla 4", "kapla 5"]
+
+            with raises(FrameworkError, match="Hook name .* is not defined!"):
+                loop.run_until_complete(app.hook.run_async("some_bogus_hook"))
+        finally:
+            loop.close()
+
+
 def test_register_hook_name_not_defined():
     with TestApp() as app:
         ret = app.hook.register("bogus_hook", print)
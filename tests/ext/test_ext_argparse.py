@@ -1,15 +1,20 @@
 import sys
+import time
 
 from argparse import ArgumentError
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from cement.core.exc import FrameworkError
 from cement.core.foundation import TestApp
+from cement.ext import ext_argparse
 from cement.ext.ext_argparse import (
     ArgparseArgumentHandler,
     ArgparseController,
+    LazyController,
     _clean_func,
     _clean_label,
+    _resolve_controller_order,
     expose,
 )
 
@@ -546,6 +551,43 @@ def test_get_exposed_commands():
         assert "cmd2-two" in app.controller._get_exposed_commands()
 
 
+def test_command_registry():
+    class CommandMixin:
+        @expose()
+        def mixin_cmd(self):
+            pass
+
+    class Parent(ArgparseController, CommandMixin):
+        class Meta:
+            label = "base"
+
+        @expose()
+        def cmd1(self):
+            pass
+
+        @expose()
+        def cmd2(self):
+            pass
+
+    class Child(Parent):
+        # no longer exposed
+        def cmd2(self):
+            pass
+
+    assert sorted(Parent.__cement_commands__) == ["cmd1", "cmd2", "mixin_cmd"]
+    assert sorted(Child.__cement_commands__) == ["cmd1", "mixin_cmd"]
+
+    with TestApp(handlers=[Child]) as app:
+        app.run()
+        cmds = app.controller._collect_commands()
+        assert [x["label"] for x in cmds] == ["cmd1", "mixin-cmd"]
+        assert all(x["controller"] is app.controller for x in cmds)
+        assert app.controller._collect_commands() is cmds
+
+        # the class level meta-data is not bound to an instance
+        assert Child.__cement_commands__["cmd1"]["controller"] is None
+
+
 def test_hide_help():
     class MyController(ArgparseController):
         class Meta:
@@ -561,3 +603,289 @@ def test_hide_help():
             # help='should not be visible' should not
             # get sent to the parser if hide=True
             mock.assert_called_once_with("hidden")
+
+
+def test_parser_cache():
+    class CachedBase(ArgparseController):
+        class Meta:
+            label = "base"
+            parser_cache = True
+            arguments = [(["--foo"], dict(dest="foo"))]
+
+    class CachedSecond(ArgparseController):
+        class Meta:
+            label = "second"
+            stacked_on = "base"
+            stacked_type = "nested"
+
+        @expose(arguments=[(["--bar"], dict(dest="bar", type=int))])
+        def cmd(self):
+            return self.app.pargs.bar
+
+    ext_argparse._PARSER_CACHE.clear()
+    handlers = [CachedBase, CachedSecond]
+    argv = ["second", "cmd", "--bar", "2"]
+
+    process_commands = patch.object(
+        ArgparseController,
+        "_process_commands",
+        autospec=True,
+        side_effect=ArgparseController._process_commands,
+    )
+
+    with process_commands as mock:
+        with TestApp(handlers=handlers, argv=argv) as app:
+            assert app.run() == 2
+            first_args = app.args
+        assert mock.call_count == 2
+    assert len(ext_argparse._PARSER_CACHE) == 1
+
+    # second app reuses the cached tree, bound to the new app
+    with process_commands as mock:
+        with TestApp(handlers=handlers, argv=argv + ["--bar", "3"]) as app:
+            assert app.run() == 3
+            assert app.args is first_args
+            assert app.args.app is app
+            assert app.controller._parser is app.args
+        assert not mock.called
+    assert len(ext_argparse._PARSER_CACHE) == 1
+
+    # a different controller set gets its own tree
+    with TestApp(handlers=[CachedBase], argv=["--foo", "bar"]) as app:
+        app.run()
+        assert app.pargs.foo == "bar"
+    assert len(ext_argparse._PARSER_CACHE) == 2
+
+
+def test_parser_cache_lambda_type():
+    class CachedBase(ArgparseController):
+        class Meta:
+            label = "base"
+            parser_cache = True
+            arguments = [(["--foo"], dict(dest="foo", type=lambda x: x.upper()))]
+
+    ext_argparse._PARSER_CACHE.clear()
+    for i in range(2):
+        with TestApp(handlers=[CachedBase], argv=["--foo", "bar"]) as app:
+            app.run()
+            assert app.pargs.foo == "BAR"
+        assert len(ext_argparse._PARSER_CACHE) == 1
+
+
+def test_parser_cache_pre_argument_parsing():
+    class CachedBase(ArgparseController):
+        class Meta:
+            label = "base"
+            parser_cache = True
+
+        def _pre_argument_parsing(self):
+            self._parser.add_argument("--foo", dest="foo")
+
+    ext_argparse._PARSER_CACHE.clear()
+    for i in range(2):
+        with TestApp(handlers=[CachedBase], argv=["--foo", "bar"]) as app:
+            app.run()
+            assert app.pargs.foo == "bar"
+    assert len(ext_argparse._PARSER_CACHE) == 0
+
+
+class LazyFirst(ArgparseController):
+    class Meta:
+        label = "lazy_first"
+        aliases = ["lf"]
+        stacked_on = "base"
+        stacked_type = "nested"
+
+    @expose()
+    def cmd1(self):
+        return "lazy-first-cmd1"
+
+
+class LazyEmbedded(ArgparseController):
+    class Meta:
+        label = "lazy_embedded"
+        stacked_on = "base"
+        stacked_type = "embedded"
+
+
+class LazySecond(ArgparseController):
+    class Meta:
+        label = "lazy_second"
+        stacked_on = "lazy_first"
+        stacked_type = "nested"
+
+    @expose()
+    def cmd2(self):
+        return "lazy-second-cmd2"
+
+
+def _lazy_base(*lazy_controllers):
+    class LazyBase(ArgparseController):
+        class Meta:
+            label = "base"
+            arguments = [
+                (["--foo"], dict()),
+                (["--flag"], dict(action="store_true")),
+            ]
+
+        @expose(arguments=[(["value"], dict())])
+        def echo(self):
+            return self.app.pargs.value
+
+    LazyBase.Meta.lazy_controllers = list(lazy_controllers)
+    return LazyBase
+
+
+def test_lazy_controllers(capsys):
+    LazyBase = _lazy_base(
+        LazyController(
+            "lazy_first",
+            "tests.ext.test_ext_argparse.LazyFirst",
+            help="lazy first help",
+            aliases=["lf"],
+        )
+    )
+
+    # not on the command line, only a placeholder is listed in --help
+    with TestApp(handlers=[LazyBase], argv=["--help"]) as app:
+        with raises(SystemExit):
+            app.run()
+        assert not app.handler.registered("controller", "lazy_first")
+    assert "lazy first help" in capsys.readouterr().out
+
+    with TestApp(handlers=[LazyBase], argv=["lazy-first", "cmd1"]) as app:
+        assert app.run() == "lazy-first-cmd1"
+        assert app.handler.registered("controller", "lazy_first")
+
+    with TestApp(handlers=[LazyBase], argv=["lf", "cmd1"]) as app:
+        assert app.run() == "lazy-first-cmd1"
+
+
+def test_lazy_controllers_nested():
+    LazyBase = _lazy_base(
+        LazyController("lazy_first", "tests.ext.test_ext_argparse.LazyFirst"),
+        LazyController(
+            "lazy_second",
+            "tests.ext.test_ext_argparse.LazySecond",
+            stacked_on="lazy_first",
+        ),
+        LazyController(
+            "lazy_orphan", "tests.ext.test_ext_argparse.Bogus", stacked_on="bogus"
+        ),
+    )
+
+    # the label of a nested lazy controller as a positional value loads it
+    # along with the lazy controller it is stacked on
+    with TestApp(handlers=[LazyBase], argv=["echo", "lazy-second"]) as app:
+        assert app.run() == "lazy-second"
+        assert app.handler.registered("controller", "lazy_first")
+        assert app.handler.registered("controller", "lazy_second")
+
+    with TestApp(
+        handlers=[LazyBase], argv=["lazy-first", "lazy-second", "cmd2"]
+    ) as app:
+        assert app.run() == "lazy-second-cmd2"
+
+    # not stacked on a registered (or lazy) controller
+    with TestApp(handlers=[LazyBase], argv=["echo", "lazy-orphan"]) as app:
+        assert app.run() == "lazy-orphan"
+        assert not app.handler.registered("controller", "lazy_orphan")
+
+
+def test_lazy_controllers_option_values():
+    LazyBase = _lazy_base(
+        LazyController("lazy_first", "tests.ext.test_ext_argparse.LazyFirst")
+    )
+
+    # option values are not controller labels
+    for argv in [["--foo", "lazy-first"], ["--foo=lazy-first"]]:
+        with TestApp(handlers=[LazyBase], argv=argv + ["echo", "lf"]) as app:
+            assert app.run() == "lf"
+            assert not app.handler.registered("controller", "lazy_first")
+
+    with TestApp(handlers=[LazyBase], argv=["--flag", "lazy-first", "cmd1"]) as app:
+        assert app.run() == "lazy-first-cmd1"
+        assert app.handler.registered("controller", "lazy_first")
+
+
+def test_lazy_controllers_invalid():
+    specs = [
+        LazyController("lazy_first", "LazyFirst"),
+        LazyController("lazy_first", "tests.ext.bogus_module.LazyFirst"),
+        LazyController("lazy_first", "tests.ext.test_ext_argparse.Bogus"),
+        LazyController("bogus", "tests.ext.test_ext_argparse.LazyFirst"),
+        LazyController("lazy_embedded", "tests.ext.test_ext_argparse.LazyEmbedded"),
+    ]
+    for spec in specs:
+        LazyBase = _lazy_base(spec)
+        argv = [_clean_label(spec.label)]
+        with TestApp(handlers=[LazyBase], argv=argv) as app:
+            with raises(FrameworkError):
+                app.run()
+
+
+def _fake_controller(label, stacked_on, stacked_type):
+    meta = SimpleNamespace(
+        label=label, stacked_on=stacked_on, stacked_type=stacked_type
+    )
+    return SimpleNamespace(_meta=meta)
+
+
+def test_resolve_controller_order():
+    contrs = [
+        _fake_controller("grandchild", "nested1", "nested"),
+        _fake_controller("nested1", "base", "nested"),
+        _fake_controller("embedded1", "base", "embedded"),
+        _fake_controller("nested2", "base", "nested"),
+        _fake_controller("embedded2", "nested1", "embedded"),
+        _fake_controller("great_grandchild", "grandchild", "nested"),
+    ]
+    res = [x._meta.label for x in _resolve_controller_order("base", contrs)]
+    assert res == [
+        "nested2",
+        "nested1",
+        "embedded1",
+        "grandchild",
+        "embedded2",
+        "great_grandchild",
+    ]
+
+    contrs.append(_fake_controller("orphan", "bogus", "nested"))
+    msg = "orphan \\(stacked on bogus\\)"
+    with raises(FrameworkError, match=msg):
+        _resolve_controller_order("base", contrs)
+
+
+def test_resolve_controller_order_scaling():
+    def _time(count):
+        # ten levels deep, registered in reverse
+        contrs = []
+        for i in range(count):
+            stacked_on = "base" if i < count // 10 else "c%s" % (i - count // 10)
+            stacked_type = "nested" if i % 2 else "embedded"
+            contrs.append(_fake_controller("c%s" % i, stacked_on, stacked_type))
+        contrs.reverse()
+
+        best = None
+        for i in range(3):
+            start = time.perf_counter()
+            res = _resolve_controller_order("base", contrs)
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        assert len(res) == count
+        return best
+
+    # linear is ~4x, quadratic would be ~16x
+    assert _time(4000) < _time(1000) * 10
+
+
+def test_unresolvable_controller():
+    class Orphan(ArgparseController):
+        class Meta:
+            label = "orphan"
+            stacked_on = "bogus"
+            stacked_type = "nested"
+
+    with TestApp(handlers=[Base, Orphan]) as app:
+        with raises(FrameworkError, match="orphan"):
+            app.run()
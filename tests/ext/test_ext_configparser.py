@@ -1,8 +1,11 @@
 import os
 
+from cement.core.exc import FrameworkError
 from cement.core.foundation import TestApp
 from cement.ext.ext_configparser import ConfigParserConfigHandler
 
+from pytest import raises
+
 # module tests
 
 
@@ -67,3 +70,109 @@ def test_get_boolean():
 
         os.environ["TESTAPP_FOOBOOL"] = "1"
         assert app.config["testapp"].getboolean("foobool") is True
+
+
+def test_env_var_override_changes():
+    with TestApp(config_section="testapp") as app:
+        app.config.set("testapp", "changes", "1")
+        assert app.config.get("testapp", "changes") == "1"
+        assert app.config.get_int("testapp", "changes") == 1
+
+        # environment changes take effect on the next lookup
+        os.environ["TESTAPP_CHANGES"] = "2"
+        assert app.config.get("testapp", "changes") == "2"
+        assert app.config.get_int("testapp", "changes") == 2
+
+        del os.environ["TESTAPP_CHANGES"]
+        assert app.config.get("testapp", "changes") == "1"
+        assert app.config.get_int("testapp", "changes") == 1
+
+
+def test_typed_accessors():
+    with TestApp(config_section="testapp") as app:
+        app.config.merge(
+            {
+                "typed": {
+                    "int": "10",
+                    "float": 1.5,
+                    "bool": "yes",
+                    "list": "a, b,,c",
+                    "default_list": ["x"],
+                    "bad": "not-a-number",
+                }
+            }
+        )
+        assert app.config.get_int("typed", "int") == 10
+        assert app.config.get_float("typed", "float") == 1.5
+        assert app.config.get_bool("typed", "bool") is True
+        assert app.config.get_list("typed", "list") == ["a", "b", "c"]
+        assert app.config.get_list("typed", "default_list") == ["x"]
+
+        # results are cached, but returned lists are copies
+        assert (
+            app.config._get_converted_key("typed", "int", int) in app.config._converted
+        )
+        app.config.get_list("typed", "default_list").append("y")
+        assert app.config.get_list("typed", "default_list") == ["x"]
+
+        # until the config is modified
+        app.config.set("typed", "int", "20")
+        assert app.config.get_int("typed", "int") == 20
+        app.config.merge({"typed": {"bool": "off"}})
+        assert app.config.get_bool("typed", "bool") is False
+
+        os.environ["TESTAPP_TYPED_INT"] = "30"
+        assert app.config.get_int("typed", "int") == 30
+        del os.environ["TESTAPP_TYPED_INT"]
+
+        with raises(FrameworkError, match="not a valid int"):
+            app.config.get_int("typed", "bad")
+
+
+def test_merge_fast_path():
+    def merged(merge, override):
+        h = ConfigParserConfigHandler()
+        h.read_string("[DEFAULT]\ndefault_key = default\n[existing]\nfoo = bar\n")
+        dict_obj = {
+            "existing": {"foo": "new", "Foo": "upper", "baz": 1, "default_key": 2},
+            "new": {"Mixed": "case", "mixed": "lower", "list": ["a"]},
+            "not_a_section": "value",
+        }
+        getattr(h, merge)(dict_obj, override=override)
+        return h._defaults, h._sections
+
+    for override in [True, False]:
+        assert merged("merge", override) == merged("_merge", override)
+
+    # the default section is handled by set()
+    h = ConfigParserConfigHandler()
+    h.merge({"": {"key": "value"}})
+    assert h._defaults == {"key": "value"}
+    with raises(ValueError):
+        h.merge({"DEFAULT": {"key": "value"}})
+
+
+def test_merge_with_custom_set():
+    class MyConfigHandler(ConfigParserConfigHandler):
+        class Meta:
+            label = "my_config_handler"
+
+        def set(self, section, key, value):
+            super().set(section, key, "custom-%s" % value)
+
+    h = MyConfigHandler()
+    h.merge({"section": {"key": "value"}})
+    assert h._sections["section"] == {"key": "custom-value"}
+
+
+def test_max_file_size(tmp):
+    with open(tmp.file, "w") as f:
+        f.write("[section]\nkey = value\n")
+
+    with TestApp(config_files=[tmp.file]) as app:
+        assert app.config.get("section", "key") == "value"
+
+    meta_defaults = {"config.configparser": {"max_file_size": 10}}
+    with raises(FrameworkError, match="exceeding the maximum of 10 bytes"):
+        with TestApp(config_files=[tmp.file], meta_defaults=meta_defaults):
+            pass
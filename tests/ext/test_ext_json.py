@@ -3,8 +3,9 @@ import os
 
 from unittest.mock import patch
 
+from cement.core.exc import FrameworkError
 from cement.utils import fs
-from cement.utils.test import TestApp
+from cement.utils.test import TestApp, raises
 
 CONFIG_PARSED = dict(
     section=dict(
@@ -52,6 +53,13 @@ def test_parse_file_bad_path(parser):
         assert not parser.called
 
 
+def test_max_file_size():
+    meta_defaults = {"config.json": {"max_file_size": 10}}
+    with raises(FrameworkError, match="exceeding the maximum of 10 bytes"):
+        with JsonApp(meta_defaults=meta_defaults):
+            pass
+
+
 def test_parse_file():
     with JsonApp() as app:
         assert app.config.get("section", "key1") == "ok1"
@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import socket
+
+from cement.ext.ext_jsonlog import JsonFormatter
+from cement.utils.misc import init_defaults
+from cement.utils.test import TestApp
+
+
+class JsonLogApp(TestApp):
+    class Meta:
+        extensions = ["jsonlog"]
+        log_handler = "jsonlog"
+
+
+def _read_log(log_file):
+    with open(log_file, "r") as f:
+        return [json.loads(line) for line in f.readlines()]
+
+
+def test_jsonlog(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.jsonlog")
+    defaults["log.jsonlog"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.jsonlog")
+    meta["log.jsonlog"]["static_fields"] = dict(env="test")
+
+    with JsonLogApp(config_defaults=defaults, meta_defaults=meta) as app:
+        app.log.info("info message")
+        app.log.debug("debug message")
+        app.log.warning("warning message", "my.namespace", extra=dict(user="me"))
+        try:
+            raise Exception("failed")
+        except Exception:
+            app.log.error("error message", exc_info=True)
+        label = app._meta.label
+
+    logs = _read_log(log_file)
+    assert len(logs) == 3
+    assert logs[0]["app"] == label
+    assert logs[0]["host"] == socket.gethostname()
+    assert logs[0]["pid"] == os.getpid()
+    assert logs[0]["env"] == "test"
+    assert logs[0]["namespace"] == label
+    assert logs[0]["level"] == "INFO"
+    assert logs[0]["message"] == "info message"
+    assert "time" in logs[0].keys()
+
+    assert logs[1]["namespace"] == "my.namespace"
+    assert logs[1]["user"] == "me"
+    assert logs[2]["exc_info"].endswith("Exception: failed")
+
+
+def test_json_module(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.jsonlog")
+    defaults["log.jsonlog"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.jsonlog")
+    meta["log.jsonlog"]["json_module"] = "orjson"
+
+    with JsonLogApp(config_defaults=defaults, meta_defaults=meta) as app:
+        # values that are not serializable are logged as strings
+        app.log.info("info message", extra=dict(obj=object))
+
+    logs = _read_log(log_file)
+    assert logs[0]["message"] == "info message"
+    assert logs[0]["obj"] == str(object)
+
+
+def test_json_formatter():
+    # the pid of forked processes differs from the static pid
+    formatter = JsonFormatter(json, static_fields=dict(pid=1))
+    record = logging.makeLogRecord(dict(msg="message %s", args=("arg",)))
+    data = json.loads(formatter.format(record))
+    assert data["pid"] == os.getpid()
+    assert data["message"] == "message arg"
+    assert "namespace" not in data.keys()
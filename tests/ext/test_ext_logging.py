@@ -1,9 +1,14 @@
 import logging
+import logging.handlers
 import os
 import shutil
 
 from cement.core.foundation import TestApp
-from cement.ext.ext_logging import LoggingLogHandler
+from cement.ext.ext_logging import (
+    LoggingLogHandler,
+    RateLimitFilter,
+    handle_rate_limit_config_changed,
+)
 from cement.utils.misc import init_defaults
 
 from pytest import raises
@@ -128,3 +133,204 @@ def test_log_level_argument():
     with raises(SystemExit):
         with TestApp(argv=["-l", "debug"]) as app:
             app.run()
+
+
+def test_async_logging(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.logging")
+    defaults["log.logging"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.logging")
+    meta["log.logging"]["async_logging"] = True
+
+    with TestApp(config_defaults=defaults, meta_defaults=meta) as app:
+        backend = app.log.backend
+        assert len(backend.handlers) == 1
+        assert isinstance(backend.handlers[0], logging.handlers.QueueHandler)
+        handlers = app.log._queue_listener.handlers
+        assert any(isinstance(x, logging.FileHandler) for x in handlers)
+
+        app.log.info("async message 1")
+        app.log.debug("suppressed message")
+
+        # records are flushed and the handlers restored on reconfiguration
+        app.log.set_level("DEBUG")
+        with open(log_file, "r") as f:
+            assert "async message 1" in f.read()
+        assert app.log._queue_listener is not None
+
+        app.log.debug("async message 2", extra=dict(foo="bar"))
+
+    # and on close
+    assert app.log._queue_listener is None
+    assert not any(
+        isinstance(x, logging.handlers.QueueHandler) for x in backend.handlers
+    )
+    with open(log_file, "r") as f:
+        logs = f.read()
+        assert "async message 2" in logs
+        assert "suppressed message" not in logs
+
+
+def test_logging_kwargs(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.logging")
+    defaults["log.logging"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.logging")
+    meta["log.logging"]["file_format"] = "{namespace} {user} {request}: {message}"
+    meta["log.logging"]["attribute_formats"] = dict(request="[{request:>4}]")
+
+    with TestApp(config_defaults=defaults, meta_defaults=meta) as app:
+        kw = app.log._get_logging_kwargs(None, user="me", request=42)
+        assert kw == dict(
+            extra=dict(namespace=app._meta.label, user="me", request="[  42]")
+        )
+
+        kw = app.log._get_logging_kwargs("ns", extra=dict(user="you"))
+        assert kw == dict(extra=dict(namespace="ns", user="you", request=""))
+
+        # kwargs are not built for suppressed levels
+        app.log._get_logging_kwargs = None
+        app.log.debug("suppressed", user="me")
+
+    with open(log_file, "r") as f:
+        assert "suppressed" not in f.read()
+
+
+def test_rate_limit_filter():
+    record = logging.makeLogRecord(
+        dict(levelname="INFO", levelno=logging.INFO, namespace="ns")
+    )
+
+    # 1 in 3 records are sampled
+    filter = RateLimitFilter(sample_rate=3)
+    res = [filter.filter(record) for i in range(7)]
+    assert res == [True, False, False, True, False, False, True]
+    assert filter.suppressed == {("ns", "INFO"): 4}
+
+    # burst of 2, then (practically) nothing until tokens are refilled
+    filter = RateLimitFilter(rate_limit=0.001, burst=2)
+    res = [filter.filter(record) for i in range(4)]
+    assert res == [True, True, False, False]
+    filter._buckets[("ns", "INFO")][2] -= 1000
+    assert filter.filter(record) is True
+
+    # per namespace and level
+    other = logging.makeLogRecord(
+        dict(levelname="DEBUG", levelno=logging.DEBUG, namespace="ns")
+    )
+    assert filter.filter(other) is True
+    assert filter.suppressed == {("ns", "INFO"): 2}
+
+
+def test_rate_limit_filter_levels():
+    def passed(filter, levelname, count=10):
+        levelno = getattr(logging, levelname)
+        record = logging.makeLogRecord(
+            dict(levelname=levelname, levelno=levelno, namespace="ns")
+        )
+        return len([x for x in range(count) if filter.filter(record)])
+
+    # warnings and above are never suppressed by default
+    filter = RateLimitFilter(sample_rate=10, rate_limit=0.001, burst=1)
+    assert passed(filter, "INFO") == 1
+    assert passed(filter, "WARNING") == 10
+    assert passed(filter, "ERROR") == 10
+    assert passed(filter, "CRITICAL") == 10
+    assert list(filter.suppressed) == [("ns", "INFO")]
+
+    # unless there is no exempt level
+    filter = RateLimitFilter(sample_rate=10, exempt_level=None)
+    assert passed(filter, "ERROR") == 1
+
+    # or the level has limits of its own
+    filter = RateLimitFilter(
+        sample_rate=10,
+        levels={logging.DEBUG: dict(sample_rate=2), logging.ERROR: dict(rate_limit=3)},
+    )
+    assert passed(filter, "DEBUG") == 5
+    assert passed(filter, "INFO") == 1
+    assert passed(filter, "ERROR") == 1
+    assert passed(filter, "CRITICAL") == 10
+
+    filter = RateLimitFilter(levels={logging.ERROR: dict(rate_limit=0.001, burst=3)})
+    assert passed(filter, "ERROR") == 3
+    assert passed(filter, "INFO") == 10
+
+
+def test_rate_limit(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.logging")
+    defaults["log.logging"] = dict(
+        file=log_file,
+        to_console=False,
+        sample_rate=10,
+        rate_limit=1000,
+        sample_rate_error=20,
+    )
+
+    with TestApp(config_defaults=defaults) as app:
+        for i in range(100):
+            app.log.error("error message")
+            app.log.info("info message")
+            app.log.info("info message", "my.namespace")
+            app.log.warning("warning message")
+
+        label = app._meta.label
+        assert app.log.get_suppressed() == {
+            (label, "ERROR"): 95,
+            (label, "INFO"): 90,
+            ("my.namespace", "INFO"): 90,
+        }
+
+        # settings are applied when changed by a reloaded config file
+        app.config.set("log.logging", "sample_rate", 1)
+        handle_rate_limit_config_changed(app, {"log.logging": ["sample_rate"]})
+        app.log.info("info message")
+        assert app.log.get_suppressed()[(label, "INFO")] == 90
+
+        app.config.set("log.logging", "sample_rate_error", 1)
+        handle_rate_limit_config_changed(app, {"log.logging": ["sample_rate_error"]})
+        app.log.error("error message")
+        assert app.log.get_suppressed()[(label, "ERROR")] == 95
+
+    with open(log_file, "r") as f:
+        logs = f.readlines()
+
+    assert len([x for x in logs if "error message" in x]) == 6
+    assert len([x for x in logs if "info message" in x]) == 21
+    assert len([x for x in logs if "warning message" in x]) == 100
+    assert "suppressed 95 ERROR log records" in logs[-3]
+    assert "suppressed 90 INFO log records" in logs[-2]
+    assert "suppressed 90 INFO log records" in logs[-1]
+    assert "my.namespace" in logs[-1]
+    assert app.log.get_suppressed() == {}
+
+
+def test_async_logging_fork(tmp):
+    log_file = os.path.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.logging")
+    defaults["log.logging"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.logging")
+    meta["log.logging"]["async_logging"] = True
+
+    with TestApp(config_defaults=defaults, meta_defaults=meta) as app:
+        app.log.info("parent message")
+
+        pid = os.fork()
+        if pid == 0:  # pragma: nocover
+            exit_code = 0
+            try:
+                app.log.info("child message")
+                app.close()
+            except BaseException:
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        assert status == 0
+
+    with open(log_file, "r") as f:
+        logs = f.read()
+        assert logs.count("parent message") == 1
+        assert logs.count("child message") == 1
@@ -0,0 +1,57 @@
+import marshal
+
+from cement.core.exc import FrameworkError
+from cement.ext.ext_marshal import HEADER, MAGIC, dumps, loads
+from cement.utils import fs
+from cement.utils.test import TestApp, raises
+
+CONFIG = dict(
+    section=dict(
+        subsection=dict(list=["item1", "item2"], key="value"),
+        key1="ok1",
+        key2=2,
+    )
+)
+
+
+class MarshalApp(TestApp):
+    class Meta:
+        extensions = ["marshal"]
+        config_handler = "marshal"
+        config_file_suffix = ".cfgb"
+
+
+def test_dumps_loads():
+    assert loads(dumps(CONFIG)) == CONFIG
+
+    with raises(FrameworkError, match="Unable to compile config"):
+        dumps(dict(section=dict(key=object())))
+
+    with raises(FrameworkError, match="not a compiled config"):
+        loads(b"[section]\nkey = value\n")
+
+    with raises(FrameworkError, match="recompile it"):
+        loads(HEADER.pack(MAGIC, 1, marshal.version + 1) + marshal.dumps({}))
+
+    with raises(FrameworkError, match="Invalid compiled config"):
+        loads(dumps(CONFIG)[:-4])
+
+
+def test_parse_file(tmp):
+    path = fs.join(tmp.dir, "config.cfgb")
+    with open(path, "wb") as f:
+        f.write(dumps(CONFIG))
+
+    with MarshalApp(config_files=[path]) as app:
+        assert app.config.get("section", "key1") == "ok1"
+        assert app.config.get_int("section", "key2") == 2
+        assert app.config.get_section_dict("section") == CONFIG["section"]
+
+        # empty files are skipped
+        open(path, "wb").close()
+        assert app.config._decode_file(path) == {}
+
+        with open(path, "w") as f:
+            f.write("bogus")
+        with raises(FrameworkError, match="config.cfgb: Data is not a compiled"):
+            app.config.parse_file(path)
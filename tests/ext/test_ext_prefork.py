@@ -0,0 +1,141 @@
+import io
+import logging
+import os
+import threading
+import time
+
+from cement import Controller, ex
+from cement.ext.ext_server import forward
+from cement.utils import fs
+from cement.utils.misc import init_defaults
+from cement.utils.test import TestApp
+
+
+class Base(Controller):
+    class Meta:
+        label = "base"
+        arguments = [(["--path"], dict(dest="path"))]
+
+    @ex()
+    def pid(self):
+        print(os.getpid())
+
+    @ex()
+    def set_value(self):
+        self.app.config.set("prefork", "value", "changed")
+
+    @ex()
+    def get_value(self):
+        print(self.app.config.get("prefork", "value"))
+
+    @ex()
+    def touch(self):
+        open(self.app.pargs.path, "w").close()
+
+    @ex()
+    def log(self):
+        for i in range(500):
+            self.app.log.info("prefork message %s" % i)
+
+    @ex()
+    def wait(self):
+        for i in range(100):
+            if os.path.exists(self.app.pargs.path):
+                return
+            time.sleep(0.05)
+        self.app.exit_code = 1
+
+
+class PreforkApp(TestApp):
+    class Meta:
+        extensions = ["prefork"]
+        handlers = [Base]
+
+
+def _forward(path, argv):
+    stdout = io.StringIO()
+    res = forward(path, argv, stdout=stdout, stderr=io.StringIO())
+    return res, stdout.getvalue()
+
+
+def test_prefork(tmp):
+    path = fs.join(tmp.dir, "prefork.sock")
+    touch_path = fs.join(tmp.dir, "touched")
+
+    with PreforkApp() as app:
+        app.config.set("prefork", "max_workers", 2)
+        app.config.set("prefork", "value", "original")
+
+        kwargs = dict(path=path, max_requests=6)
+        thread = threading.Thread(target=app.prefork.serve, kwargs=kwargs, daemon=True)
+        thread.start()
+        for i in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+
+        # each invocation runs in its own child process
+        res1, pid1 = _forward(path, ["pid"])
+        res2, pid2 = _forward(path, ["pid"])
+        assert res1 == res2 == 0
+        assert len({pid1, pid2, str(os.getpid())}) == 3
+
+        # and is isolated from the others
+        assert _forward(path, ["set-value"]) == (0, "")
+        assert _forward(path, ["get-value"]) == (0, "original\n")
+
+        # invocations run in parallel (wait only returns once touched)
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                _forward(path, ["--path", touch_path, "wait"])
+            )
+        )
+        waiter.start()
+        time.sleep(0.2)
+        assert _forward(path, ["--path", touch_path, "touch"]) == (0, "")
+        waiter.join(10)
+        assert results == [(0, "")]
+
+        thread.join(10)
+        assert not thread.is_alive()
+        assert not os.path.exists(path)
+        assert app.prefork._workers == set()
+
+
+def test_prefork_async_logging(tmp):
+    path = fs.join(tmp.dir, "prefork.sock")
+    log_file = fs.join(tmp.dir, "test.log")
+    defaults = init_defaults("log.logging")
+    defaults["log.logging"] = dict(file=log_file, to_console=False)
+    meta = init_defaults("log.logging")
+    meta["log.logging"]["async_logging"] = True
+
+    with PreforkApp(config_defaults=defaults, meta_defaults=meta) as app:
+        # records are handled (much) slower than they are logged
+        handler = app.log._queue_listener.handlers[-1]
+        assert isinstance(handler, logging.FileHandler)
+        emit = handler.emit
+
+        def slow_emit(record):
+            time.sleep(0.001)
+            emit(record)
+
+        handler.emit = slow_emit
+
+        kwargs = dict(path=path, max_requests=1)
+        thread = threading.Thread(target=app.prefork.serve, kwargs=kwargs, daemon=True)
+        thread.start()
+        for i in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+
+        assert _forward(path, ["log"]) == (0, "")
+        thread.join(10)
+        assert app.prefork._workers == set()
+
+    # every record queued by the child is written before it exits
+    with open(log_file, "r") as f:
+        logs = f.read()
+    assert logs.count("prefork message") == 500
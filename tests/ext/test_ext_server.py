@@ -0,0 +1,160 @@
+import io
+import os
+import stat
+import tempfile
+import threading
+import time
+
+from unittest.mock import patch
+
+from cement import Controller, ex
+from cement.core.exc import FrameworkError
+from cement.ext.ext_server import forward
+from cement.utils import fs
+from cement.utils.test import TestApp
+
+from pytest import raises
+
+
+class Base(Controller):
+    class Meta:
+        label = "base"
+        arguments = [(["--foo"], dict(dest="foo"))]
+
+    @ex()
+    def cmd1(self):
+        print("foo is %s" % self.app.pargs.foo)
+        self.app.log.warning("warning from cmd1")
+        self.app.render(dict(foo=self.app.pargs.foo))
+
+    @ex()
+    def cwd(self):
+        print(os.getcwd())
+
+    @ex()
+    def fail(self):
+        self.app.exit_code = 3
+
+    @ex()
+    def boom(self):
+        raise Exception("kaboom")
+
+    @ex()
+    def stop(self):
+        self.app.server.stop()
+
+
+class ServerApp(TestApp):
+    class Meta:
+        extensions = ["server", "json"]
+        handlers = [Base]
+        meta_defaults = {"output.json": {"overridable": True}}
+
+
+def test_handle(tmp):
+    with ServerApp() as app:
+        res = app.server.handle(["--foo", "bar", "cmd1"])
+        assert res["exit_code"] == 0
+        assert res["stdout"].startswith("foo is bar\n")
+        assert "warning from cmd1" in res["stderr"]
+
+        # each run starts from a pristine parser, with new arguments
+        res = app.server.handle(["cmd1"])
+        assert res["stdout"].startswith("foo is None\n")
+
+        # handler overrides only last for the run
+        res = app.server.handle(["-o", "json", "--foo", "bar", "cmd1"])
+        assert res["stdout"] == '{"foo": "bar"}'
+        assert app._meta.output_handler == "dummy"
+        res = app.server.handle(["--foo", "bar", "cmd1"])
+        assert res["stdout"] == "foo is bar\n"
+
+        res = app.server.handle(["cwd"], cwd=tmp.dir)
+        assert res["stdout"] == "%s\n" % os.path.realpath(tmp.dir)
+        assert os.getcwd() != os.path.realpath(tmp.dir)
+
+        res = app.server.handle(["fail"])
+        assert res["exit_code"] == 3
+
+        res = app.server.handle(["boom"])
+        assert res["exit_code"] == 1
+        assert "Exception: kaboom" in res["stderr"]
+
+        res = app.server.handle(["--help"])
+        assert res["exit_code"] == 0
+        assert "usage:" in res["stdout"]
+
+        res = app.server.handle(["bogus"])
+        assert res["exit_code"] == 2
+        assert "invalid choice" in res["stderr"]
+
+
+def test_serve(tmp):
+    path = fs.join(tmp.dir, "server.sock")
+
+    with ServerApp() as app:
+        thread = threading.Thread(target=app.server.serve, args=(path,), daemon=True)
+        thread.start()
+        for i in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        res = forward(path, ["--foo", "bar", "cmd1"], stdout=stdout, stderr=stderr)
+        assert res == 0
+        assert stdout.getvalue() == "foo is bar\n"
+        assert "warning from cmd1" in stderr.getvalue()
+
+        assert forward(path, ["fail"], stdout=stdout, stderr=stderr) == 3
+        assert forward(path, ["stop"], stdout=stdout, stderr=stderr) == 0
+
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not os.path.exists(path)
+
+
+def test_serve_socket_dir(tmp):
+    # created private
+    path = fs.join(tmp.dir, "run", "server.sock")
+    with ServerApp() as app:
+        thread = threading.Thread(target=app.server.serve, args=(path,), daemon=True)
+        thread.start()
+        for i in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+
+        assert forward(path, ["stop"], stdout=io.StringIO()) == 0
+        thread.join(5)
+    assert stat.S_IMODE(os.stat(fs.join(tmp.dir, "run")).st_mode) == 0o700
+
+    # writable by other users
+    os.chmod(tmp.dir, 0o777)
+    with ServerApp() as app:
+        with raises(FrameworkError, match="writable by other users"):
+            app.server.serve(fs.join(tmp.dir, "server.sock"))
+
+
+def test_socket_default(tmp, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", tmp.dir)
+    with ServerApp() as app:
+        path = app.config.get("server", "socket")
+        assert path == fs.join(tmp.dir, "%s-server.sock" % app._meta.label)
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    with ServerApp() as app:
+        path = app.config.get("server", "socket")
+        private_dir = fs.join(tempfile.gettempdir(), "cement-%s" % os.getuid())
+        assert os.path.dirname(path) == private_dir
+
+
+def test_forward_not_owned(tmp):
+    path = fs.join(tmp.dir, "server.sock")
+    open(path, "w").close()
+    with patch("os.getuid", return_value=os.getuid() + 1):
+        with raises(PermissionError, match="not owned by the current user"):
+            forward(path, ["cmd1"])
@@ -4,10 +4,20 @@ import time
 from unittest.mock import Mock
 
 from cement.core.exc import FrameworkError
-from cement.ext.ext_watchdog import WatchdogEventHandler
+from cement.ext.ext_watchdog import WatchdogConfigEventHandler, WatchdogEventHandler
 from cement.utils import fs
+from cement.utils.misc import init_defaults
 from cement.utils.test import TestApp, raises
 
+from watchdog.events import (
+    DirModifiedEvent,
+    FileClosedNoWriteEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileOpenedEvent,
+)
+
 
 class MyEventHandler(WatchdogEventHandler):
     def on_any_event(self, event):
@@ -118,3 +128,138 @@ def test_watchdog_hooks(tmp):
 
     # yup, the function was run 6 times (once for each hook)
     assert app.counter == 6
+
+
+def test_watchdog_config(tmp):
+    conf1 = fs.join(tmp.dir, "conf1.conf")
+    conf2 = fs.join(tmp.dir, "conf2.conf")
+    with open(conf1, "w") as f:
+        f.write("[log.logging]\nlevel = info\n[section]\nfoo = 1\nbar = 1\n")
+    with open(conf2, "w") as f:
+        f.write("[section]\nbar = 2\n")
+
+    class MyApp(WatchdogApp):
+        class Meta:
+            config_files = [conf1, conf2]
+            watchdog_config = True
+
+    changed = []
+    with MyApp() as app:
+        app.hook.register(
+            "config_changed", lambda app, changes: changed.append(changes)
+        )
+        assert app.watchdog.is_config_file(conf1)
+        assert not app.watchdog.is_config_file(fs.join(tmp.dir, "bogus.conf"))
+        assert app.config.get("section", "bar") == "2"
+
+        # bar is overridden by conf2, which has precedence
+        with open(conf1, "w") as f:
+            f.write("[log.logging]\nlevel = debug\n[section]\nfoo = 3\nbar = 3\n")
+        res = app.watchdog.reload_config(conf1)
+        assert res == {"log.logging": ["level"], "section": ["foo"]}
+        assert changed == [res]
+        assert app.config.get("section", "foo") == "3"
+        assert app.config.get("section", "bar") == "2"
+        assert app.log.get_level() == "DEBUG"
+
+        # removed settings revert to the earlier config file
+        os.remove(conf2)
+        assert app.watchdog.reload_config(conf2) == {"section": ["bar"]}
+        assert app.config.get("section", "bar") == "3"
+
+        # unchanged files don't run the hook
+        assert app.watchdog.reload_config(conf1) == {}
+        assert len(changed) == 2
+
+        with raises(FrameworkError, match="is not watched"):
+            app.watchdog.reload_config(fs.join(tmp.dir, "bogus.conf"))
+
+
+def test_watchdog_config_event_handler(tmp):
+    class MyApp(WatchdogApp):
+        class Meta:
+            config_files = [tmp.file]
+            watchdog_config = True
+
+    with MyApp() as app:
+        app.watchdog.reload_config = Mock()
+        handler = WatchdogConfigEventHandler(app)
+
+        handler.dispatch(DirModifiedEvent(tmp.dir))
+        handler.dispatch(FileModifiedEvent(tmp.file + ".swp"))
+        assert not app.watchdog.reload_config.called
+
+        # reading the file (i.e. when reloading it) is not a change
+        handler.dispatch(FileOpenedEvent(tmp.file))
+        handler.dispatch(FileClosedNoWriteEvent(tmp.file))
+        assert not app.watchdog.reload_config.called
+
+        handler.dispatch(FileModifiedEvent(tmp.file))
+        app.watchdog.reload_config.assert_called_once_with(tmp.file)
+
+        # i.e. moved into place by an editor
+        app.watchdog.reload_config.reset_mock()
+        handler.dispatch(FileMovedEvent(tmp.file + "~", tmp.file))
+        app.watchdog.reload_config.assert_called_once_with(tmp.file)
+
+        app.watchdog.reload_config.reset_mock()
+        handler.dispatch(FileCreatedEvent(tmp.file))
+        app.watchdog.reload_config.assert_called_once_with(tmp.file)
+
+
+def test_watchdog_config_reload_once(tmp):
+    conf = fs.join(tmp.dir, "my.conf")
+    with open(conf, "w") as f:
+        f.write("[section]\nfoo = 1\n")
+
+    class MyApp(WatchdogApp):
+        class Meta:
+            config_files = [conf]
+            watchdog_config = True
+
+    reloads = []
+    with MyApp() as app:
+        reload_config = app.watchdog.reload_config
+
+        def counting_reload_config(path):
+            reloads.append(path)
+            return reload_config(path)
+
+        app.watchdog.reload_config = counting_reload_config
+        app.run()
+
+        with open(conf, "w") as f:
+            f.write("[section]\nfoo = 2\n")
+        time.sleep(1)
+        assert app.config.get("section", "foo") == "2"
+
+    # one write is one reload
+    assert reloads == [conf]
+
+
+def test_watchdog_config_removed_defaults(tmp):
+    with open(tmp.file, "w") as f:
+        f.write("[log.logging]\nlevel = debug\n[section]\nfoo = 2\nbar = 2\n")
+
+    defaults = init_defaults("section")
+    defaults["section"]["foo"] = "1"
+
+    class MyApp(WatchdogApp):
+        class Meta:
+            config_defaults = defaults
+            config_files = [tmp.file]
+            watchdog_config = True
+
+    with MyApp() as app:
+        assert app.log.get_level() == "DEBUG"
+
+        # removed settings revert to the app's, or the handler's, defaults
+        with open(tmp.file, "w") as f:
+            f.write("[section]\n")
+        res = app.watchdog.reload_config(tmp.file)
+        assert res == {"log.logging": ["level"], "section": ["foo"]}
+        assert app.config.get("section", "foo") == "1"
+        assert app.log.get_level() == "INFO"
+
+        # without a default the setting is left unchanged
+        assert app.config.get("section", "bar") == "2"
@@ -2,8 +2,9 @@ import os
 
 from unittest.mock import patch
 
+from cement.core.exc import FrameworkError
 from cement.utils import fs
-from cement.utils.test import TestApp
+from cement.utils.test import TestApp, raises
 
 import yaml
 
@@ -52,6 +53,32 @@ def test_parse_file_bad_path():
             assert not pf.called
 
 
+def test_decode_file():
+    with YamlApp(config_files=[CONFIG, CONFIG], config_parse_workers=2) as app:
+        assert app.config._decode_file(CONFIG) == CONFIG_PARSED
+        assert app.config.get_section_dict("section") == CONFIG_PARSED["section"]
+
+
+def test_decode_file_loader(tmp):
+    with YamlApp() as app:
+        assert app.config._decode_file(tmp.file) == {}
+
+        with open(tmp.file, "w") as f:
+            f.write("section:\n  key: !!python/tuple [1, 2]\n")
+        assert app.config._decode_file(tmp.file) == {"section": {"key": (1, 2)}}
+
+        app.config._meta.loader = "SafeLoader"
+        with raises(yaml.constructor.ConstructorError):
+            app.config._decode_file(tmp.file)
+
+
+def test_max_file_size():
+    meta_defaults = {"config.yaml": {"max_file_size": 10}}
+    with raises(FrameworkError, match="exceeding the maximum of 10 bytes"):
+        with YamlApp(meta_defaults=meta_defaults):
+            pass
+
+
 def test_parse_file():
     with YamlApp() as app:
         assert app.config.get("section", "key1") == "ok1"
@@ -109,6 +109,24 @@ def test_minimal_logger_with_arguments(caplog):
         assert caplog.records[2].namespace == "foo"
 
 
+def test_minimal_logger_lazy_arguments(caplog):
+    with patch(
+        "cement.utils.misc.MinimalLogger.logging_is_enabled", new_callable=PropertyMock
+    ) as mock:
+        log = misc.minimal_logger(__name__)
+        mock.return_value = True
+
+        log.info("info test with %s", "test_namespace", args=("arguments",))
+        assert caplog.records[0].namespace == "test_namespace"
+        assert caplog.records[0].msg == "info test with %s"
+        assert caplog.records[0].args == ("arguments",)
+        assert caplog.records[0].message == "info test with arguments"
+
+        # not formatted when not logged
+        log.debug("debug test with %d", args=("not a number",))
+        assert len(caplog.records) == 1
+
+
 def test_wrap_str():
     text = "aaaaa bbbbb ccccc"
     new_text = misc.wrap(text, width=5)